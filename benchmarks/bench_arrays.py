@@ -0,0 +1,58 @@
+"""Compare large numeric list fields checked per element with fields converted to arrays."""
+import argparse
+import gc
+import json
+import random
+import timeit
+import tracemalloc
+from typing import Any, Callable
+
+from fastconfig.internals.type_checker import _array, _compile
+
+
+def retained(parse: Callable[[], Any], convert: Callable[[Any], Any]) -> int:
+    """Return the bytes still allocated by the converted value once the parsed one is freed."""
+    gc.collect()
+    tracemalloc.start()
+    parsed = parse()
+    value = convert(parsed)
+    del parsed
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def main() -> None:
+    """Run the benchmark and print milliseconds and MB per field."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    cases: dict[str, Callable[[Any], Any]] = {
+        "list[float]": _compile(list[float]).validate,
+        "as_array='d'": _array("d").validate,
+    }
+    try:
+        cases["as_array='float64'"] = _array("float64").validate
+    except Exception:
+        print("numpy is not installed, skipping numpy.ndarray")
+
+    for n in (100_000, 1_000_000):
+        text = json.dumps([random.random() for _ in range(n)])
+        values = json.loads(text)
+        print(f"{n} floats")
+        for name, convert in cases.items():
+            seconds = min(
+                timeit.repeat(lambda: convert(values), number=args.number, repeat=3)
+            )
+            size = retained(lambda: json.loads(text), convert)
+            print(
+                f"{name:>20}: {seconds / args.number * 1e3:8.2f} ms,"
+                f" {size / 1e6:6.1f} MB retained"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure the per-build overhead of `FastConfig` on a class with many fields."""
+import argparse
+import timeit
+from dataclasses import make_dataclass
+from typing import Any, Type
+
+from fastconfig.config import FastConfig, _FastConfigBuilder, fc_field
+from fastconfig.internals.plan import _PLANS
+
+
+def make_config_class(n_fields: int) -> Type[FastConfig]:
+    """Return a `FastConfig` subclass with `n_fields` nested int fields."""
+    fields = [
+        (
+            f"f{i}",
+            int,
+            fc_field(key=f"section{i % 10}.group{i % 7}.f{i}", default=0),
+        )
+        for i in range(n_fields)
+    ]
+    return make_dataclass(f"Config{n_fields}", fields, bases=(FastConfig,))
+
+
+def make_setting(n_fields: int) -> dict[str, Any]:
+    """Return a document providing every field of `make_config_class(n_fields)`."""
+    setting: dict[str, Any] = {}
+    for i in range(n_fields):
+        group = setting.setdefault(f"section{i % 10}", {}).setdefault(
+            f"group{i % 7}", {}
+        )
+        group[f"f{i}"] = i
+    return setting
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per build."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=120)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    cls = make_config_class(args.fields)
+    setting = make_setting(args.fields)
+    config = _FastConfigBuilder._make(cls, setting)
+
+    def cold_make() -> None:
+        # compile the build plan again on every call, as every build did before
+        _PLANS.pop(cls, None)
+        _FastConfigBuilder._make(cls, setting)
+
+    def lazy_make() -> None:
+        # a process reading only a few fields of a big config
+        lazy = _FastConfigBuilder._make_lazy(cls, setting)
+        lazy.f0, lazy.f1, lazy.f2
+
+    cases = {
+        "cold make": cold_make,
+        "make": lambda: _FastConfigBuilder._make(cls, setting),
+        "lazy make": lazy_make,
+        "update": lambda: _FastConfigBuilder._update(config, setting),
+        "to_dict": lambda: config.to_dict(),
+    }
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(
+            f"{name:>10}: {best / args.number * 1e6:9.2f} us/op ({args.fields} fields)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare a serial `build` loop with `FastConfig.build_many` on many small files."""
+import argparse
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastconfig import FastConfig, fc_field
+
+
+@dataclass
+class Tenant(FastConfig):
+    """A per-tenant config."""
+
+    name: str = fc_field(key="tenant.name")
+    replicas: int = fc_field(key="tenant.replicas", default=1)
+    hosts: list[str] = fc_field(key="tenant.hosts", default_factory=list)
+    limits: dict[str, int] = fc_field(key="tenant.limits", default_factory=dict)
+
+
+def write_files(directory: Path, n_files: int) -> list[Path]:
+    """Write `n_files` tenant configs to `directory`."""
+    paths: list[Path] = []
+    for i in range(n_files):
+        path = directory / f"tenant{i}.toml"
+        hosts = ", ".join(f'"host{j}.tenant{i}.example.com"' for j in range(20))
+        limits = "\n".join(f"limit{j} = {j * i}" for j in range(50))
+        path.write_text(
+            f'[tenant]\nname = "tenant{i}"\nreplicas = {i % 5}\nhosts = [{hosts}]\n'
+            f"[tenant.limits]\n{limits}\n"
+        )
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    """Run the benchmark and print the wall time of each strategy."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_files(Path(tmp), args.files)
+
+        started = time.perf_counter()
+        for path in paths:
+            Tenant.build(path)
+        print(
+            f"{'serial':>10}: {time.perf_counter() - started:8.3f} s ({args.files} files)"
+        )
+
+        for executor in ("thread", "process"):
+            started = time.perf_counter()
+            results = list(
+                Tenant.build_many(paths, workers=args.workers, executor=executor)
+            )
+            assert all(result.ok for result in results)
+            print(
+                f"{executor:>10}: {time.perf_counter() - started:8.3f} s ({args.files} files)"
+            )
+
+
+if __name__ == "__main__":
+    main()
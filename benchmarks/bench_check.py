@@ -0,0 +1,44 @@
+"""Compare a serial `build` loop with `fastconfig check` on many files, cold and cached."""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_build_many import Tenant, write_files
+from fastconfig.cli import check
+
+
+def main() -> None:
+    """Run the benchmark and print the wall time of each strategy."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    target = "benchmarks.bench_build_many:Tenant"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_files(Path(tmp), args.files)
+        pattern = os.path.join(tmp, "*.toml")
+        cache = os.path.join(tmp, "cache.json")
+
+        started = time.perf_counter()
+        for path in sorted(Path(tmp).glob("*.toml")):
+            Tenant.build(path)
+        print(f"{'serial build':>14}: {time.perf_counter() - started:8.3f} s")
+
+        cases = {
+            "check, 1 proc": dict(workers=1, cache=None),
+            "check": dict(workers=args.workers, cache=None),
+            "check, cold": dict(workers=args.workers, cache=cache),
+            "check, cached": dict(workers=args.workers, cache=cache),
+        }
+        for name, kwargs in cases.items():
+            started = time.perf_counter()
+            report = check(target, [pattern], **kwargs)
+            assert report["summary"]["failed"] == 0
+            print(f"{name:>14}: {time.perf_counter() - started:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
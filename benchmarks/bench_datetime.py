@@ -0,0 +1,56 @@
+"""Measure `_TypeChecker` on `list[datetime]` values in several string layouts."""
+import argparse
+import timeit
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from fastconfig.exception import UnexpectedValueError
+from fastconfig.internals.type_checker import _TypeChecker
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+LAYOUTS: dict[str, Callable[[datetime], str]] = {
+    "offset": lambda d: d.isoformat(),
+    "Z": lambda d: d.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    "millis Z": lambda d: d.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
+    "date": lambda d: d.strftime("%Y-%m-%d"),
+}
+
+
+def main() -> None:
+    """Run the benchmark and print milliseconds per check."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    n: int = args.size
+    checker = _TypeChecker()
+    for layout, format in LAYOUTS.items():
+        cases: dict[str, list[str]] = {
+            # every timestamp differs, e.g. an event log
+            "unique": [format(START + timedelta(seconds=i)) for i in range(n)],
+            # a few timestamps repeated, e.g. schedules
+            "repeated": [format(START + timedelta(hours=i % 24)) for i in range(n)],
+        }
+        for name, value in cases.items():
+            try:
+                checker("bench", value, list[datetime])
+            except UnexpectedValueError:
+                # e.g. `Z` by `datetime.fromisoformat` before Python 3.11
+                print(f"{layout:>9} {name:>8}: rejected")
+                continue
+            best = min(
+                timeit.repeat(
+                    lambda: checker("bench", value, list[datetime]),
+                    number=args.number,
+                    repeat=3,
+                )
+            )
+            print(
+                f"{layout:>9} {name:>8}: {best / args.number * 1e3:9.3f} ms/check ({n} elements)"
+            )
+
+
+if __name__ == "__main__":
+    main()
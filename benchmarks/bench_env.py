@@ -0,0 +1,46 @@
+"""Measure environment variable overlays against the size of the environment."""
+import argparse
+import json
+import os
+import tempfile
+import timeit
+from unittest import mock
+
+from benchmarks.bench_build import make_config_class, make_setting
+from fastconfig.internals.env import _EnvIndex
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per build."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=120)
+    parser.add_argument("--overrides", type=int, default=5)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    cls = make_config_class(args.fields)
+    index = _EnvIndex.of(cls, "APP_")
+    overrides = {name: "1" for name in list(index.names)[: args.overrides]}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "config.json")
+        with open(path, "w") as f:
+            json.dump(make_setting(args.fields), f)
+        for size in (0, 100, 1000, 10000):
+            unrelated = {f"UNRELATED_{i}": "x" * 20 for i in range(size)}
+            with mock.patch.dict(os.environ, {**unrelated, **overrides}, clear=True):
+                cases = {
+                    "build": lambda: cls.build(path),
+                    "env_prefix": lambda: cls.build(path, env_prefix="APP_"),
+                    "read": index.read,
+                }
+                for name, case in cases.items():
+                    seconds = min(timeit.repeat(case, number=args.number, repeat=3))
+                    print(
+                        f"{size:>6} variables {name:>10}:"
+                        f" {seconds / args.number * 1e6:9.1f} us"
+                    )
+
+
+if __name__ == "__main__":
+    main()
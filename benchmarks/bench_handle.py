@@ -0,0 +1,52 @@
+"""Compare reloads of a config with one changed field: in place, deep copy, copy-on-write."""
+import argparse
+import copy
+import itertools
+import timeit
+
+from benchmarks.bench_build import make_config_class, make_setting
+from fastconfig.config import _FastConfigBuilder
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per reload."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=120)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    cls = make_config_class(args.fields)
+    setting = make_setting(args.fields)
+    # a document parsed again, with one changed value
+    changed = copy.deepcopy(setting)
+    changed["section0"]["group0"]["f0"] = -1
+    documents = itertools.cycle([setting, changed])
+    config = _FastConfigBuilder._make(cls, setting)
+
+    def in_place() -> None:
+        # readers may see a partial update
+        _FastConfigBuilder._update(config, next(documents))
+
+    def deep_copy() -> None:
+        # the workaround: update a private copy, then swap it
+        _FastConfigBuilder._update(copy.deepcopy(config), next(documents))
+
+    state = [config, setting]
+
+    def copy_on_write() -> None:
+        document = next(documents)
+        state[0], _ = _FastConfigBuilder._replace(state[0], document, state[1])
+        state[1] = document
+
+    cases = {
+        "update in place": in_place,
+        "deepcopy + update": deep_copy,
+        "copy-on-write": copy_on_write,
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=args.number, repeat=3))
+        print(f"{name:>18}: {seconds / args.number * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measure the time to import the package, and parts of it, in a new interpreter."""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# the statements measured and the milliseconds they are expected to take at most
+STATEMENTS: dict[str, float] = {
+    "import fastconfig": 15,
+    "from fastconfig import find_project_root, search": 60,
+    "from fastconfig import FastConfig": 150,
+}
+
+
+def import_time(statement: str) -> int:
+    """Return the microseconds spent importing modules for `statement`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    total: int = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # only the top level imports, which include those they trigger
+        if not name.startswith("  "):
+            total += int(cumulative)
+    return total
+
+
+def main() -> None:
+    """Run the benchmark and print milliseconds per import, beyond the interpreter startup."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    # the interpreter startup imports modules too
+    startup = min(import_time("pass") for _ in range(args.repeat))
+    over = False
+    for statement, budget in STATEMENTS.items():
+        best = min(import_time(statement) for _ in range(args.repeat)) - startup
+        status = "ok" if best / 1e3 <= budget else "over budget"
+        over = over or best / 1e3 > budget
+        print(f"{statement:>50}: {best / 1e3:7.1f} ms (budget {budget} ms, {status})")
+    sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
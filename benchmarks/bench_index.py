@@ -0,0 +1,74 @@
+"""Measure builds of a class with many fields under deep shared key prefixes."""
+import argparse
+import timeit
+from dataclasses import make_dataclass
+from typing import Any, Type
+
+from fastconfig.config import FastConfig, _FastConfigBuilder, fc_field
+from fastconfig.internals.validator import _SettingIndex
+
+
+def make_deep_class(n_fields: int, name: str = "Deep") -> Type[FastConfig]:
+    """Return a `FastConfig` subclass of `n_fields` ints under `db.primary.poolN.groupN`."""
+    return make_dataclass(
+        f"{name}{n_fields}",
+        [
+            (
+                f"f{i}",
+                int,
+                fc_field(key=f"db.primary.pool{i % 4}.group{i % 10}.f{i}", default=0),
+            )
+            for i in range(n_fields)
+        ],
+        bases=(FastConfig,),
+    )
+
+
+def make_deep_setting(n_fields: int) -> dict[str, Any]:
+    """Return a document providing every field of `make_deep_class(n_fields)`."""
+    setting: dict[str, Any] = {}
+    for i in range(n_fields):
+        node = setting
+        for key in ("db", "primary", f"pool{i % 4}", f"group{i % 10}"):
+            node = node.setdefault(key, {})
+        node[f"f{i}"] = i
+    return setting
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per build."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=1000)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    cls = make_deep_class(args.fields)
+    other = make_deep_class(args.fields, "Other")
+    setting = make_deep_setting(args.fields)
+    config = _FastConfigBuilder._make(cls, setting)
+
+    def two_classes() -> None:
+        # e.g. the settings of several components read from the same document
+        _FastConfigBuilder._make(cls, setting)
+        _FastConfigBuilder._make(other, setting)
+
+    def two_classes_shared() -> None:
+        index = _SettingIndex(setting)
+        _FastConfigBuilder._make(cls, setting, index=index)
+        _FastConfigBuilder._make(other, setting, index=index)
+
+    cases = {
+        "make": lambda: _FastConfigBuilder._make(cls, setting),
+        "update": lambda: _FastConfigBuilder._update(config, setting),
+        "make 2 classes": two_classes,
+        "shared index": two_classes_shared,
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=args.number, repeat=5))
+        print(
+            f"{name:>16}: {seconds / args.number * 1e6:9.1f} us ({args.fields} fields)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Compare the parse throughput of the available loader backends."""
+import argparse
+import json
+import time
+from typing import Any
+
+from fastconfig.internals.loader import _CANDIDATES, _FileLoader
+
+
+def make_document(size: int) -> dict[str, Any]:
+    """Return a document of roughly `size` bytes once serialized."""
+    document: dict[str, Any] = {}
+    i: int = 0
+    written: int = 0
+    while written < size:
+        section = {
+            "name": f"service{i}",
+            "enabled": i % 2 == 0,
+            "port": 1024 + i,
+            "ratio": i / 7,
+            "hosts": [f"host{j}.example.com" for j in range(8)],
+            "limits": {f"limit{j}": j * i for j in range(8)},
+        }
+        document[f"section{i}"] = section
+        written += len(json.dumps(section)) + 40
+        i += 1
+    return document
+
+
+def to_toml(document: dict[str, Any]) -> str:
+    """Serialize the document made by `make_document`."""
+    lines: list[str] = []
+    for name, section in document.items():
+        lines.append(f"[{name}]")
+        for key, value in section.items():
+            if not isinstance(value, dict):
+                lines.append(f"{key} = {json.dumps(value)}")
+        lines.append(f"[{name}.limits]")
+        lines.extend(f"{key} = {value}" for key, value in section["limits"].items())
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run the benchmark and print MB/s for each backend and size."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 50], help="MB")
+    args = parser.parse_args()
+
+    loader = _FileLoader()
+    for megabytes in args.sizes:
+        document = make_document(megabytes * 1024 * 1024)
+        payloads = {
+            ".json": json.dumps(document).encode(),
+            ".toml": to_toml(document).encode(),
+        }
+        for extension, data in payloads.items():
+            for candidate in _CANDIDATES[extension]:
+                try:
+                    backend = candidate()
+                except ImportError:
+                    print(f"{extension:>6} {candidate.__name__[1:]:>8}: not installed")
+                    continue
+                started = time.perf_counter()
+                loader.parse(data, backend)
+                elapsed = time.perf_counter() - started
+                print(
+                    f"{extension:>6} {backend.name:>8}: {len(data) / elapsed / 1e6:8.1f} MB/s"
+                    f" ({len(data) / 1e6:.1f} MB in {elapsed:.3f} s)"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Measure the memory of many small config instances, with and without `__slots__`."""
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Type
+
+from fastconfig.config import (
+    FastConfig,
+    _FastConfigBuilder,
+    fastconfig_dataclass,
+    fc_field,
+)
+
+
+def make_class(name: str, fields: int, decorator: Callable[[Any], Any]) -> Type[Any]:
+    """Return a `FastConfig` subclass of `fields` int fields, decorated by `decorator`."""
+    namespace: dict[str, Any] = {
+        "__annotations__": {f"f{i}": int for i in range(fields)},
+        **{f"f{i}": fc_field(key=f"tenant.f{i}", default=0) for i in range(fields)},
+    }
+    return decorator(type(name, (FastConfig,), namespace))
+
+
+def measure(cls: Type[Any], setting: dict[str, Any], number: int) -> float:
+    """Return the bytes allocated per instance built from `setting`."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    instances = [_FastConfigBuilder._make(cls, setting) for _ in range(number)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return (after - before) / number
+
+
+def main() -> None:
+    """Run the benchmark and print bytes per instance."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=10)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    # small ints are shared, so only the instances are counted
+    setting = {"tenant": {f"f{i}": i for i in range(args.fields)}}
+    classes = {
+        "FastConfig": make_class("Regular", args.fields, dataclass),
+        "fastconfig_dataclass": make_class(
+            "Slotted", args.fields, fastconfig_dataclass
+        ),
+    }
+    for name, cls in classes.items():
+        per_instance = measure(cls, setting, args.number)
+        print(
+            f"{name:>20}: {per_instance:7.1f} bytes/instance"
+            f" ({per_instance * args.number / 1e6:.1f} MB for {args.number})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Measure reloads of a config made of nested sections when one section changed."""
+import argparse
+import copy
+import itertools
+import timeit
+from dataclasses import make_dataclass
+from typing import Any, Type
+
+from fastconfig.config import FastConfig, _FastConfigBuilder, fc_field
+
+
+def make_nested_class(sections: int, fields: int) -> Type[FastConfig]:
+    """Return a `FastConfig` subclass of `sections` dataclass sections of `fields` ints."""
+    section = make_dataclass(
+        "Section", [(f"f{i}", int, fc_field(default=0)) for i in range(fields)]
+    )
+    return make_dataclass(
+        f"Nested{sections}",
+        [(f"s{i}", section, fc_field(key=f"sections.s{i}")) for i in range(sections)],
+        bases=(FastConfig,),
+    )
+
+
+def make_setting(sections: int, fields: int) -> dict[str, Any]:
+    """Return a document providing every section of `make_nested_class`."""
+    return {
+        "sections": {
+            f"s{i}": {f"f{j}": j for j in range(fields)} for i in range(sections)
+        }
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print microseconds per update."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sections", type=int, default=20)
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    cls = make_nested_class(args.sections, args.fields)
+    setting = make_setting(args.sections, args.fields)
+    # a document parsed again, with one changed value
+    changed = copy.deepcopy(setting)
+    changed["sections"]["s0"]["f0"] = -1
+    config = _FastConfigBuilder._make(cls, setting)
+
+    documents = itertools.cycle([setting, changed])
+
+    def rebuild_all() -> None:
+        # every section built again, like `build(path, config)`
+        _FastConfigBuilder._update(config, next(documents))
+
+    state = [config, setting]
+
+    def replace_changed() -> None:
+        # the tables compared with the previous document, like `ConfigHandle.reload`
+        document = next(documents)
+        state[0], _ = _FastConfigBuilder._replace(state[0], document, state[1])
+        state[1] = document
+
+    cases = {
+        "make": lambda: _FastConfigBuilder._make(cls, setting),
+        "update (rebuild all)": rebuild_all,
+        "replace (changed only)": replace_changed,
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=args.number, repeat=3))
+        print(f"{name:>22}: {seconds / args.number * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Compare full and partial builds of a big JSON file binding a few keys."""
+import argparse
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from fastconfig import FastConfig, fc_field
+
+
+@dataclass
+class Flags(FastConfig):
+    """A config binding a handful of keys of a big file."""
+
+    name: str = fc_field(key="service.name", default="")
+    port: int = fc_field(key="service.port", default=0)
+    checkout: bool = fc_field(key="flags.checkout.enabled", default=False)
+    regions: list[str] = fc_field(key="flags.checkout.regions", default_factory=list)
+
+
+def write_document(path: str, size: int, first: bool) -> None:
+    """Write flags and lookup tables of roughly `size` bytes, the flags first if `first`."""
+    flags: str = '"flags": {"checkout": {"enabled": true, "regions": ["eu", "us"]}}'
+    with open(path, "w") as f:
+        f.write('{"service": {"name": "app", "port": 8080}, ')
+        if first:
+            f.write(f"{flags}, ")
+        f.write('"tables": {')
+        written: int = 0
+        i: int = 0
+        while written < size:
+            row = json.dumps(
+                {"id": i, "code": f"code{i}", "weights": [i / 3, i / 7], "on": True}
+            )
+            chunk: str = f'{"," if i else ""}"row{i}": {row}'
+            f.write(chunk)
+            written += len(chunk)
+            i += 1
+        f.write("}" if first else f"}}, {flags}")
+        f.write("}")
+
+
+def measure(path: str, partial: bool) -> tuple[float, int]:
+    """Return the seconds of a build, and the peak of allocated bytes of another one."""
+    started = time.perf_counter()
+    config = Flags.build(path, partial=partial)
+    elapsed = time.perf_counter() - started
+    assert config.regions == ["eu", "us"]
+
+    # traced separately, tracing slows the scan down a lot
+    tracemalloc.start()
+    Flags.build(path, partial=partial)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    """Run the benchmark and print the time and peak memory of each mode."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200, help="MB")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "flags.json")
+        # the keys found last, so the whole file is scanned, then first
+        for first in (False, True):
+            write_document(path, args.size * 1024 * 1024, first)
+            print(
+                f"file: {os.path.getsize(path) / 1e6:.1f} MB, keys {'first' if first else 'last'}"
+            )
+            for partial in (False, True):
+                elapsed, peak = measure(path, partial)
+                mode = "partial" if partial else "full"
+                print(
+                    f"{mode:>8}: {elapsed:7.3f} s, peak {peak / 1e6:8.1f} MB allocated"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare repeated `search` calls with `search_any` on a deep directory tree."""
+import argparse
+import os
+import tempfile
+import timeit
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from fastconfig import searcher
+
+NAMES = ["app.toml", "app.json", ".app.toml"]
+
+
+def make_tree(root: Path, depth: int) -> Path:
+    """Create `depth` nested directories with a few files each, and return the deepest one."""
+    (root / ".git").mkdir()
+    directory = root
+    for i in range(depth):
+        directory = directory / f"level{i}"
+        directory.mkdir()
+        for j in range(5):
+            (directory / f"file{j}.txt").touch()
+    return directory
+
+
+def count_syscalls(func: Callable[[], Any]) -> Counter:
+    """Count the `stat` and `scandir` calls made by `func`."""
+    counter: Counter = Counter()
+    originals = {name: getattr(os, name) for name in ("stat", "lstat", "scandir")}
+
+    def wrap(name: str) -> Callable[..., Any]:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            counter[name] += 1
+            return originals[name](*args, **kwargs)
+
+        return wrapper
+
+    for name in originals:
+        setattr(os, name, wrap(name))
+    try:
+        func()
+    finally:
+        for name, original in originals.items():
+            setattr(os, name, original)
+    return counter
+
+
+def main() -> None:
+    """Run the benchmark and print syscalls and microseconds per lookup."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--depth", type=int, default=30)
+    parser.add_argument("--number", type=int, default=500)
+    args = parser.parse_args()
+
+    searcher.DEPTH = args.depth
+    with tempfile.TemporaryDirectory() as tmp:
+        start = make_tree(Path(tmp), args.depth)
+        (Path(tmp) / ".app.toml").touch()
+
+        def repeated() -> Optional[Path]:
+            for name in NAMES:
+                found = searcher.search(name, start, end_up_the_project_root=True)
+                if found is not None:
+                    return found
+            return None
+
+        cases = {
+            "search x3": repeated,
+            "search_any": lambda: searcher.search_any(NAMES, start),
+            "find_project_root": lambda: searcher.find_project_root(start),
+        }
+        for cached in (False, True):
+            if cached:
+                searcher.enable_search_cache()
+                for func in cases.values():
+                    func()
+            for name, func in cases.items():
+                calls = count_syscalls(func)
+                best = min(timeit.repeat(func, number=args.number, repeat=3))
+                label = f"{name}{' (cached)' if cached else ''}"
+                print(
+                    f"{label:>26}: {best / args.number * 1e6:9.1f} us/lookup, "
+                    f"{dict(calls)} (depth {args.depth})"
+                )
+        searcher.disable_search_cache()
+
+
+if __name__ == "__main__":
+    main()
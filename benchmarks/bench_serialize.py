@@ -0,0 +1,37 @@
+"""Measure `to_dict`, `to_json` and `to_toml` throughput on a class with many fields."""
+import argparse
+import io
+import json
+import timeit
+
+from benchmarks.bench_build import make_config_class, make_setting
+from fastconfig.config import _FastConfigBuilder
+
+
+def main() -> None:
+    """Run the benchmark and print calls per second."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=120)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    cls = make_config_class(args.fields)
+    config = _FastConfigBuilder._make(cls, make_setting(args.fields))
+
+    cases = {
+        "to_dict": config.to_dict,
+        "json.dumps(to_dict)": lambda: json.dumps(config.to_dict()),
+        "to_json": config.to_json,
+        "to_json (stream)": lambda: config.to_json(io.StringIO()),
+        "to_toml": config.to_toml,
+    }
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=args.number, repeat=5))
+        print(
+            f"{name:>20}: {best / args.number * 1e6:9.1f} us/call, "
+            f"{args.number / best:9.0f} calls/s ({args.fields} fields)"
+        )
+
+
+if __name__ == "__main__":
+    main()
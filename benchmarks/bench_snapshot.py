@@ -0,0 +1,45 @@
+"""Compare builds from a file with builds from a snapshot of the validated values."""
+import argparse
+import json
+import os
+import tempfile
+import timeit
+
+from benchmarks.bench_build import make_config_class, make_setting
+
+
+def main() -> None:
+    """Run the benchmark and print milliseconds per build."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fields", type=int, default=120)
+    parser.add_argument("--padding", type=int, default=1, help="MB of unused keys")
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    cls = make_config_class(args.fields)
+    setting = make_setting(args.fields)
+    row_size: int = len(json.dumps({"key": 0, "value": "value0"})) + 2
+    setting["unused"] = [
+        {"key": i, "value": f"value{i}"}
+        for i in range(args.padding * 1024 * 1024 // row_size)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "config.json")
+        with open(path, "w") as f:
+            json.dump(setting, f)
+        snapshots = os.path.join(tmp, "snapshots")
+        cls.build(path, snapshot_dir=snapshots)
+
+        print(f"file: {os.path.getsize(path) / 1e6:.1f} MB, {args.fields} fields")
+        cases = {
+            "build": lambda: cls.build(path),
+            "snapshot": lambda: cls.build(path, snapshot_dir=snapshots),
+        }
+        for name, case in cases.items():
+            seconds = min(timeit.repeat(case, number=args.number, repeat=3))
+            print(f"{name:>14}: {seconds / args.number * 1e3:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Measure `_TypeChecker` on large container values."""
+import argparse
+import timeit
+from typing import Any, Optional, Union
+
+from fastconfig.internals.type_checker import _TypeChecker
+
+
+def main() -> None:
+    """Run the benchmark and print milliseconds per check."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    n: int = args.size
+    cases: list[tuple[str, Any, Any]] = [
+        ("list[int]", list(range(n)), list[int]),
+        ("list[float]", [float(i) for i in range(n)], list[float]),
+        ("list[str]", [str(i) for i in range(n)], list[str]),
+        ("list[Optional[int]]", [i if i % 2 else None for i in range(n)], list[Optional[int]]),  # type: ignore
+        ("list[Union[int, str]]", [i if i % 2 else str(i) for i in range(n)], list[Union[int, str]]),  # type: ignore
+        (
+            "dict[str, list[str]]",
+            {str(i): [str(j) for j in range(10)] for i in range(n // 10)},
+            dict[str, list[str]],
+        ),
+    ]
+    checker = _TypeChecker()
+    for name, value, typeinfo in cases:
+        best = min(
+            timeit.repeat(
+                lambda: checker("bench", value, typeinfo),
+                number=args.number,
+                repeat=3,
+            )
+        )
+        print(f"{name:>22}: {best / args.number * 1e3:9.3f} ms/check ({n} elements)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+Run the benchmark suite on synthetic workloads and write the results as JSON.
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.2
+
+With `--compare`, every case slower than the baseline by more than the threshold is reported,
+and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from dataclasses import make_dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional, Type
+
+from fastconfig import FastConfig, fc_field, searcher
+from fastconfig.version import VERSION
+
+Case = Callable[[], Any]
+
+NAMES = ["app.toml", "app.json", ".app.toml"]
+
+
+def make_class(name: str, fields: list[tuple[str, Any, str]]) -> Type[FastConfig]:
+    """Return a `FastConfig` subclass from (name, type, key) triples."""
+    return make_dataclass(
+        name,
+        [(field, hint, fc_field(key=key)) for field, hint, key in fields],
+        bases=(FastConfig,),
+    )
+
+
+def put(document: dict[str, Any], key: str, value: Any) -> None:
+    """Set `value` at the dotted `key` of `document`."""
+    *sections, last = key.split(".")
+    for section in sections:
+        document = document.setdefault(section, {})
+    document[last] = value
+
+
+def workloads(size: int) -> dict[str, tuple[Type[FastConfig], dict[str, Any]]]:
+    """Return the classes to build and their documents, scaled by `size`."""
+    result: dict[str, tuple[Type[FastConfig], dict[str, Any]]] = {}
+
+    for n in (10, 100, 1000):
+        fields = [
+            (f"f{i}", int, f"section{i % 10}.group{i % 7}.f{i}") for i in range(n)
+        ]
+        result[f"{n} fields"] = (make_class(f"Fields{n}", fields), {})
+
+    # 100 fields 12 tables deep
+    deep = [
+        (f"f{i}", str, ".".join(f"level{j}" for j in range(12)) + f".f{i}")
+        for i in range(100)
+    ]
+    result["deep keys"] = (make_class("DeepKeys", deep), {})
+
+    result["large list"] = (
+        make_class("LargeList", [("values", list[int], "values")]),
+        {"values": list(range(size))},
+    )
+    result["large dict"] = (
+        make_class("LargeDict", [("table", dict[str, list[str]], "table")]),
+        {
+            "table": {
+                f"key{i}": [f"value{j}" for j in range(10)] for i in range(size // 10)
+            }
+        },
+    )
+
+    start = datetime(2023, 1, 1, tzinfo=timezone(timedelta(hours=9)))
+    dates = [(f"d{i}", datetime, f"dates.d{i}") for i in range(100)]
+    result["datetimes"] = (make_class("Datetimes", dates), {})
+
+    # fill in the documents of the classes whose values follow from the keys
+    for name, (cls, document) in result.items():
+        if document:
+            continue
+        for i, (field, hint, key) in enumerate(
+            (f.name, f.type, f.metadata["key"])
+            for f in cls.__dataclass_fields__.values()
+        ):
+            if hint is int:
+                value: Any = i
+            elif hint is str:
+                value = f"value{i}"
+            else:
+                value = (start + timedelta(minutes=i)).isoformat()
+            put(document, key, value)
+    return result
+
+
+def make_tree(root: Path, depth: int) -> Path:
+    """Create `depth` nested directories with a few files each, and return the deepest one."""
+    (root / ".git").mkdir(parents=True)
+    (root / ".app.toml").touch()
+    directory = root
+    for i in range(depth):
+        directory = directory / f"level{i}"
+        directory.mkdir()
+        for j in range(5):
+            (directory / f"file{j}.txt").touch()
+    return directory
+
+
+def build_cases(tmp: Path, size: int) -> dict[str, Case]:
+    """Return the build, update and to_dict cases."""
+    cases: dict[str, Case] = {}
+    for name, (cls, document) in workloads(size).items():
+        path = tmp / f"{name.replace(' ', '_')}.json"
+        path.write_text(json.dumps(document))
+        config = cls.build(path)
+        cases[f"build/{name}"] = lambda cls=cls, path=path: cls.build(path)
+        cases[f"update/{name}"] = lambda cls=cls, path=path, config=config: cls.build(
+            path, config
+        )
+        cases[f"to_dict/{name}"] = config.to_dict
+    return cases
+
+
+def search_cases(tmp: Path) -> dict[str, Case]:
+    """Return the cases of every search function from several depths."""
+    cases: dict[str, Case] = {}
+    for depth in (1, 10, 50):
+        start = make_tree(tmp / f"tree{depth}", depth)
+        cases[f"search/depth {depth}"] = lambda start=start: searcher.search(
+            ".app.toml", start
+        )
+        cases[f"search_any/depth {depth}"] = lambda start=start: searcher.search_any(
+            NAMES, start
+        )
+        cases[f"search_all/depth {depth}"] = lambda start=start: searcher.search_all(
+            NAMES, start
+        )
+        cases[
+            f"find_project_root/depth {depth}"
+        ] = lambda start=start: searcher.find_project_root(start)
+        cases[
+            f"is_project_root/depth {depth}"
+        ] = lambda start=start: searcher.is_project_root(start)
+    return cases
+
+
+def measure(case: Case, repeat: int, min_time: float) -> dict[str, Any]:
+    """Return the best and median seconds per call of `case`."""
+    timer = timeit.Timer(case)
+    number: int = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    times = [t / number for t in timer.repeat(repeat, number)]
+    return {"min": min(times), "median": statistics.median(times), "number": number}
+
+
+def compare(
+    results: dict[str, dict[str, Any]], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """Return a line for each case slower than the baseline by more than `threshold`."""
+    regressions: list[str] = []
+    for name, result in results.items():
+        before: Optional[dict[str, Any]] = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio: float = result["min"] / before["min"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                f"{name}: {before['min'] * 1e6:.1f} us -> {result['min'] * 1e6:.1f} us"
+                f" ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> None:
+    """Run the suite, print the results and write or compare them."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="a JSON file written by a previous run")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--filter", default="", help="run only cases containing this")
+    parser.add_argument("--size", type=int, default=100_000, help="large values")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds")
+    args = parser.parse_args()
+
+    baseline: Optional[dict[str, Any]] = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    depth: int = searcher.DEPTH
+    searcher.DEPTH = 64
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            cases = {**build_cases(Path(tmp), args.size), **search_cases(Path(tmp))}
+            for name, case in cases.items():
+                if args.filter not in name:
+                    continue
+                results[name] = measure(case, args.repeat, args.min_time)
+                print(
+                    f"{name:>30}: {results[name]['min'] * 1e6:12.1f} us"
+                    f" (median {results[name]['median'] * 1e6:.1f} us)",
+                    flush=True,
+                )
+    finally:
+        searcher.DEPTH = depth
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(
+                {
+                    "version": VERSION,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "cpus": os.cpu_count(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"regression: {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
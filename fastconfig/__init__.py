@@ -1,25 +1,140 @@
 """This package provides public modules."""
+import importlib
 
-
-from fastconfig.config import FastConfig, fc_field
-from fastconfig.exception import (
-    FastConfigError,
-    InvalidConfigError,
-    MissingRequiredElementError,
-    UnexpectedValueError,
-)
-from fastconfig.searcher import find_project_root, is_project_root, search
 from fastconfig.version import VERSION
 
+# `typing` alone takes longer to import than this package
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from fastconfig.cache import (
+        CacheInfo,
+        disable_parse_cache,
+        enable_parse_cache,
+        invalidate_parse_cache,
+        parse_cache_info,
+    )
+    from fastconfig.config import (
+        BuildResult,
+        FastConfig,
+        fastconfig_dataclass,
+        fc_field,
+    )
+    from fastconfig.exception import (
+        FastConfigError,
+        InvalidConfigError,
+        MissingRequiredElementError,
+        UnexpectedValueError,
+    )
+    from fastconfig.handle import ConfigHandle
+    from fastconfig.instrument import (
+        BuildStats,
+        OpenTelemetryObserver,
+        add_build_observer,
+        record_builds,
+        remove_build_observer,
+    )
+    from fastconfig.internals.loader import register_backend
+    from fastconfig.searcher import (
+        afind_project_root,
+        asearch,
+        clear_search_cache,
+        disable_search_cache,
+        enable_search_cache,
+        find_project_root,
+        is_project_root,
+        search,
+        search_all,
+        search_any,
+    )
+    from fastconfig.watcher import Watcher
+# not a public name of the package
+del TYPE_CHECKING
+
+# the module defining each public name, imported on first access,
+# so that e.g. `search` does not load the parsers and the type checker
+_MODULES: dict[str, str] = {
+    "BuildResult": "fastconfig.config",
+    "BuildStats": "fastconfig.instrument",
+    "CacheInfo": "fastconfig.cache",
+    "ConfigHandle": "fastconfig.handle",
+    "disable_parse_cache": "fastconfig.cache",
+    "enable_parse_cache": "fastconfig.cache",
+    "invalidate_parse_cache": "fastconfig.cache",
+    "parse_cache_info": "fastconfig.cache",
+    "register_backend": "fastconfig.internals.loader",
+    "add_build_observer": "fastconfig.instrument",
+    "remove_build_observer": "fastconfig.instrument",
+    "record_builds": "fastconfig.instrument",
+    "OpenTelemetryObserver": "fastconfig.instrument",
+    "fc_field": "fastconfig.config",
+    "fastconfig_dataclass": "fastconfig.config",
+    "FastConfig": "fastconfig.config",
+    "FastConfigError": "fastconfig.exception",
+    "InvalidConfigError": "fastconfig.exception",
+    "MissingRequiredElementError": "fastconfig.exception",
+    "UnexpectedValueError": "fastconfig.exception",
+    "afind_project_root": "fastconfig.searcher",
+    "asearch": "fastconfig.searcher",
+    "clear_search_cache": "fastconfig.searcher",
+    "disable_search_cache": "fastconfig.searcher",
+    "enable_search_cache": "fastconfig.searcher",
+    "find_project_root": "fastconfig.searcher",
+    "is_project_root": "fastconfig.searcher",
+    "search": "fastconfig.searcher",
+    "search_all": "fastconfig.searcher",
+    "search_any": "fastconfig.searcher",
+    "Watcher": "fastconfig.watcher",
+}
+
+
+def __getattr__(name: str) -> "Any":
+    """Import the module defining a public name on first access."""
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: "Any" = getattr(importlib.import_module(_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the public names, including those which are not imported yet."""
+    return sorted(set(globals()) | set(_MODULES))
+
+
 __version__ = VERSION
+# a literal, so that linters treat the imports above as re-exports
 __all__ = [
+    "BuildResult",
+    "BuildStats",
+    "CacheInfo",
+    "ConfigHandle",
+    "disable_parse_cache",
+    "enable_parse_cache",
+    "invalidate_parse_cache",
+    "parse_cache_info",
+    "register_backend",
+    "add_build_observer",
+    "remove_build_observer",
+    "record_builds",
+    "OpenTelemetryObserver",
     "fc_field",
+    "fastconfig_dataclass",
     "FastConfig",
     "FastConfigError",
     "InvalidConfigError",
     "MissingRequiredElementError",
     "UnexpectedValueError",
+    "afind_project_root",
+    "asearch",
+    "clear_search_cache",
+    "disable_search_cache",
+    "enable_search_cache",
     "find_project_root",
     "is_project_root",
     "search",
+    "search_all",
+    "search_any",
+    "Watcher",
 ]
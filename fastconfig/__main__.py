@@ -0,0 +1,7 @@
+"""Run the command line interface, e.g. `python -m fastconfig check myapp.config:Config config/*.toml`."""
+import sys
+
+from fastconfig.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""This module provides the parsed-document cache used when reading config files."""
+from pathlib import Path
+from typing import Optional, Union
+
+from fastconfig.internals import loader
+from fastconfig.internals.loader import CacheInfo, _ParseCache
+
+__all__ = [
+    "CacheInfo",
+    "enable_parse_cache",
+    "disable_parse_cache",
+    "invalidate_parse_cache",
+    "parse_cache_info",
+]
+
+
+def enable_parse_cache(
+    max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024
+) -> None:
+    """
+    Enable the process-wide cache of parsed config files.
+
+    Entries are keyed on the real path, modification time, size and parser of the file,
+    so a modified file is parsed again. Every caller receives its own copy of the document.
+    Calling this again replaces the current cache with an empty one.
+
+    Args:
+        max_entries (int):
+            The maximum number of documents to keep, the least recently used is evicted first
+        max_bytes (int):
+            The maximum total size of the cached source files in bytes
+    """
+    loader._PARSE_CACHE = _ParseCache(max_entries, max_bytes)
+
+
+def disable_parse_cache() -> None:
+    """Disable the parsed-document cache and drop every entry."""
+    loader._PARSE_CACHE = None
+
+
+def invalidate_parse_cache(path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Drop cached documents.
+
+    Args:
+        path (Optional[Union[str, Path]]):
+            The file whose documents are dropped. If nothing is passed, every entry is dropped
+    """
+    cache: Optional[_ParseCache] = loader._PARSE_CACHE
+    if cache is not None:
+        cache.invalidate(None if path is None else str(path))
+
+
+def parse_cache_info() -> Optional[CacheInfo]:
+    """
+    Return the statistics of the parsed-document cache.
+
+    Returns:
+        Optional[CacheInfo]: hit/miss counters and sizes, or None if the cache is disabled
+    """
+    cache: Optional[_ParseCache] = loader._PARSE_CACHE
+    return None if cache is None else cache.info()
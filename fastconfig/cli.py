@@ -0,0 +1,269 @@
+"""
+This module provides the command line interface of fastconfig.
+
+    python -m fastconfig check myapp.config:Config "config/**/*.toml"
+
+`check` builds every file with the class, and prints a JSON report of every error
+of every file. The exit status is 1 if any file is invalid.
+"""
+import argparse
+import glob
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+from dataclasses import is_dataclass
+from typing import Any, Iterator, Optional, Sequence
+
+from fastconfig.config import _FastConfigBuilder
+from fastconfig.internals.plan import _BuildPlan
+from fastconfig.internals.snapshot import _schema
+from fastconfig.version import VERSION
+
+# the results of unchanged files are reused from this file, next to where the command runs
+DEFAULT_CACHE = ".fastconfig-check.json"
+# the results kept in the cache, shared by every class checked from the same directory
+CACHE_SIZE = 100_000
+
+
+def _import_target(target: str) -> type:
+    module, _, qualname = target.partition(":")
+    if not module or not qualname:
+        raise ValueError(f"target must be 'module:Class', not {target!r}")
+    value: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    if not isinstance(value, type) or not is_dataclass(value):
+        raise ValueError(f"{target} is not a dataclass or FastConfig class")
+    return value
+
+
+def _files(patterns: Sequence[str]) -> list[str]:
+    # globs are expanded like `**` in a shell, other paths are kept as they are
+    files: list[str] = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            files.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            files.append(pattern)
+    # in order, once
+    return list(dict.fromkeys(files))
+
+
+def _salt(target: str, config: type) -> bytes:
+    # a result is stale once the class or fastconfig changes, like a snapshot
+    return "\0".join((target, _schema(_BuildPlan.of(config)), VERSION)).encode()
+
+
+def _key(content: bytes, salt: bytes) -> str:
+    digest = hashlib.sha256(content)
+    digest.update(b"\0")
+    digest.update(salt)
+    return digest.hexdigest()
+
+
+def _check_file(
+    config: type, path: str, content: Optional[bytes]
+) -> list[dict[str, Any]]:
+    try:
+        errors: list[tuple[Optional[str], Exception]] = _FastConfigBuilder._check(
+            path, config, content
+        )
+    except Exception as e:
+        # reported for this file, so that the other files are still checked
+        errors = [(None, e)]
+    return [
+        {"field": field, "error": type(e).__name__, "message": str(e)}
+        for field, e in errors
+    ]
+
+
+def _check_chunk(
+    config: type, files: list[tuple[str, bytes]]
+) -> list[list[dict[str, Any]]]:
+    # run by the workers, like `_build_chunk` of `build_many`
+    return [_check_file(config, path, content) for path, content in files]
+
+
+def _chunks(items: list[Any], size: int) -> Iterator[list[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def _load_cache(path: Optional[str]) -> dict[str, list[dict[str, Any]]]:
+    if path is None:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache: Any = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != VERSION:
+        return {}
+    results: Any = cache.get("results")
+    return results if isinstance(results, dict) else {}
+
+
+def _store_cache(
+    path: Optional[str], previous: dict[str, Any], results: dict[str, Any]
+) -> None:
+    # renamed into place like snapshots, so that concurrent runs never read a partial file
+    if path is None:
+        return
+    # the results of other classes and files are kept, those of this run last,
+    # and the oldest are dropped past `CACHE_SIZE`
+    merged: dict[str, Any] = {k: v for k, v in previous.items() if k not in results}
+    merged.update(results)
+    if len(merged) > CACHE_SIZE:
+        merged = dict(list(merged.items())[-CACHE_SIZE:])
+    try:
+        fd, tmp = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": VERSION, "results": merged}, f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
+
+def check(
+    target: str,
+    patterns: Sequence[str],
+    workers: Optional[int] = None,
+    cache: Optional[str] = DEFAULT_CACHE,
+) -> dict[str, Any]:
+    """
+    Build every file matching `patterns` with a class, and report every error.
+
+    Files are checked in parallel on `workers` processes. A file whose content,
+    class and fastconfig version are the same as in the previous run is not checked again.
+
+    Args:
+        target (str):
+            the class to build, as `module:Class`
+        patterns (Sequence[str]):
+            file paths or glob patterns
+        workers (Optional[int]):
+            the number of processes, If nothing is passed, use the number of CPUs
+        cache (Optional[str]):
+            a file keeping the results between runs, If None is passed, check every file
+    Returns:
+        dict[str, Any]: the report, with the errors of each file and a summary
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    config: type = _import_target(target)
+    files: list[str] = _files(patterns)
+    previous: dict[str, list[dict[str, Any]]] = _load_cache(cache)
+    salt: bytes = _salt(target, config)
+
+    results: dict[str, list[dict[str, Any]]] = {}
+    keys: dict[str, str] = {}
+    cached: set[str] = set()
+    pending: list[tuple[str, bytes]] = []
+    for path in files:
+        try:
+            with open(path, "rb") as f:
+                content: bytes = f.read()
+        except OSError as e:
+            results[path] = [
+                {"field": None, "error": type(e).__name__, "message": str(e)}
+            ]
+            continue
+        keys[path] = _key(content, salt)
+        if keys[path] in previous:
+            results[path] = previous[keys[path]]
+            cached.add(path)
+        else:
+            pending.append((path, content))
+
+    if workers > 1 and len(pending) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize: int = max(1, min(64, len(pending) // (workers * 4)))
+        chunks: list[list[tuple[str, bytes]]] = list(_chunks(pending, chunksize))
+        with ProcessPoolExecutor(min(workers, len(chunks))) as pool:
+            for chunk, errors in zip(
+                chunks, pool.map(_check_chunk, [config] * len(chunks), chunks)
+            ):
+                for (path, _), file_errors in zip(chunk, errors):
+                    results[path] = file_errors
+    else:
+        for path, content in pending:
+            results[path] = _check_file(config, path, content)
+
+    _store_cache(cache, previous, {keys[path]: results[path] for path in keys})
+    report: list[dict[str, Any]] = [
+        {
+            "path": path,
+            "ok": not results[path],
+            "cached": path in cached,
+            "errors": results[path],
+        }
+        for path in files
+    ]
+    return {
+        "target": target,
+        "files": report,
+        "summary": {
+            "files": len(report),
+            "failed": sum(not file["ok"] for file in report),
+            "cached": len(cached),
+        },
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Run the command line interface, and return the exit status."""
+    parser = argparse.ArgumentParser(
+        prog="fastconfig",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    checker = commands.add_parser(
+        "check", help="check config files against a FastConfig class"
+    )
+    checker.add_argument("target", help="the class to build, as module:Class")
+    checker.add_argument("files", nargs="+", help="file paths or glob patterns")
+    checker.add_argument(
+        "--workers", type=int, default=None, help="processes, default is all CPUs"
+    )
+    checker.add_argument(
+        "--cache", default=DEFAULT_CACHE, help="the result cache of previous runs"
+    )
+    checker.add_argument(
+        "--no-cache", action="store_true", help="check every file again"
+    )
+    checker.add_argument("--indent", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    # like `python -m`, so that the classes of the project are found by the console script
+    if "" not in sys.path and os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    try:
+        # only these are usage errors, those of the files are in the report
+        if args.workers is not None and args.workers < 1:
+            raise ValueError("workers must be positive")
+        _import_target(args.target)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.exit(2, f"fastconfig: error: {e}\n")
+    report: dict[str, Any] = check(
+        args.target,
+        args.files,
+        workers=args.workers,
+        cache=None if args.no_cache else args.cache,
+    )
+    print(json.dumps(report, indent=args.indent))
+    return 1 if report["summary"]["failed"] else 0
@@ -1,13 +1,55 @@
 """this module provides FastConfig class."""
+import copy
+import functools
 import os
 import sys
-from dataclasses import MISSING, asdict, dataclass, field
+import time
+from dataclasses import (
+    MISSING,
+    FrozenInstanceError,
+    asdict,
+    dataclass,
+    field,
+    fields,
+)
 from pathlib import Path
-from typing import Any, Mapping, Optional, Type, TypeVar, Union
+from types import FunctionType, MemberDescriptorType
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+from weakref import WeakSet
 
-from fastconfig.exception import InvalidConfigError
+from fastconfig.exception import FastConfigError, InvalidConfigError
+from fastconfig.internals.env import _EnvIndex
 from fastconfig.internals.loader import _FileLoader
-from fastconfig.internals.validator import DEFAULT_VALUE, _Validator
+from fastconfig.internals.plan import _BuildPlan, _changed, _FieldPlan
+from fastconfig.internals.serializer import _Serializer
+from fastconfig.internals.stats import _OBSERVERS, BuildStats, _notify, _Phase, _phase
+from fastconfig.internals.validator import (
+    DEFAULT_VALUE,
+    _equal,
+    _SettingIndex,
+    _TimedValidator,
+    _Validator,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+    from fastconfig.watcher import Watcher
 
 _T = TypeVar("_T")
 _Self = TypeVar("_Self", bound="FastConfig")
@@ -17,9 +59,18 @@ _Self = TypeVar("_Self", bound="FastConfig")
 class FastConfig:
     """this class provides the way to build and update instance from `toml` or `json` format file."""
 
+    # subclasses made by `fastconfig_dataclass` have no `__dict__`
+    __slots__ = ()
+
     @classmethod
     def build(
-        cls: Type[_Self], path: Union[str, Path], config: Optional[_Self] = None
+        cls: Type[_Self],
+        path: Union[str, Path],
+        config: Optional[_Self] = None,
+        lazy: bool = False,
+        partial: bool = False,
+        snapshot_dir: Optional[Union[str, Path]] = None,
+        env_prefix: Optional[str] = None,
     ) -> _Self:
         """
         Read file from path and create/update instance.
@@ -29,13 +80,263 @@ class FastConfig:
                 a file path to read a config
             config: Optional[_Self]
                 an instance inheriting from FastConfig (if updating)
+            lazy: bool
+                Whether to defer reading and type checking each field until it is first accessed.
+                `__init__` and `__post_init__` are not called, and errors are raised on access,
+                or by `validate()`. Ignored when updating
+            partial: bool
+                Whether to read only the keys of the fields from a JSON file.
+                The rest of the file is skipped without being parsed into objects,
+                and is only checked for balanced brackets and terminated strings.
+                Reading stops once every key is found, so a key repeated in an object
+                keeps its first value. Ignored for other formats
+            snapshot_dir: Optional[Union[str, Path]]
+                A directory to keep the validated values in. A later build of the same class
+                from a file with the same content loads them without parsing or type checking.
+                Snapshots are pickled and loading one runs code stored in it, so the directory
+                must be writable only by the user running the service. It is created with
+                mode 0o700 if missing.
+                Ignored when updating or with `lazy`
+            env_prefix: Optional[str]
+                A prefix of environment variables overriding the file, e.g. with `APP_`,
+                the field of key `db.primary.host` is read from `APP_DB__PRIMARY__HOST`.
+                Values are converted to the type hint of the field, and anything
+                other than a string is read as JSON (e.g. `8080`, `true`, `["a", "b"]`)
         Returns:
             _Self: an instance inheriting from FastConfig
         """
         if config is None:
-            return _FastConfigBuilder.build(path, cls)
+            return _FastConfigBuilder.build(
+                path,
+                cls,
+                lazy=lazy,
+                partial=partial,
+                snapshot_dir=snapshot_dir,
+                env_prefix=env_prefix,
+            )
+        else:
+            return _FastConfigBuilder.build(
+                path, config, partial=partial, env_prefix=env_prefix
+            )
+
+    @classmethod
+    def build_layered(
+        cls: Type[_Self],
+        paths: Sequence[Union[str, Path]],
+        config: Optional[_Self] = None,
+        missing_ok: bool = False,
+        parallel: bool = True,
+    ) -> _Self:
+        """
+        Read several files, merge them and create/update instance once.
+
+        Later files take precedence over earlier ones. Tables are merged recursively,
+        and any other value (including lists) replaces the value of earlier files.
+        The file each field came from is available from `field_sources()`.
+
+        Args:
+            paths: Sequence[Union[str, Path]]
+                file paths to read configs, from the lowest to the highest precedence
+            config: Optional[_Self]
+                an instance inheriting from FastConfig (if updating)
+            missing_ok: bool
+                Whether to skip files that do not exist instead of raising FileNotFoundError
+            parallel: bool
+                Whether to read the files on a thread pool
+        Returns:
+            _Self: an instance inheriting from FastConfig
+        """
+        return _FastConfigBuilder.build_layered(
+            paths, cls if config is None else config, missing_ok, parallel
+        )
+
+    def field_sources(self) -> dict[str, Optional[Path]]:
+        """
+        Return the file each field was read from by `build_layered`.
+
+        Returns:
+            dict[str, Optional[Path]]: the file of each field, or None for fields using the default value
+        """
+        sources: Optional[dict[str, Optional[Path]]] = getattr(
+            self, "_fc_sources", None
+        )
+        return {} if sources is None else dict(sources)
+
+    @classmethod
+    async def abuild(
+        cls: Type[_Self],
+        path: Union[str, Path],
+        config: Optional[_Self] = None,
+        executor: "Optional[Executor]" = None,
+    ) -> _Self:
+        """
+        Read file from path and create/update instance without blocking the event loop.
+
+        File I/O, parsing and type checking run on `executor`,
+        so several configs can be loaded at once with `asyncio.gather`.
+
+        Args:
+            path: Union[str, Path]
+                a file path to read a config
+            config: Optional[_Self]
+                an instance inheriting from FastConfig (if updating)
+            executor: Optional[Executor]
+                the executor to run on, If nothing is passed, use the default executor of the event loop
+        Returns:
+            _Self: an instance inheriting from FastConfig
+        """
+        # imported here, like the executors below, as it takes longer than the package
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor, functools.partial(cls.build, path, config)
+        )
+
+    @classmethod
+    def build_many(
+        cls: Type[_Self],
+        paths: Iterable[Union[str, Path]],
+        workers: Optional[int] = None,
+        executor: "Union[str, Executor]" = "process",
+        ordered: bool = True,
+        chunksize: Optional[int] = None,
+    ) -> "Iterator[BuildResult[_Self]]":
+        """
+        Read many files in parallel and create an instance from each of them.
+
+        A file that fails to build does not abort the batch, its error is reported in its result.
+
+        Args:
+            paths: Iterable[Union[str, Path]]
+                file paths to read configs
+            workers: Optional[int]
+                the number of workers, If nothing is passed, use the number of CPUs
+            executor: Union[str, Executor]
+                `process` for a process pool (the class must be importable by the workers),
+                `thread` for a thread pool, or an executor to submit to
+            ordered: bool
+                Whether to yield results in the order of `paths` or as soon as they are built
+            chunksize: Optional[int]
+                the number of files sent to a worker at once, If nothing is passed, it is chosen from the number of files
+        Returns:
+            Iterator[BuildResult[_Self]]: a result for each file
+        """
+        from concurrent.futures import (
+            Executor,
+            ProcessPoolExecutor,
+            ThreadPoolExecutor,
+        )
+
+        files: list[str] = [str(path) for path in paths]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("workers must be positive")
+
+        # an owned pool is created by the iterator, so that it is shut down by it
+        factory: Optional[Callable[[], Executor]] = None
+        if isinstance(executor, Executor):
+            pass
+        elif executor == "process":
+            factory = functools.partial(ProcessPoolExecutor, workers)
+        elif executor == "thread":
+            factory = functools.partial(ThreadPoolExecutor, workers)
+        else:
+            raise ValueError(
+                f"executor must be 'process', 'thread' or an Executor, not {executor!r}"
+            )
+        if chunksize is None:
+            chunksize = max(1, min(64, len(files) // (workers * 4)))
+        return _build_chunks(
+            cls, files, executor if factory is None else factory, ordered, chunksize
+        )
+
+    @classmethod
+    def watch(
+        cls: Type[_Self],
+        path: Union[str, Path],
+        config: Optional[_Self] = None,
+        callback: Optional[Callable[[_Self, set[str]], Any]] = None,
+        debounce: float = 0.1,
+        poll_interval: float = 1.0,
+        mode: str = "thread",
+        copy_on_write: bool = False,
+    ) -> "Watcher[_Self]":
+        """
+        Build/update instance from path, and reload it whenever the file changes.
+
+        The file is parsed again only when it changed, and the result is applied like `build(path, config)`.
+
+        Args:
+            path: Union[str, Path]
+                a file path to read a config
+            config: Optional[_Self]
+                an instance inheriting from FastConfig (if updating)
+            callback: Optional[Callable[[_Self, set[str]], Any]]
+                called with the instance and the names of the changed fields after a reload
+            debounce: float
+                seconds without further changes to wait before reloading
+            poll_interval: float
+                seconds between `stat` checks when inotify is not available
+            mode: str
+                `thread` to watch on a daemon thread,
+                or `asyncio` to watch on a task of the running event loop
+            copy_on_write: bool
+                Whether to replace `watcher.config` by a new instance on reload,
+                sharing the unchanged values, instead of updating the instance in place
+        Returns:
+            Watcher[_Self]: a running watcher, the instance is available as `watcher.config`
+        """
+        from fastconfig.watcher import Watcher
+
+        if mode not in ("thread", "asyncio"):
+            raise ValueError(f"mode must be 'thread' or 'asyncio', not {mode!r}")
+        watcher: Watcher[_Self] = Watcher(
+            path,
+            cls if config is None else config,
+            callback=callback,
+            debounce=debounce,
+            poll_interval=poll_interval,
+            copy_on_write=copy_on_write,
+        )
+        if mode == "thread":
+            watcher.start()
         else:
-            return _FastConfigBuilder.build(path, config)
+            watcher.start_task()
+        return watcher
+
+    def validate(self) -> None:
+        """
+        Read and type-check every field not accessed yet of an instance built with `lazy=True`.
+
+        Raises MissingRequiredElementError or UnexpectedValueError like a normal build.
+        Does nothing for other instances.
+        """
+        try:
+            lazy: _LazyState = object.__getattribute__(self, "_fc_lazy")
+        except AttributeError:
+            return
+        for name in lazy.plan.by_name:
+            getattr(self, name)
+        # every field is set, so the document is no longer needed
+        try:
+            object.__delattr__(self, "_fc_lazy")
+        except AttributeError:
+            pass
+
+    def __getattr__(self, name: str) -> Any:
+        """Resolve a field of a lazily built instance which was not accessed yet."""
+        # only called when a normal lookup failed
+        try:
+            lazy: _LazyState = object.__getattribute__(self, "_fc_lazy")
+        except AttributeError:
+            lazy = None  # type: ignore
+        if lazy is not None and name in lazy.plan.by_name:
+            return lazy.resolve(self, name)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     def to_dict(self, use_key: bool = False) -> dict[str, Any]:
         """
@@ -49,23 +350,65 @@ class FastConfig:
         """
         if use_key:
             return asdict(self)
+        return _Serializer.of(type(self)).to_dict(self)
 
-        dic: dict[str, Any] = {}
-        for key, f in self.__dataclass_fields__.items():
-            metadata: dict[str, Any] = (
-                dict(f.metadata) if hasattr(f, "metadata") else {}
-            )
-            separator = metadata["separator"] if "separator" in metadata else "."
-            setting_key: list[str] = (
-                metadata["key"].split(separator) if "key" in metadata else [key]
-            )
-            inside: dict[str, Any] = dic
-            for nest_field in setting_key[:-1]:
-                if nest_field not in dic:
-                    inside[nest_field] = {}
-                inside = inside[nest_field]
-            inside[setting_key[-1]] = getattr(self, key)
-        return dic
+    @overload
+    def to_json(self, file: None = None, indent: Optional[int] = None) -> str:
+        ...
+
+    @overload
+    def to_json(
+        self, file: Union[str, Path, IO[str]], indent: Optional[int] = None
+    ) -> None:
+        ...
+
+    def to_json(
+        self,
+        file: Optional[Union[str, Path, IO[str]]] = None,
+        indent: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        Write an instance in `json` format, with the same keys as `to_dict`.
+
+        The document is written piece by piece, without building a dict first.
+        Dates and times are written in ISO 8601 format.
+
+        Args:
+            file: Optional[Union[str, Path, IO[str]]]
+                a file path or a text stream to write to, If nothing is passed, return a string
+            indent: Optional[int]
+                the number of spaces to indent nested values with, If nothing is passed, write a single line
+        Returns:
+            Optional[str]: the document if no file is passed
+        """
+        serializer: _Serializer = _Serializer.of(type(self))
+        return _write(file, lambda write: serializer.write_json(self, write, indent))
+
+    @overload
+    def to_toml(self, file: None = None) -> str:
+        ...
+
+    @overload
+    def to_toml(self, file: Union[str, Path, IO[str]]) -> None:
+        ...
+
+    def to_toml(
+        self, file: Optional[Union[str, Path, IO[str]]] = None
+    ) -> Optional[str]:
+        """
+        Write an instance in `toml` format, with the same keys as `to_dict`.
+
+        The document is written piece by piece, without building a dict first.
+        Tables which are field values are written inline, and fields set to None are left out.
+
+        Args:
+            file: Optional[Union[str, Path, IO[str]]]
+                a file path or a text stream to write to, If nothing is passed, return a string
+        Returns:
+            Optional[str]: the document if no file is passed
+        """
+        serializer: _Serializer = _Serializer.of(type(self))
+        return _write(file, lambda write: serializer.write_toml(self, write))
 
 
 if sys.version_info >= (3, 10):
@@ -81,6 +424,7 @@ if sys.version_info >= (3, 10):
         compare: bool = True,
         metadata: Mapping[Any, Any] | None = None,
         kw_only=MISSING,
+        as_array: Optional[Any] = None,
     ) -> _T:
         """
         Return `dataclass::field`.
@@ -93,6 +437,10 @@ if sys.version_info >= (3, 10):
                 the name of the key you want to read, divided by `separator` when retrieving data
             separator: str
                 Separator for splitting key values, default is `.`
+            as_array: Optional[Any]
+                Convert a list of numbers to a contiguous array in one pass, with this type.
+                an `array.array` typecode (e.g. `d`, `q`) for `array.array`,
+                or any other numpy dtype (e.g. `float32`) for `numpy.ndarray`
 
         Returns:
             _T
@@ -110,6 +458,8 @@ if sys.version_info >= (3, 10):
 
         if key is not None:
             options["metadata"]["key"] = key
+        if as_array is not None:
+            options["metadata"]["as_array"] = as_array
         options["metadata"]["separator"] = separator
         return field(**options)
 
@@ -125,6 +475,7 @@ else:
         hash: Optional[bool] = None,
         compare: bool = True,
         metadata: Optional[Mapping[Any, Any]] = None,
+        as_array: Optional[Any] = None,
     ) -> _T:
         """
         Return `dataclass::field`.
@@ -137,6 +488,10 @@ else:
                 the name of the key you want to read, divided by `separator` when retrieving data
             separator: str
                 Separator for splitting key values, default is `.`
+            as_array: Optional[Any]
+                Convert a list of numbers to a contiguous array in one pass, with this type.
+                an `array.array` typecode (e.g. `d`, `q`) for `array.array`,
+                or any other numpy dtype (e.g. `float32`) for `numpy.ndarray`
 
         Returns:
             _T
@@ -153,25 +508,491 @@ else:
 
         if key is not None:
             options["metadata"]["key"] = key
+        if as_array is not None:
+            options["metadata"]["as_array"] = as_array
         options["metadata"]["separator"] = separator
         return field(**options)
 
 
+def fastconfig_dataclass(
+    cls: Optional[Type[_T]] = None,
+    *,
+    slots: bool = True,
+    frozen: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """
+    Return `dataclass`, making instances without `__dict__`.
+
+    wrapper of `dataclass` for FastConfig definition, also on Python versions
+    where `dataclass` has no `slots` option. Instances store their fields in `__slots__`,
+    which takes less memory for many small instances. Every base class should define `__slots__`,
+    like `FastConfig` and the classes made by this decorator.
+    The class is created again, like `dataclass(slots=True)`. Methods using `super()` or `__class__`
+    are bound to the new class, but a reference to the original class taken by a decorator applied
+    before this one still points to the class without `__slots__`.
+
+        @fastconfig_dataclass
+        class Config(FastConfig):
+            host: str = fc_field(key="db.host", default="localhost")
+
+    Args:
+        slots: bool
+            Whether to use `__slots__`, otherwise same as `dataclass`
+        frozen: bool
+            Whether to forbid assigning fields. a frozen instance cannot be updated by `build`
+        kwargs: Any
+            the other options of `dataclass`
+    Returns:
+        the class, or a decorator if no class is passed
+    """
+
+    def wrap(cls: Type[_T]) -> Type[_T]:
+        # `FastConfig` is not frozen, and a frozen dataclass cannot inherit from it
+        emulated: bool = frozen and issubclass(cls, FastConfig)
+        klass: Type[_T] = dataclass(
+            cls, frozen=frozen and not emulated, **kwargs
+        )  # type: ignore
+        if emulated:
+            klass.__setattr__ = _frozen_setattr  # type: ignore
+            klass.__delattr__ = _frozen_delattr  # type: ignore
+            if kwargs.get("eq", True) and not kwargs.get("unsafe_hash", False):
+                klass.__hash__ = _frozen_hash  # type: ignore
+        return _add_slots(klass, frozen) if slots else klass
+
+    return wrap if cls is None else wrap(cls)
+
+
+# set on instances by lazy and layered builds and by the parents of sections
+_INTERNAL_SLOTS: tuple[str, ...] = ("_fc_lazy", "_fc_sources")
+
+
+def _add_slots(cls: Type[_T], frozen: bool) -> Type[_T]:
+    # a class cannot get `__slots__` once created, so it is created again like `dataclass(slots=True)`
+    if "__slots__" in cls.__dict__:
+        raise TypeError(f"{cls.__name__} already specifies __slots__")
+    inherited: set[str] = set()
+    for base in cls.__mro__[1:]:
+        names: Any = base.__dict__.get("__slots__", ())
+        inherited.update((names,) if isinstance(names, str) else names)
+
+    slotted: tuple[str, ...] = tuple(f.name for f in fields(cls)) + _INTERNAL_SLOTS
+    namespace: dict[str, Any] = dict(cls.__dict__)
+    namespace["__slots__"] = tuple(name for name in slotted if name not in inherited)
+    for name in slotted:
+        # the defaults are kept by `__init__`
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+
+    klass: Type[_T] = type(cls)(cls.__name__, cls.__bases__, namespace)
+    klass.__qualname__ = cls.__qualname__
+    for value in namespace.values():
+        # zero-argument `super()` refers to the class in the `__class__` cell of methods
+        _rebind_class(value, cls, klass)
+    if frozen:
+        # pickle sets the state with `setattr`, which a frozen dataclass forbids
+        klass.__getstate__ = _frozen_getstate  # type: ignore
+        klass.__setstate__ = _frozen_setstate  # type: ignore
+    return klass
+
+
+def _rebind_class(value: Any, old: type, new: type) -> None:
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+    elif isinstance(value, property):
+        for accessor in (value.fget, value.fset, value.fdel):
+            _rebind_class(accessor, old, new)
+        return
+    value = getattr(value, "__wrapped__", value)
+    if not isinstance(value, FunctionType) or value.__closure__ is None:
+        return
+    try:
+        index: int = value.__code__.co_freevars.index("__class__")
+    except ValueError:
+        return
+    cell: Any = value.__closure__[index]
+    if cell.cell_contents is old:
+        cell.cell_contents = new
+
+
+def _assigned(instance: Any, name: str) -> bool:
+    slot: Any = getattr(type(instance), name, None)
+    if isinstance(slot, MemberDescriptorType):
+        try:
+            slot.__get__(instance, type(instance))
+        except AttributeError:
+            return False
+        return True
+    return name in getattr(instance, "__dict__", ())
+
+
+def _is_frozen(cls: type) -> bool:
+    # frozen by `dataclass`, or by `fastconfig_dataclass` for a FastConfig subclass
+    params: Any = getattr(cls, "__dataclass_params__", None)
+    return bool(getattr(params, "frozen", False)) or cls.__setattr__ is _frozen_setattr
+
+
+def _frozen_setattr(self: Any, name: str, value: Any) -> None:
+    # `__init__` of a class which is not frozen for `dataclass` assigns each field once
+    if name in self.__dataclass_fields__ and _assigned(self, name):
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+    object.__setattr__(self, name, value)
+
+
+def _frozen_delattr(self: Any, name: str) -> None:
+    if name in self.__dataclass_fields__:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+    object.__delattr__(self, name)
+
+
+def _frozen_hash(self: Any) -> int:
+    return hash(
+        tuple(
+            getattr(self, f.name)
+            for f in fields(self)
+            if f.hash is not False and (f.hash or f.compare)
+        )
+    )
+
+
+def _frozen_getstate(self: Any) -> list[Any]:
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _frozen_setstate(self: Any, state: list[Any]) -> None:
+    for f, value in zip(fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+class _LazyDefault:
+    # replaces the class attribute holding the default value of a field,
+    # which would otherwise hide the field from `__getattr__` on lazily built instances.
+    # as a non-data descriptor, it is not used when the instance has the value.
+    def __init__(self, name: str, default: Any) -> None:
+        self.name: str = name
+        self.default: Any = default
+
+    def __get__(self, instance: Optional[FastConfig], owner: type) -> Any:
+        if instance is None:
+            return self.default
+        try:
+            lazy: _LazyState = object.__getattribute__(instance, "_fc_lazy")
+        except AttributeError:
+            return self.default
+        return lazy.resolve(instance, self.name)
+
+
+_LAZY_CLASSES: "WeakSet[type]" = WeakSet()
+
+
+class _LazyState:
+    def __init__(self, setting: dict[str, Any], plan: _BuildPlan) -> None:
+        self.setting: dict[str, Any] = setting
+        self.plan: _BuildPlan = plan
+        # filled as fields are accessed, sharing the tables walked by earlier fields
+        self.index: _SettingIndex = _SettingIndex(setting)
+
+    def resolve(self, config: FastConfig, name: str) -> Any:
+        f = self.plan.by_name[name]
+        value: Any = _Validator(self.setting, self.index).validate(f)
+        if isinstance(value, DEFAULT_VALUE):
+            value = f.default if f.default is not MISSING else f.default_factory()
+        object.__setattr__(config, name, value)
+        return value
+
+
+@dataclass(frozen=True)
+class BuildResult(Generic[_Self]):
+    """The result of building one file with `FastConfig.build_many`."""
+
+    path: str
+    config: Optional[_Self] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the file was built successfully."""
+        return self.error is None
+
+
+def _build_chunk(config: Type[_Self], paths: list[str]) -> list[BuildResult[_Self]]:
+    results: list[BuildResult[_Self]] = []
+    for path in paths:
+        try:
+            results.append(BuildResult(path, config.build(path)))
+        except (FastConfigError, OSError) as e:
+            results.append(BuildResult(path, error=e))
+    return results
+
+
+def _build_chunks(
+    config: Type[_Self],
+    paths: list[str],
+    executor: "Union[Executor, Callable[[], Executor]]",
+    ordered: bool,
+    chunksize: int,
+) -> Iterator[BuildResult[_Self]]:
+    # a callable creates a pool owned by this iterator, only once it is iterated
+    from concurrent.futures import Executor, as_completed
+
+    owned: bool = not isinstance(executor, Executor)
+    pool: Executor = executor() if owned else executor  # type: ignore
+    futures: "list[Future[list[BuildResult[_Self]]]]" = []
+    try:
+        for i in range(0, len(paths), chunksize):
+            futures.append(pool.submit(_build_chunk, config, paths[i : i + chunksize]))
+        for future in futures if ordered else as_completed(futures):
+            yield from future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=True)
+
+
+def _write(
+    file: Optional[Union[str, Path, IO[str]]],
+    serialize: Callable[[Callable[[str], Any]], None],
+) -> Optional[str]:
+    if file is None:
+        chunks: list[str] = []
+        serialize(chunks.append)
+        return "".join(chunks)
+    if isinstance(file, (str, Path)):
+        with open(file, "w", encoding="utf-8") as f:
+            serialize(f.write)
+    else:
+        serialize(file.write)
+    return None
+
+
+def _validator(
+    setting: dict[str, Any],
+    stats: Optional[BuildStats],
+    index: Optional[_SettingIndex] = None,
+) -> _Validator:
+    if stats is None:
+        return _Validator(setting, index)
+    return _TimedValidator(setting, stats, index)
+
+
+def _merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    merged: dict[str, Any] = dict(base)
+    for key, value in override.items():
+        current = merged.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            merged[key] = _merge(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
 class _FastConfigBuilder:
     @classmethod
-    def build(cls, path: Union[str, Path], config: Union[_Self, Type[_Self]]) -> _Self:
+    def build(
+        cls,
+        path: Union[str, Path],
+        config: Union[_Self, Type[_Self]],
+        lazy: bool = False,
+        partial: bool = False,
+        snapshot_dir: Optional[Union[str, Path]] = None,
+        env_prefix: Optional[str] = None,
+    ) -> _Self:
+        if not _OBSERVERS:
+            return cls._build(path, config, lazy, partial, snapshot_dir, env_prefix)
+
+        stats: BuildStats = BuildStats(
+            str(path), config if isinstance(config, type) else type(config)
+        )
+        started: float = time.perf_counter()
+        try:
+            return cls._build(
+                path, config, lazy, partial, snapshot_dir, env_prefix, stats
+            )
+        except Exception as e:
+            stats.error = e
+            raise
+        finally:
+            stats.duration = time.perf_counter() - started
+            _notify(stats)
+
+    @classmethod
+    def _build(
+        cls,
+        path: Union[str, Path],
+        config: Union[_Self, Type[_Self]],
+        lazy: bool,
+        partial: bool,
+        snapshot_dir: Optional[Union[str, Path]],
+        env_prefix: Optional[str] = None,
+        stats: Optional[BuildStats] = None,
+    ) -> _Self:
         if isinstance(path, Path):
             path = str(path)
 
+        select: Optional[tuple[tuple[str, ...], ...]] = None
+        klass: type = config if isinstance(config, type) else type(config)
+        if partial and issubclass(klass, FastConfig):
+            select = tuple(f.path for f in _BuildPlan.of(klass).fields)
+        overrides: Optional[dict[str, Any]] = None
+        if env_prefix is not None and issubclass(klass, FastConfig):
+            with _phase(stats, "env"):
+                overrides = _EnvIndex.of(klass, env_prefix).read()
+        if snapshot_dir is not None and not lazy and config is klass:
+            # a fresh build, `_apply` reports a class not inheriting from FastConfig
+            if issubclass(klass, FastConfig):
+                return cls._build_snapshot(
+                    path, klass, select, str(snapshot_dir), overrides, stats
+                )
+
+        data: dict[str, Any] = cls._load(path, select, stats)
+        if lazy and isinstance(config, type) and issubclass(config, FastConfig):
+            return cls._make_lazy(config, data, overrides)
+        return cls._apply(config, data, stats, overrides)
+
+    @classmethod
+    def build_layered(
+        cls,
+        paths: Sequence[Union[str, Path]],
+        config: Union[_Self, Type[_Self]],
+        missing_ok: bool = False,
+        parallel: bool = True,
+    ) -> _Self:
+        files: list[str] = [str(path) for path in paths]
+        if missing_ok:
+            files = [path for path in files if os.path.exists(path)]
+
+        layers: list[dict[str, Any]]
+        if parallel and len(files) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(min(len(files), 8)) as pool:
+                layers = list(pool.map(cls._load, files))
+        else:
+            layers = [cls._load(path) for path in files]
+
+        merged: dict[str, Any] = {}
+        for layer in layers:
+            merged = _merge(merged, layer)
+        result: _Self = cls._apply(config, merged)
+
+        sources: dict[str, Optional[Path]] = result.field_sources()
+        plan: _BuildPlan = _BuildPlan.of(type(result))
+        indexes: list[_SettingIndex] = [
+            _SettingIndex(layer).add(plan.tree) for layer in layers
+        ]
+        for f in plan.fields:
+            for path, index in zip(reversed(files), reversed(indexes)):
+                if index.get(f.path) is not None:
+                    sources[f.name] = Path(path)
+                    break
+            else:
+                sources.setdefault(f.name, None)
+        object.__setattr__(result, "_fc_sources", sources)
+        return result
+
+    @classmethod
+    def _load(
+        cls,
+        path: str,
+        select: Optional[tuple[tuple[str, ...], ...]] = None,
+        stats: Optional[BuildStats] = None,
+    ) -> dict[str, Any]:
         if not os.path.exists(path):
             raise FileNotFoundError(f"{path} is not found")
 
-        loader: _FileLoader = _FileLoader()
-        data: dict[str, Any] = loader(path)
+        loader: _FileLoader = _FileLoader(stats)
+        return loader(path, select)
+
+    @classmethod
+    def _check(
+        cls, path: str, config: type, content: Optional[bytes] = None
+    ) -> list[tuple[Optional[str], Exception]]:
+        # every error of a build by field name, or None for the file and `__post_init__`
+        try:
+            if content is None:
+                setting: dict[str, Any] = cls._load(path)
+            else:
+                setting = _FileLoader().loads(path, content)
+        except Exception as e:
+            # reported like the other errors, a check never stops at one file
+            return [(None, e)]
+
+        errors: list[tuple[Optional[str], Exception]] = []
+        args: dict[str, Any] = {}
+        plan: _BuildPlan = _BuildPlan.of(config)
+        checker: _Validator = _Validator(setting, _SettingIndex(setting).add(plan.tree))
+        for f in plan.fields:
+            try:
+                value = checker.validate(f)
+            except Exception as e:
+                # also raised by `__post_init__` of nested sections
+                errors.append((f.name, e))
+                continue
+            if not isinstance(value, DEFAULT_VALUE):
+                args[f.name] = value
+        if not errors:
+            try:
+                config(**args)
+            except Exception as e:
+                # e.g. validation in `__post_init__`
+                errors.append((None, e))
+        return errors
+
+    @classmethod
+    def _build_snapshot(
+        cls,
+        path: str,
+        config: Type[_Self],
+        select: Optional[tuple[tuple[str, ...], ...]],
+        directory: str,
+        overrides: Optional[dict[str, Any]] = None,
+        stats: Optional[BuildStats] = None,
+    ) -> _Self:
+        from fastconfig.internals.snapshot import _SnapshotCache
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{path} is not found")
+
+        loader: _FileLoader = _FileLoader(stats)
+        with _phase(stats, "read"):
+            content: bytes = loader.read(path)
+        snapshots: _SnapshotCache = _SnapshotCache(directory)
+        with _phase(stats, "snapshot"):
+            key: str = snapshots.key(content, config, overrides or ())
+            values: Optional[dict[str, Any]] = snapshots.load(key)
+        if values is None:
+            # parse the content that was hashed, even if the file changed since
+            with _phase(stats, "parse"):
+                setting: dict[str, Any] = loader.loads(path, content, select)
+            values = cls._values(config, setting, stats, overrides)
+            if overrides:
+                values = {k: v for k, v in values.items() if k not in overrides}
+            with _phase(stats, "snapshot"):
+                snapshots.store(key, values)
+        if stats is not None:
+            stats.bytes_read += len(content)
+        if overrides:
+            # the snapshot holds the values of the file only
+            values = {**values, **overrides}
+        with _phase(stats, "construct"):
+            return config(**values)
+
+    @classmethod
+    def _apply(
+        cls,
+        config: Union[_Self, Type[_Self]],
+        data: dict[str, Any],
+        stats: Optional[BuildStats] = None,
+        overrides: Optional[dict[str, Any]] = None,
+        index: Optional[_SettingIndex] = None,
+    ) -> _Self:
+        # `index` may be shared by the builds of several classes from the same `data`
         if not isinstance(config, type) and isinstance(config, FastConfig):
-            return cls._update(config, data)
+            return cls._update(config, data, stats, overrides, index)
         elif isinstance(config, type) and issubclass(config, FastConfig):
-            return cls._make(config, data)
+            return cls._make(config, data, stats, overrides, index)
         else:
             raise InvalidConfigError(
                 "must be of type FastConfig or an instance of FastConfig"
@@ -182,21 +1003,129 @@ class _FastConfigBuilder:
         cls,
         config: Type[_Self],
         setting: dict[str, Any],
+        stats: Optional[BuildStats] = None,
+        overrides: Optional[dict[str, Any]] = None,
+        index: Optional[_SettingIndex] = None,
     ) -> _Self:
+        args: dict[str, Any] = cls._values(config, setting, stats, overrides, index)
+        if stats is None:
+            return config(**args)
+        with _Phase(stats, "construct"):
+            return config(**args)
+
+    @classmethod
+    def _values(
+        cls,
+        config: type,
+        setting: dict[str, Any],
+        stats: Optional[BuildStats] = None,
+        overrides: Optional[dict[str, Any]] = None,
+        index: Optional[_SettingIndex] = None,
+    ) -> dict[str, Any]:
         # check metadata and type hint
         args: dict[str, Any] = {}
-        checker: _Validator = _Validator(setting)
-        for key, f in config.__dataclass_fields__.items():
-            value = checker(key, f)
+        plan: _BuildPlan = _BuildPlan.of(config)
+        if index is None:
+            index = _SettingIndex(setting)
+        checker: _Validator = _validator(setting, stats, index.add(plan.tree))
+        for f in plan.fields:
+            if overrides and f.name in overrides:
+                args[f.name] = overrides[f.name]
+                continue
+            value = checker.validate(f)
             if not isinstance(value, DEFAULT_VALUE):
-                args[key] = value
-        return config(**args)
+                args[f.name] = value
+        return args
+
+    @classmethod
+    def _make_lazy(
+        cls,
+        config: Type[_Self],
+        setting: dict[str, Any],
+        overrides: Optional[dict[str, Any]] = None,
+    ) -> _Self:
+        plan: _BuildPlan = _BuildPlan.of(config)
+        if config not in _LAZY_CLASSES:
+            for f in plan.fields:
+                for klass in config.__mro__:
+                    if f.name in klass.__dict__:
+                        default: Any = klass.__dict__[f.name]
+                        # the slot of a field has no default to replace
+                        if not isinstance(
+                            default, (_LazyDefault, MemberDescriptorType)
+                        ):
+                            setattr(klass, f.name, _LazyDefault(f.name, default))
+                        break
+            _LAZY_CLASSES.add(config)
+
+        instance: _Self = object.__new__(config)
+        object.__setattr__(instance, "_fc_lazy", _LazyState(setting, plan))
+        if overrides:
+            for name, value in overrides.items():
+                object.__setattr__(instance, name, value)
+        return instance
+
+    @classmethod
+    def _replace(
+        cls,
+        config: _Self,
+        setting: dict[str, Any],
+        previous: Optional[dict[str, Any]] = None,
+        stats: Optional[BuildStats] = None,
+    ) -> tuple[_Self, set[str]]:
+        # like `_update`, but on a shallow copy sharing the unchanged values,
+        # `config` itself is returned when nothing changed.
+        # keys with the same value as in `previous`, the setting of `config`, are not checked again
+        if setting is previous:
+            return config, set()
+        plan: _BuildPlan = _BuildPlan.of(type(config))
+        candidates: Iterable[_FieldPlan] = plan.fields
+        if previous is not None:
+            candidates = [
+                plan.by_name[name]
+                for name in _changed(plan.tree, setting, previous, [])
+            ]
+        # only the candidates are looked up, so the setting is not flattened as a whole
+        checker: _Validator = _validator(setting, stats)
+        changes: dict[str, Any] = {}
+        for f in candidates:
+            current: Any = getattr(config, f.name, None)
+            value = checker.validate(f, build=False)
+            if isinstance(value, DEFAULT_VALUE) or _equal(value, current):
+                continue
+            changes[f.name] = value
+        if not changes:
+            return config, set()
+
+        replaced: _Self = copy.copy(config)
+        with _phase(stats, "construct"):
+            for name, value in changes.items():
+                # also for frozen classes, the copy is not shared yet
+                object.__setattr__(replaced, name, value)
+        return replaced, set(changes)
 
     @classmethod
-    def _update(cls, config: _Self, setting: dict[str, Any]) -> _Self:
-        checker: _Validator = _Validator(setting)
-        for key, f in config.__dataclass_fields__.items():
-            value = checker(key, f, build=False)
+    def _update(
+        cls,
+        config: _Self,
+        setting: dict[str, Any],
+        stats: Optional[BuildStats] = None,
+        overrides: Optional[dict[str, Any]] = None,
+        index: Optional[_SettingIndex] = None,
+    ) -> _Self:
+        plan: _BuildPlan = _BuildPlan.of(type(config))
+        if index is None:
+            index = _SettingIndex(setting)
+        checker: _Validator = _validator(setting, stats, index.add(plan.tree))
+        for f in plan.fields:
+            if overrides and f.name in overrides:
+                value: Any = overrides[f.name]
+            else:
+                value = checker.validate(f, build=False)
             if not isinstance(value, DEFAULT_VALUE):
-                setattr(config, key, value)
+                if stats is None:
+                    setattr(config, f.name, value)
+                else:
+                    with _Phase(stats, "construct"):
+                        setattr(config, f.name, value)
         return config
@@ -0,0 +1,66 @@
+"""This module provides `ConfigHandle` to replace a FastConfig instance as a whole on reload."""
+import threading
+from pathlib import Path
+from typing import Any, Generic, Optional, Type, TypeVar, Union
+
+from fastconfig.config import FastConfig, _FastConfigBuilder
+
+_Self = TypeVar("_Self", bound=FastConfig)
+
+
+class ConfigHandle(Generic[_Self]):
+    """
+    Hold the current instance of a config, which is never modified once built.
+
+    `reload` builds a new instance sharing the unchanged values with the previous one,
+    then replaces `current` with a single assignment. Readers on other threads
+    take `handle.current` once and see either the old or the new instance as a whole,
+    without locking.
+
+        handle = ConfigHandle("config.toml", Config)
+        config = handle.current
+        handle.reload()
+    """
+
+    def __init__(
+        self, path: Union[str, Path], config: Union[_Self, Type[_Self]]
+    ) -> None:
+        """
+        Create a handle, building the instance first if a class is passed.
+
+        Args:
+            path (Union[str, Path]):
+                a file path to read a config
+            config (Union[_Self, Type[_Self]]):
+                an instance inheriting from FastConfig, which is not modified,
+                or a class to build it from `path`
+        """
+        self.path: str = str(path)
+        self._lock = threading.Lock()
+        setting: dict[str, Any] = _FastConfigBuilder._load(self.path)
+        if isinstance(config, type):
+            self.current: _Self = _FastConfigBuilder._apply(config, setting)
+        else:
+            self.current, _ = _FastConfigBuilder._replace(config, setting)
+        # the setting of `current`, to check only the values changed since
+        self._setting: Optional[dict[str, Any]] = setting
+
+    def reload(self) -> set[str]:
+        """
+        Read the file again and replace `current` if any value changed.
+
+        Values missing from the file are kept, like `FastConfig.build(path, config)`.
+        `__post_init__` is not called on the new instance.
+        If the file is invalid, the error is raised and `current` is kept.
+
+        Returns:
+            set[str]: the names of the changed fields
+        """
+        with self._lock:
+            setting: dict[str, Any] = _FastConfigBuilder._load(self.path)
+            config, changed = _FastConfigBuilder._replace(
+                self.current, setting, self._setting
+            )
+            self._setting = setting
+            self.current = config
+            return changed
@@ -0,0 +1,106 @@
+"""This module provides the observers of `FastConfig.build` calls and their statistics."""
+import contextlib
+from typing import Any, Callable, Iterator
+
+from fastconfig.internals.stats import _OBSERVERS, BuildStats
+
+__all__ = [
+    "BuildStats",
+    "add_build_observer",
+    "remove_build_observer",
+    "record_builds",
+    "OpenTelemetryObserver",
+]
+
+
+def add_build_observer(observer: Callable[[BuildStats], Any]) -> None:
+    """
+    Register a function called with the statistics of every `FastConfig.build` call.
+
+    Builds are measured only while an observer is registered, otherwise they cost nothing more.
+    The observer is called on the thread of the build, after it returned or raised.
+
+    Args:
+        observer (Callable[[BuildStats], Any]):
+            The function to call, an exception raised by it is logged to the `fastconfig` logger,
+            and the build returns or raises as it would without the observer
+    """
+    _OBSERVERS.append(observer)
+
+
+def remove_build_observer(observer: Callable[[BuildStats], Any]) -> None:
+    """Unregister a function registered by `add_build_observer`."""
+    _OBSERVERS.remove(observer)
+
+
+@contextlib.contextmanager
+def record_builds() -> Iterator[list[BuildStats]]:
+    """
+    Collect the statistics of the builds made inside the block, on any thread.
+
+    Yields:
+        list[BuildStats]: the statistics of each build, in order of completion
+    """
+    records: list[BuildStats] = []
+    add_build_observer(records.append)
+    try:
+        yield records
+    finally:
+        remove_build_observer(records.append)
+
+
+class OpenTelemetryObserver:
+    """
+    Report each build as an OpenTelemetry span.
+
+    The span is named `fastconfig.build` and has an event for each phase
+    and for each of the slowest fields. Only the tracer API is used,
+    so this module does not depend on OpenTelemetry.
+
+        from opentelemetry import trace
+
+        add_build_observer(OpenTelemetryObserver(trace.get_tracer("myapp")))
+    """
+
+    def __init__(self, tracer: Any, slowest: int = 5) -> None:
+        """
+        Create an observer starting spans from a tracer.
+
+        Args:
+            tracer (Any):
+                An `opentelemetry.trace.Tracer`, or any object with the same `start_span` method
+            slowest (int):
+                The number of the slowest fields reported as events
+        """
+        self.tracer: Any = tracer
+        self.slowest: int = slowest
+
+    def __call__(self, stats: BuildStats) -> None:
+        """Start and end a span from the statistics of a build."""
+        end_time: int = stats.start_time_ns + int(stats.duration * 1e9)
+        span = self.tracer.start_span(
+            "fastconfig.build",
+            start_time=stats.start_time_ns,
+            attributes={
+                "fastconfig.path": stats.path,
+                "fastconfig.config": stats.config.__qualname__,
+                "fastconfig.bytes_read": stats.bytes_read,
+                "fastconfig.fields_checked": stats.fields_checked,
+            },
+        )
+        # phases interleave (e.g. extract and check), so each event carries its total
+        for phase, seconds in stats.phases.items():
+            span.add_event(
+                f"fastconfig.{phase}",
+                {"fastconfig.duration": seconds},
+                timestamp=end_time,
+            )
+        for name, seconds in stats.slowest(self.slowest):
+            span.add_event(
+                "fastconfig.field",
+                {"fastconfig.field": name, "fastconfig.duration": seconds},
+                timestamp=end_time,
+            )
+        if stats.error is not None:
+            span.record_exception(stats.error, timestamp=end_time)
+        span.end(end_time=end_time)
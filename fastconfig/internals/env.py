@@ -0,0 +1,94 @@
+"""this module provides `_EnvIndex` to override fields from environment variables."""
+import os
+import re
+from typing import Any, Mapping, Optional
+from weakref import WeakKeyDictionary
+
+from fastconfig.exception import UnexpectedValueError
+from fastconfig.internals.plan import _BuildPlan, _FieldPlan
+from fastconfig.internals.type_checker import _INVALID
+
+_INDEXES: "WeakKeyDictionary[type, dict[str, _EnvIndex]]" = WeakKeyDictionary()
+
+_NOT_WORD = re.compile(r"\W")
+
+
+def _env_name(prefix: str, path: tuple[str, ...]) -> str:
+    # `db.primary.host` with `APP_` is `APP_DB__PRIMARY__HOST`
+    return prefix + "__".join(_NOT_WORD.sub("_", str(key)).upper() for key in path)
+
+
+def _coerce(name: str, text: str, plan: _FieldPlan) -> Any:
+    # the text itself first, for str, datetimes and Any
+    value: Any = plan.compiled.validate(text)
+    if value is not _INVALID:
+        return value
+    import json
+
+    try:
+        # numbers, booleans, null, lists and tables
+        parsed: Any = json.loads(text)
+    except ValueError:
+        parsed = _INVALID
+    if parsed is not _INVALID:
+        value = plan.compiled.validate(parsed)
+        if (
+            value is _INVALID
+            and isinstance(parsed, int)
+            and not isinstance(parsed, bool)
+        ):
+            # `1` for a float, but not `true`
+            value = plan.compiled.validate(float(parsed))
+    if value is _INVALID:
+        raise UnexpectedValueError(
+            f"{name}: {text} is not valid type. must be of type {plan.typeinfo}"
+        )
+    return value
+
+
+class _EnvIndex:
+    def __init__(self, prefix: str, names: dict[str, _FieldPlan]) -> None:
+        self.prefix: str = prefix
+        # environment variable name -> field
+        self.names: dict[str, _FieldPlan] = names
+
+    @classmethod
+    def of(cls, config: type, prefix: str) -> "_EnvIndex":
+        # built once per class and prefix from its build plan
+        indexes: Optional[dict[str, _EnvIndex]] = _INDEXES.get(config)
+        if indexes is None:
+            indexes = _INDEXES[config] = {}
+        try:
+            return indexes[prefix]
+        except KeyError:
+            pass
+        # environment variables are upper case by convention, and always on Windows
+        upper: str = prefix.upper()
+        index = cls(
+            upper,
+            {_env_name(upper, f.path): f for f in _BuildPlan.of(config).fields},
+        )
+        indexes[prefix] = index
+        return index
+
+    def read(self, environ: Optional[Mapping[str, str]] = None) -> dict[str, Any]:
+        # field name -> coerced value, of the variables set
+        if environ is None:
+            environ = os.environ
+        # one pass over the smaller side, as listing `os.environ` decodes every name
+        # and looking up a missing name raises KeyError
+        found: list[tuple[str, str]]
+        if len(self.names) < len(environ):
+            found = []
+            for name in self.names:
+                text: Optional[str] = environ.get(name)
+                if text is not None:
+                    found.append((name, text))
+        else:
+            found = [
+                (name, environ[name]) for name in self.names.keys() & environ.keys()
+            ]
+        return {
+            self.names[name].name: _coerce(name, text, self.names[name])
+            for name, text in found
+        }
@@ -1,34 +1,330 @@
 """this module provides `_FileLoader`."""
-import json
-from typing import Any
-
-import toml
+import copy
+import functools
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, NamedTuple, Optional
 
 from fastconfig.exception import InvalidConfigError
+from fastconfig.internals.partial import _key_tree, _KeyTree, _select_json
+from fastconfig.internals.stats import BuildStats, _Phase
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the parsed-document cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+    max_entries: int
+    max_bytes: int
+
+
+def _copy(value: Any) -> Any:
+    # parsed documents only contain dicts, lists and immutable scalars,
+    # subclasses such as the containers of some parsers are deep-copied with their state
+    if type(value) is dict:  # noqa: E721 exact type, subclasses are deep-copied
+        return {k: _copy(v) for k, v in value.items()}
+    elif type(value) is list:  # noqa: E721 exact type, subclasses are deep-copied
+        return [_copy(v) for v in value]
+    elif isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
+
+
+class _ParseCache:
+    def __init__(self, max_entries: int = 128, max_bytes: int = 64 * 1024 * 1024):
+        if max_entries < 1 or max_bytes < 0:
+            raise ValueError("max_entries must be positive and max_bytes non-negative")
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bytes: int = 0
+        # (realpath, st_mtime_ns, st_size, backend) -> parsed document
+        self._entries: "OrderedDict[tuple[str, int, int, str], dict[str, Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def load(
+        self, path: str, backend: str, load: Callable[[str], dict[str, Any]]
+    ) -> dict[str, Any]:
+        realpath: str = os.path.realpath(path)
+        stat = os.stat(realpath)
+        key = (realpath, stat.st_mtime_ns, stat.st_size, backend)
+        with self._lock:
+            document = self._entries.get(key)
+            if document is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if document is not None:
+            return _copy(document)
+
+        document = load(path)
+        after = os.stat(realpath)
+        # do not keep a document if the file was modified while being read
+        if (after.st_mtime_ns, after.st_size) == key[1:3]:
+            self._put(key, document)
+            return _copy(document)
+        return document
+
+    def _put(self, key: tuple[str, int, int, str], document: dict[str, Any]) -> None:
+        size: int = key[2]
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = document
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                evicted, _ = self._entries.popitem(last=False)
+                self.bytes -= evicted[2]
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self.bytes = 0
+                return
+            realpath: str = os.path.realpath(path)
+            for key in [key for key in self._entries if key[0] == realpath]:
+                del self._entries[key]
+                self.bytes -= key[2]
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self.hits,
+                self.misses,
+                len(self._entries),
+                self.bytes,
+                self.max_entries,
+                self.max_bytes,
+            )
+
+
+# process-wide cache shared by every `_FileLoader`, disabled by default
+_PARSE_CACHE: Optional[_ParseCache] = None
+
+
+class _Backend(NamedTuple):
+    name: str
+    # parses the whole content of a file
+    parse: Callable[[bytes], Any]
+    # exceptions raised by `parse` for invalid documents
+    errors: tuple[type[Exception], ...] = (ValueError,)
+
+
+def _rtoml() -> _Backend:
+    import rtoml
+
+    return _Backend(
+        "rtoml", lambda data: rtoml.loads(data.decode()), (rtoml.TomlParsingError,)
+    )
+
+
+def _tomllib() -> _Backend:
+    import tomllib  # type: ignore
+
+    return _Backend(
+        "tomllib", lambda data: tomllib.loads(data.decode()), (tomllib.TOMLDecodeError,)
+    )
+
+
+def _tomli() -> _Backend:
+    import tomli
+
+    return _Backend(
+        "tomli", lambda data: tomli.loads(data.decode()), (tomli.TOMLDecodeError,)
+    )
+
+
+def _toml() -> _Backend:
+    import toml
+
+    return _Backend(
+        "toml", lambda data: toml.loads(data.decode()), (toml.TomlDecodeError,)
+    )
+
+
+def _json() -> _Backend:
+    import json
+
+    return _Backend("json", json.loads, (json.JSONDecodeError,))
+
+
+def _orjson() -> _Backend:
+    import orjson
+
+    fallback: _Backend = _json()
+
+    def parse(data: bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (NaN, integers beyond 64 bits),
+            # and json gives the same error messages whichever backend is installed
+            return fallback.parse(data)
+
+    return _Backend("orjson", parse, fallback.errors)
+
+
+# candidates for each file extension, fastest first. each one is imported on first use
+_CANDIDATES: dict[str, list[Callable[[], _Backend]]] = {
+    ".toml": [_rtoml, _tomllib, _tomli, _toml],
+    ".json": [_orjson, _json],
+}
+# the backend chosen for each file extension
+_BACKENDS: dict[str, _Backend] = {}
+
+
+def register_backend(
+    extension: str,
+    parse: Callable[[bytes], Any],
+    name: Optional[str] = None,
+    errors: tuple[type[Exception], ...] = (ValueError,),
+) -> None:
+    """
+    Register the parser used to read files with the given extension.
+
+    A registered parser takes precedence over the built-in parsers of the extension.
+
+    Args:
+        extension (str):
+            The file extension, such as `.yaml`
+        parse (Callable[[bytes], Any]):
+            A function parsing the whole content of a file. A document which is not a table
+            is available under the `content` key
+        name (Optional[str]):
+            The name of the parser, If nothing is passed, the name of `parse` is used
+        errors (tuple[type[Exception], ...]):
+            The exceptions raised by `parse` for invalid documents, reported as InvalidConfigError
+    """
+    if not extension.startswith("."):
+        extension = f".{extension}"
+    _BACKENDS[extension] = _Backend(
+        name if name is not None else getattr(parse, "__name__", repr(parse)),
+        parse,
+        errors,
+    )
+
+
+def _backend(extension: str) -> Optional[_Backend]:
+    backend: Optional[_Backend] = _BACKENDS.get(extension)
+    if backend is not None:
+        return backend
+    for candidate in _CANDIDATES.get(extension, []):
+        try:
+            backend = candidate()
+        except ImportError:
+            continue
+        _BACKENDS[extension] = backend
+        return backend
+    return None
 
 
 class _FileLoader:
-    def __call__(self, path: str) -> dict[str, Any]:
-        if path.endswith(".json"):
-            return self.load_json(path)
-        elif path.endswith(".toml"):
-            return self.load_toml(path)
-        raise InvalidConfigError("FastConfig only supports json and toml formats now")
-
-    def load_json(self, path: str) -> dict[str, Any]:
+    def __init__(self, stats: Optional[BuildStats] = None) -> None:
+        # the statistics of the build reading the file, if builds are observed
+        self.stats: Optional[BuildStats] = stats
+
+    def __call__(
+        self, path: str, select: Optional[tuple[tuple[str, ...], ...]] = None
+    ) -> dict[str, Any]:
+        # `select` restricts a JSON document to the given key paths
+        extension: str = os.path.splitext(path)[1]
+        backend: _Backend = self.backend(extension)
+        load: Callable[[str], dict[str, Any]] = functools.partial(
+            self.load, backend=backend
+        )
+        name: str = backend.name
+        if select is not None and extension == ".json":
+            tree: _KeyTree = _key_tree(select)
+            load = functools.partial(self.load_selected, backend=backend, tree=tree)
+            name = f"{name}:{sorted(select)}"
+
+        cache: Optional[_ParseCache] = _PARSE_CACHE
+        if cache is None:
+            return load(path)
+        return cache.load(path, name, load)
+
+    def loads(
+        self,
+        path: str,
+        data: bytes,
+        select: Optional[tuple[tuple[str, ...], ...]] = None,
+    ) -> dict[str, Any]:
+        # parses the content already read from `path`, without the parse cache
+        extension: str = os.path.splitext(path)[1]
+        backend: _Backend = self.backend(extension)
+        if select is not None and extension == ".json":
+            return self.select(data, backend, _key_tree(select))
+        return self.parse(data, backend)
+
+    def backend(self, extension: str) -> _Backend:
+        backend: Optional[_Backend] = _backend(extension)
+        if backend is None:
+            raise InvalidConfigError(
+                "FastConfig only supports json and toml formats now"
+            )
+        return backend
+
+    def load(self, path: str, backend: _Backend) -> dict[str, Any]:
+        stats: Optional[BuildStats] = self.stats
+        if stats is None:
+            return self.parse(self.read(path), backend)
+        with _Phase(stats, "read"):
+            data: bytes = self.read(path)
+        stats.bytes_read += len(data)
+        with _Phase(stats, "parse"):
+            return self.parse(data, backend)
+
+    def load_selected(
+        self, path: str, backend: _Backend, tree: _KeyTree
+    ) -> dict[str, Any]:
+        with open(path, "rb") as f:
+            size: int = os.fstat(f.fileno()).st_size
+            if size == 0:
+                # an empty file cannot be mapped, let the parser report it
+                return self.select(b"", backend, tree)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                stats: Optional[BuildStats] = self.stats
+                if stats is None:
+                    return self.select(buffer, backend, tree)
+                # the pages are read while being scanned
+                stats.bytes_read += size
+                with _Phase(stats, "parse"):
+                    return self.select(buffer, backend, tree)
+
+    def read(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def select(self, data: Any, backend: _Backend, tree: _KeyTree) -> dict[str, Any]:
         try:
-            with open(path, "r") as f:
-                config: Any = json.load(f)
-            if not isinstance(config, dict):
-                config = {"content": config}
-            return config
-        except json.decoder.JSONDecodeError as e:
+            config: Optional[dict[str, Any]] = _select_json(data, tree, backend.parse)
+        except UnicodeDecodeError as e:
             raise InvalidConfigError(str(e))
+        except backend.errors as e:
+            raise InvalidConfigError(str(e))
+        if config is None:
+            return self.parse(data[:], backend)
+        return config
 
-    def load_toml(self, path: str) -> dict[str, Any]:
+    def parse(self, data: bytes, backend: _Backend) -> dict[str, Any]:
         try:
-            with open(path, "r") as f:
-                config = toml.load(f)
-        except toml.decoder.TomlDecodeError as e:
+            config: Any = backend.parse(data)
+        except UnicodeDecodeError as e:
+            raise InvalidConfigError(str(e))
+        except backend.errors as e:
             raise InvalidConfigError(str(e))
+        if not isinstance(config, dict):
+            config = {"content": config}
         return config
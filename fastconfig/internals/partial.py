@@ -0,0 +1,183 @@
+"""this module provides `_KeyTree` and `_select_json` to read only some keys of a JSON document."""
+import re
+import sys
+from typing import Any, Callable, Iterable, Optional, Union
+
+from fastconfig.exception import InvalidConfigError
+
+# key -> None to read the whole value, or the keys to read inside it
+_KeyTree = dict[str, Optional["_KeyTree"]]
+
+_Buffer = Union[bytes, memoryview, Any]
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+_SCALAR = re.compile(rb"[^ \t\n\r,\]}]+")
+
+
+def _nested(depth: int, star: bytes, bound: bytes) -> bytes:
+    # everything but brackets, with strings and up to `bound` containers nested up to
+    # `depth` levels deep, unrolled so that there is a single way to match a position
+    plain: bytes = rb'[^"\[\]{}]' + star
+    item: bytes = rb'"[^"\\]' + star + rb'(?:\\.[^"\\]' + star + b")" + star + b'"'
+    if depth:
+        item += rb"|[\[{]" + _nested(depth - 1, star, bound) + rb"[\]}]"
+    return plain + b"(?:(?:" + item + b")" + plain + b")" + bound
+
+
+if sys.version_info >= (3, 11):
+    # a skipped value costs one match per 1024 containers rather than one per bracket.
+    # possessive, so that a container nested deeper or longer than that fails at once,
+    # without backtracking and without keeping state for those already matched
+    _SKIPPED = re.compile(_nested(6, b"*+", b"{0,1024}+"), re.DOTALL)
+else:
+    _SKIPPED = re.compile(_nested(0, b"*", b"*"), re.DOTALL)
+
+
+def _key_tree(paths: Iterable[tuple[str, ...]]) -> _KeyTree:
+    tree: _KeyTree = {}
+    for path in paths:
+        node: _KeyTree = tree
+        for key in path[:-1]:
+            if key in node and node[key] is None:
+                # an ancestor is already read as a whole
+                break
+            node = node.setdefault(key, {})  # type: ignore
+        else:
+            node[path[-1]] = None
+    return tree
+
+
+def _error(buffer: _Buffer, message: str, position: int) -> InvalidConfigError:
+    # same format as the json module
+    line: int = buffer[:position].count(b"\n") + 1
+    column: int = position - (buffer[:position].rfind(b"\n") + 1) + 1
+    return InvalidConfigError(
+        f"{message}: line {line} column {column} (char {position})"
+    )
+
+
+def _skip(buffer: _Buffer, position: int) -> int:
+    char: bytes = buffer[position : position + 1]
+    if char == b'"':
+        match = _STRING.match(buffer, position)
+        if match is None:
+            raise _error(buffer, "Unterminated string starting at", position)
+        return match.end()
+    if char != b"{" and char != b"[":
+        match = _SCALAR.match(buffer, position)
+        if match is None:
+            raise _error(buffer, "Expecting value", position)
+        return match.end()
+    return _close(buffer, position + 1, position)
+
+
+def _close(buffer: _Buffer, position: int, start: int) -> int:
+    # the end of the container opened at `start`, `position` being inside it at its top level
+    depth: int = 1
+    while True:
+        position = _SKIPPED.match(buffer, position).end()  # type: ignore
+        char: bytes = buffer[position : position + 1]
+        if char == b"{" or char == b"[":
+            depth += 1
+        elif char == b"}" or char == b"]":
+            depth -= 1
+            if depth == 0:
+                return position + 1
+        elif char == b'"':
+            match = _STRING.match(buffer, position)
+            if match is None:
+                raise _error(buffer, "Unterminated string starting at", position)
+            position = match.end()
+            continue
+        else:
+            raise _error(buffer, "Unterminated value starting at", start)
+        position += 1
+
+
+def _key(raw: bytes) -> str:
+    if b"\\" in raw:
+        import json
+
+        return json.loads(raw)
+    return raw[1:-1].decode()
+
+
+def _select_object(
+    buffer: _Buffer,
+    position: int,
+    tree: _KeyTree,
+    parse: Callable[[bytes], Any],
+    last: bool,
+) -> tuple[dict[str, Any], Optional[int]]:
+    # `position` is at the opening brace. the end is None once every key of `tree` is read
+    # if `last`, i.e. nothing else is read after this object, so the scan stops there
+    start: int = position
+    result: dict[str, Any] = {}
+    # read the first time they appear, a key repeated later is skipped
+    pending: set[str] = set(tree)
+    position = _WHITESPACE.match(buffer, position + 1).end()  # type: ignore
+    if buffer[position : position + 1] == b"}":
+        return result, position + 1
+
+    while True:
+        match = _STRING.match(buffer, position)
+        if match is None:
+            raise _error(
+                buffer, "Expecting property name enclosed in double quotes", position
+            )
+        key: str = _key(match.group())
+        position = _WHITESPACE.match(buffer, match.end()).end()  # type: ignore
+        if buffer[position : position + 1] != b":":
+            raise _error(buffer, "Expecting ':' delimiter", position)
+        position = _WHITESPACE.match(buffer, position + 1).end()  # type: ignore
+
+        if key in pending:
+            pending.discard(key)
+            subtree: Optional[_KeyTree] = tree[key]
+            if subtree is None:
+                end: int = _skip(buffer, position)
+                result[key] = parse(buffer[position:end])
+                position = end
+            elif buffer[position : position + 1] == b"{":
+                result[key], closed = _select_object(
+                    buffer, position, subtree, parse, last and not pending
+                )
+                if closed is None:
+                    return result, None
+                position = closed
+            else:
+                # not a table, so none of the keys below it exist
+                position = _skip(buffer, position)
+            if not pending:
+                if last:
+                    return result, None
+                return result, _close(buffer, position, start)
+        else:
+            position = _skip(buffer, position)
+
+        position = _WHITESPACE.match(buffer, position).end()  # type: ignore
+        char: bytes = buffer[position : position + 1]
+        if char == b",":
+            position = _WHITESPACE.match(buffer, position + 1).end()  # type: ignore
+        elif char == b"}":
+            return result, position + 1
+        else:
+            raise _error(buffer, "Expecting ',' delimiter", position)
+
+
+def _select_json(
+    buffer: _Buffer, tree: _KeyTree, parse: Callable[[bytes], Any]
+) -> Optional[dict[str, Any]]:
+    # None if the document is not an object
+    position: int = _WHITESPACE.match(buffer).end()  # type: ignore
+    if buffer[position : position + 1] != b"{":
+        return None
+    result, end = _select_object(buffer, position, tree, parse, True)
+    if end is None:
+        # the rest of the document is not read
+        return result
+    position = _WHITESPACE.match(buffer, end).end()  # type: ignore
+    if position != len(buffer):
+        raise _error(buffer, "Extra data", position)
+    return result
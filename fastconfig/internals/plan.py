@@ -0,0 +1,121 @@
+"""this module provides _BuildPlan."""
+import sys
+from dataclasses import MISSING, Field, dataclass, fields, is_dataclass
+from typing import Any, Callable, List, Union, get_args, get_type_hints
+from weakref import WeakKeyDictionary
+
+from fastconfig.internals.type_checker import _array, _compile, _Compiled
+
+_PLANS: "WeakKeyDictionary[type, _BuildPlan]" = WeakKeyDictionary()
+
+# key -> (the names of the fields at the key, the keys below it)
+_FieldTree = dict[str, tuple[list[str], "_FieldTree"]]
+
+
+def _dataclasses(typeinfo: Any) -> tuple[type, ...]:
+    # the nested sections of a type hint, e.g. `Db` of `Optional[list[Db]]`
+    if isinstance(typeinfo, type) and is_dataclass(typeinfo):
+        return (typeinfo,)
+    return tuple(ty for arg in get_args(typeinfo) for ty in _dataclasses(arg))
+
+
+@dataclass(frozen=True)
+class _FieldPlan:
+    name: str
+    section: Union[str, List[str]]
+    path: tuple[str, ...]
+    typeinfo: Any
+    compiled: _Compiled
+    required: bool
+    default: Any = MISSING
+    default_factory: Callable[[], Any] = MISSING  # type: ignore
+    # the FastConfig and dataclass types of the sections in the field
+    nested: tuple[type, ...] = ()
+    # the dtype of `fc_field(as_array=...)`
+    as_array: Any = None
+
+    @classmethod
+    def from_field(cls, name: str, f: Field, typeinfo: Any = MISSING) -> "_FieldPlan":
+        metadata: dict[str, Any] = dict(f.metadata) if hasattr(f, "metadata") else {}
+        separator: str = metadata["separator"] if "separator" in metadata else "."
+        section: Union[str, List[str]] = (
+            metadata["key"].split(separator) if "key" in metadata else name
+        )
+        if typeinfo is MISSING:
+            typeinfo = f.type
+        as_array: Any = metadata.get("as_array")
+        return cls(
+            # the same object as the parameter of `__init__`, so that `config(**args)`
+            # matches the keywords by identity, also for classes from `make_dataclass`
+            name=sys.intern(name),
+            section=section,
+            path=tuple(section) if isinstance(section, list) else (section,),
+            typeinfo=typeinfo,
+            compiled=_compile(typeinfo) if as_array is None else _array(as_array),
+            required=f.default is MISSING and f.default_factory is MISSING,
+            default=f.default,
+            default_factory=f.default_factory,
+            nested=_dataclasses(typeinfo),
+            as_array=as_array,
+        )
+
+
+def _field_tree(plans: tuple[_FieldPlan, ...]) -> _FieldTree:
+    root: _FieldTree = {}
+    for f in plans:
+        node: _FieldTree = root
+        for key in f.path[:-1]:
+            node = node.setdefault(key, ([], {}))[1]
+        node.setdefault(f.path[-1], ([], {}))[0].append(f.name)
+    return root
+
+
+def _changed(
+    tree: _FieldTree, setting: Any, previous: Any, names: list[str]
+) -> list[str]:
+    # the fields whose keys differ between two settings, comparing whole tables first
+    for key, (fields_at, below) in tree.items():
+        value: Any = setting.get(key) if isinstance(setting, dict) else None
+        if value is None:
+            # missing values are not applied
+            continue
+        before: Any = previous.get(key) if isinstance(previous, dict) else None
+        if value is before or value == before:
+            continue
+        names.extend(fields_at)
+        if below:
+            _changed(below, value, before, names)
+    return names
+
+
+@dataclass(frozen=True)
+class _BuildPlan:
+    fields: tuple[_FieldPlan, ...]
+    by_name: dict[str, _FieldPlan]
+    tree: _FieldTree
+
+    @classmethod
+    def of(cls, config: type) -> "_BuildPlan":
+        # compiled once per class, then shared by build, _update and to_dict
+        try:
+            return _PLANS[config]
+        except KeyError:
+            pass
+        plan = cls.compile(config)
+        _PLANS[config] = plan
+        return plan
+
+    @classmethod
+    def compile(cls, config: type) -> "_BuildPlan":
+        try:
+            hints: dict[str, Any] = get_type_hints(config)
+        except Exception:
+            # unresolvable forward references, fall back to the raw annotations
+            hints = {}
+        plans: tuple[_FieldPlan, ...] = tuple(
+            _FieldPlan.from_field(f.name, f, hints.get(f.name, f.type))
+            for f in fields(config)
+        )
+        return cls(
+            fields=plans, by_name={f.name: f for f in plans}, tree=_field_tree(plans)
+        )
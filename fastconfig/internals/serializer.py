@@ -0,0 +1,256 @@
+"""this module provides `_Serializer` to write instances as dict, JSON or TOML."""
+import functools
+import math
+import re
+from dataclasses import is_dataclass
+from datetime import date, time
+from typing import Any, Callable, Optional, Union
+from weakref import WeakKeyDictionary
+
+from fastconfig.internals.plan import _BuildPlan
+
+# (key, the name of a field or the keys below it)
+_Tree = tuple[tuple[str, Union[str, "_Tree"]], ...]
+
+# (text before the value, field name, newline and indent of the value), trailing text
+_JsonTemplate = tuple[tuple[tuple[str, str, str], ...], str]
+_TomlTemplate = tuple[tuple[str, str, str], ...]
+
+_SERIALIZERS: "WeakKeyDictionary[type, _Serializer]" = WeakKeyDictionary()
+
+_BARE_KEY = re.compile(r"[A-Za-z0-9_-]+")
+
+
+def _tree(plan: _BuildPlan) -> _Tree:
+    # the last field wins when a key is both a value and a table
+    root: dict[str, Any] = {}
+    for f in plan.fields:
+        node: dict[str, Any] = root
+        for key in f.path[:-1]:
+            if not isinstance(node.get(key), dict):
+                node[key] = {}
+            node = node[key]
+        node[f.path[-1]] = f.name
+
+    def freeze(node: dict[str, Any]) -> _Tree:
+        return tuple(
+            (key, child if isinstance(child, str) else freeze(child))
+            for key, child in node.items()
+        )
+
+    return freeze(root)
+
+
+def _to_dict(
+    tree: _Tree, instance: Any, get: Callable[[Any, str], Any] = getattr
+) -> dict[str, Any]:
+    return {
+        key: get(instance, child)  # type: ignore
+        if isinstance(child, str)
+        else _to_dict(child, instance, get)  # type: ignore
+        for key, child in tree
+    }
+
+
+def _plain(value: Any) -> Any:
+    # nested sections as dicts, in lists and dicts too
+    if is_dataclass(value) and not isinstance(value, type):
+        return _Serializer.of(type(value)).to_dict(value)
+    elif isinstance(value, list):
+        return [_plain(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    elif is_dataclass(value) and not isinstance(value, type):
+        return _Serializer.of(type(value)).to_dict(value)
+    elif hasattr(value, "tolist"):
+        # array.array and numpy arrays
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@functools.lru_cache(maxsize=None)
+def _json_encoder(indent: Optional[int]) -> Any:
+    import json
+
+    return json.JSONEncoder(indent=indent, default=_json_default)
+
+
+def _toml_key(key: str) -> str:
+    if _BARE_KEY.fullmatch(key):
+        return key
+    import json
+
+    return json.dumps(key, ensure_ascii=False)
+
+
+def _toml_value(value: Any) -> str:
+    if value is True:
+        return "true"
+    elif value is False:
+        return "false"
+    elif isinstance(value, str):
+        from json.encoder import encode_basestring
+
+        # the escapes of JSON strings are valid in TOML basic strings
+        return encode_basestring(value)
+    elif isinstance(value, int):
+        return str(value)
+    elif isinstance(value, float):
+        if math.isnan(value):
+            return "nan"
+        elif math.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return repr(value)
+    elif isinstance(value, (date, time)):
+        # datetime is a subclass of date
+        return value.isoformat()
+    elif isinstance(value, (list, tuple)):
+        return f"[{', '.join(_toml_value(v) for v in value)}]"
+    elif isinstance(value, dict):
+        items: str = ", ".join(
+            f"{_toml_key(str(k))} = {_toml_value(v)}"
+            for k, v in value.items()
+            if v is not None
+        )
+        return f"{{{items}}}" if items else "{}"
+    elif is_dataclass(value) and not isinstance(value, type):
+        return _toml_value(_Serializer.of(type(value)).to_dict(value))
+    elif hasattr(value, "tolist"):
+        return _toml_value(value.tolist())
+    elif value is None:
+        raise ValueError("None cannot be written to TOML in an array")
+    raise TypeError(f"Object of type {type(value).__name__} is not TOML serializable")
+
+
+def _json_template(tree: _Tree, indent: Optional[int]) -> _JsonTemplate:
+    # the text around each field, with the keys and punctuation written out once
+    import json
+
+    ops: list[tuple[str, str, str]] = []
+    pending: list[str] = []
+
+    def walk(tree: _Tree, depth: int) -> None:
+        if not tree:
+            pending.append("{}")
+            return
+        inner: str = "" if indent is None else "\n" + " " * (indent * (depth + 1))
+        outer: str = "" if indent is None else "\n" + " " * (indent * depth)
+        separator: str = ", " if indent is None else ","
+        pending.append("{")
+        for i, (key, child) in enumerate(tree):
+            pending.append(f"{separator if i else ''}{inner}{json.dumps(key)}: ")
+            if isinstance(child, str):
+                ops.append(("".join(pending), child, inner))  # type: ignore
+                pending.clear()
+            else:
+                walk(child, depth + 1)  # type: ignore
+        pending.append(outer + "}")
+
+    walk(tree, 0)
+    return tuple(ops), "".join(pending)
+
+
+def _toml_template(tree: _Tree) -> _TomlTemplate:
+    # (text before the line, "key = " of the line, field name),
+    # the values of a table come before its subtables
+    ops: list[tuple[str, str, str]] = []
+
+    def walk(tree: _Tree, table: tuple[str, ...]) -> None:
+        header: str = ""
+        if table:
+            header = f"[{'.'.join(map(_toml_key, table))}]\n"
+            # separated from the lines above it
+            header = "\n" + header if ops else header
+        tables: list[tuple[str, _Tree]] = []
+        for key, child in tree:
+            if isinstance(child, str):
+                ops.append((header, f"{_toml_key(key)} = ", child))  # type: ignore
+                header = ""
+            else:
+                tables.append((key, child))  # type: ignore
+        if header:
+            # a table without values is still written
+            ops.append((header, "", ""))
+        for key, child in tables:
+            walk(child, table + (key,))
+
+    walk(tree, ())
+    return tuple(ops)
+
+
+class _Serializer:
+    def __init__(self, tree: _Tree, nested: frozenset[str] = frozenset()) -> None:
+        self.tree: _Tree = tree
+        # the fields holding sections, converted to dicts by `to_dict`
+        self.nested: frozenset[str] = nested
+        # compiled on first use, by indent
+        self.json: dict[Optional[int], _JsonTemplate] = {}
+        self.toml: Optional[_TomlTemplate] = None
+
+    @classmethod
+    def of(cls, config: type) -> "_Serializer":
+        # built once per class from its build plan
+        try:
+            return _SERIALIZERS[config]
+        except KeyError:
+            pass
+        plan: _BuildPlan = _BuildPlan.of(config)
+        serializer = cls(
+            _tree(plan), frozenset(f.name for f in plan.fields if f.nested)
+        )
+        _SERIALIZERS[config] = serializer
+        return serializer
+
+    def to_dict(self, instance: Any) -> dict[str, Any]:
+        if not self.nested:
+            return _to_dict(self.tree, instance)
+        nested: frozenset[str] = self.nested
+
+        def get(instance: Any, name: str) -> Any:
+            value: Any = getattr(instance, name)
+            return _plain(value) if name in nested else value
+
+        return _to_dict(self.tree, instance, get)
+
+    def write_json(
+        self, instance: Any, write: Callable[[str], Any], indent: Optional[int] = None
+    ) -> None:
+        # imported on first use like the parsers, to keep `import fastconfig` fast
+        from json.encoder import encode_basestring_ascii
+
+        try:
+            ops, tail = self.json[indent]
+        except KeyError:
+            ops, tail = self.json[indent] = _json_template(self.tree, indent)
+        encode: Callable[[Any], str] = _json_encoder(indent).encode
+        for text, name, newline in ops:
+            write(text)
+            value: Any = getattr(instance, name)
+            kind: type = type(value)
+            if kind is str:
+                write(encode_basestring_ascii(value))
+            elif kind is int:
+                write(int.__repr__(value))
+            elif indent is None:
+                write(encode(value))
+            else:
+                # indent the lines of a nested value by the depth of its key
+                write(encode(value).replace("\n", newline))
+        write(tail)
+
+    def write_toml(self, instance: Any, write: Callable[[str], Any]) -> None:
+        if self.toml is None:
+            self.toml = _toml_template(self.tree)
+        for header, key, name in self.toml:
+            if header:
+                write(header)
+            if key:
+                value: Any = getattr(instance, name)
+                if value is not None:
+                    write(f"{key}{_toml_value(value)}\n")
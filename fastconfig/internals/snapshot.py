@@ -0,0 +1,94 @@
+"""this module provides `_SnapshotCache` to keep validated field values between processes."""
+import hashlib
+import os
+import pickle
+import sys
+from typing import Any, Iterable, Optional
+
+from fastconfig.internals.plan import _BuildPlan
+from fastconfig.version import VERSION
+
+_PROTOCOL: int = pickle.HIGHEST_PROTOCOL
+
+
+def _schema(plan: _BuildPlan, seen: tuple[_BuildPlan, ...] = ()) -> str:
+    # everything deciding which values a field accepts, defaults are applied on load
+    seen += (plan,)
+    return repr(
+        [
+            (
+                f.name,
+                f.path,
+                repr(f.typeinfo),
+                repr(f.as_array),
+                f.required,
+                # the fields of nested sections, a recursive type only once
+                [
+                    _schema(_BuildPlan.of(ty), seen)
+                    for ty in f.nested
+                    if _BuildPlan.of(ty) not in seen
+                ],
+            )
+            for f in plan.fields
+        ]
+    )
+
+
+class _SnapshotCache:
+    # loading a snapshot unpickles it, which runs code chosen by whoever wrote the file,
+    # so the directory must be writable only by the user building the config
+    def __init__(self, directory: str) -> None:
+        self.directory: str = directory
+
+    def key(self, content: bytes, config: type, overridden: Iterable[str] = ()) -> str:
+        # fields overridden by the environment are left out of the values
+        digest = hashlib.sha256()
+        for part in (
+            hashlib.sha256(content).hexdigest(),
+            f"{config.__module__}:{config.__qualname__}",
+            _schema(_BuildPlan.of(config)),
+            VERSION,
+            f"{sys.version_info[:2]}:{_PROTOCOL}",
+            *sorted(overridden),
+        ):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.snapshot")
+
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        try:
+            with open(self.path(key), "rb") as f:
+                stored_key, values = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # truncated by a crash, written by another version, or a class that moved:
+            # rebuilt and overwritten by the caller
+            return None
+        if stored_key != key or not isinstance(values, dict):
+            return None
+        return values
+
+    def store(self, key: str, values: dict[str, Any]) -> None:
+        # written to a temporary file and renamed, so that processes starting at once
+        # never read a partial snapshot, and the last identical write wins
+        import tempfile
+
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".", suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, values), f, _PROTOCOL)
+            os.replace(tmp, self.path(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            # a snapshot is only an optimization, the build itself succeeded
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
@@ -0,0 +1,73 @@
+"""this module provides `BuildStats` and the observers of builds."""
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+# called with the statistics of every build, builds are not measured while it is empty
+_OBSERVERS: list[Callable[["BuildStats"], Any]] = []
+
+
+@dataclass
+class BuildStats:
+    """
+    The statistics of a `FastConfig.build` call.
+
+    Phases are `read`, `parse`, `env`, `snapshot`, `extract`, `check` and `construct`,
+    and only the phases the build went through are present.
+    A build served by the parse cache has neither `read` nor `parse`.
+    """
+
+    path: str
+    config: type
+    # wall time of the build in time.time_ns(), for exporters
+    start_time_ns: int = field(default_factory=time.time_ns)
+    # seconds
+    duration: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
+    bytes_read: int = 0
+    fields_checked: int = 0
+    # seconds spent extracting and checking each field
+    field_times: dict[str, float] = field(default_factory=dict)
+    error: Optional[BaseException] = None
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time to a phase."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def slowest(self, n: int = 5) -> list[tuple[str, float]]:
+        """Return the `n` fields that took the longest to extract and check, slowest first."""
+        return sorted(self.field_times.items(), key=lambda item: -item[1])[:n]
+
+
+class _Phase:
+    # a context manager adding the time of its block to a phase
+    __slots__ = ("stats", "phase", "started")
+
+    def __init__(self, stats: BuildStats, phase: str) -> None:
+        self.stats: BuildStats = stats
+        self.phase: str = phase
+        self.started: float = 0.0
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *args: Any) -> None:
+        self.stats.add(self.phase, time.perf_counter() - self.started)
+
+
+def _phase(stats: Optional[BuildStats], phase: str) -> Any:
+    return contextlib.nullcontext() if stats is None else _Phase(stats, phase)
+
+
+def _notify(stats: BuildStats) -> None:
+    for observer in list(_OBSERVERS):
+        try:
+            observer(stats)
+        except Exception:
+            # instrumentation never changes the result or the error of a build
+            import logging
+
+            logging.getLogger("fastconfig").exception(
+                "build observer %r failed for %s", observer, stats.path
+            )
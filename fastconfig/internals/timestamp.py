@@ -0,0 +1,107 @@
+"""this module provides _parse_datetime, parsing RFC 3339 and ISO 8601 date-times."""
+import datetime
+import re
+from typing import Optional
+
+# the strings parsed last, lists of schedules repeat a few timestamps many times.
+# cleared when full, which costs less on a miss than the bookkeeping of an LRU cache
+_MEMO: dict[str, datetime.datetime] = {}
+_MEMO_SIZE = 4096
+
+# the common fixed-width layouts by length, and whether they end with `Z`:
+# `2024-01-01`, `2024-01-01T12:00:00` with .000 or .000000, then with `Z` or `+09:00`
+_LAYOUTS: dict[int, bool] = {
+    10: False,
+    19: False,
+    23: False,
+    26: False,
+    20: True,
+    24: True,
+    27: True,
+    25: False,
+    29: False,
+    32: False,
+}
+
+# RFC 3339, also allowing a comma, no seconds and offsets without a colon like ISO 8601
+_RFC3339 = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[Tt ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d+))?)?"
+    r"(?:([Zz])|([+-])(\d{2})(?::?(\d{2}))?)?)?",
+    re.ASCII,
+)
+
+_fromisoformat = datetime.datetime.fromisoformat
+
+
+def _parse_datetime(text: str) -> Optional[datetime.datetime]:
+    # the date-time of a string, or None if it is not one
+    value: Optional[datetime.datetime] = _MEMO.get(text)
+    if value is not None:
+        return value
+
+    zulu: Optional[bool] = _LAYOUTS.get(len(text))
+    try:
+        # `fromisoformat` parses these layouts in C on every Python version,
+        # except `Z` before 3.11
+        if zulu is False:
+            value = _fromisoformat(text)
+        elif zulu and text[-1] in "Zz":
+            # `replace(tzinfo=...)` takes several times longer than parsing
+            value = _fromisoformat(text[:-1] + "+00:00")
+    except ValueError:
+        pass
+    if value is None:
+        value = _parse_rfc3339(text)
+        if value is None:
+            return None
+
+    if len(_MEMO) >= _MEMO_SIZE:
+        _MEMO.clear()
+    _MEMO[text] = value
+    return value
+
+
+def _parse_rfc3339(text: str) -> Optional[datetime.datetime]:
+    match = _RFC3339.fullmatch(text)
+    if match is None:
+        # other ISO 8601 forms, as accepted by the running Python version
+        try:
+            return _fromisoformat(text)
+        except ValueError:
+            return None
+
+    (
+        year,
+        month,
+        day,
+        hour,
+        minute,
+        second,
+        fraction,
+        z,
+        sign,
+        hours,
+        minutes,
+    ) = match.groups()
+    try:
+        tzinfo: Optional[datetime.tzinfo] = None
+        if z is not None:
+            tzinfo = datetime.timezone.utc
+        elif sign is not None:
+            offset = datetime.timedelta(hours=int(hours), minutes=int(minutes or 0))
+            tzinfo = datetime.timezone(-offset if sign == "-" else offset)
+        return datetime.datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            # digits after microseconds are truncated
+            int((fraction or "")[:6].ljust(6, "0")),
+            tzinfo,
+        )
+    except ValueError:
+        # e.g. a leap second, which `datetime` cannot represent
+        return None
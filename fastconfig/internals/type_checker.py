@@ -1,19 +1,337 @@
 """this module provides _TypeChecker."""
+import array
 import datetime
+import functools
+from dataclasses import is_dataclass
 from types import GenericAlias
-from typing import Any, Type, Union, _SpecialForm, get_args, get_origin
+from typing import (
+    Any,
+    Callable,
+    NamedTuple,
+    Optional,
+    Type,
+    Union,
+    _SpecialForm,
+    get_args,
+    get_origin,
+)
 
-from fastconfig.exception import UnexpectedValueError
+from fastconfig.exception import InvalidConfigError, UnexpectedValueError
+from fastconfig.internals.timestamp import _parse_datetime
 
 DATE_TYPES = [datetime.datetime, datetime.date, datetime.time]
 
+# the typecodes of `array.array` for numbers, other dtypes are numpy's
+_TYPECODES = "bBhHiIlLqQfd"
+
+# returned by compiled validators instead of a value when the check fails
+_INVALID: Any = object()
+
+
+class _Compiled(NamedTuple):
+    # returns the (possibly converted) value, or `_INVALID`
+    validate: Callable[[Any], Any]
+    # whether `validate` may return another object than the one it was given
+    converts: bool = False
+    # set when `validate(value)` is exactly `isinstance(value, classes)`
+    classes: Optional[tuple[type, ...]] = None
+
+
+# compiled validators by type hint, shared by the build plans of every class.
+# not weak keys, the validator of a dataclass refers to the class and would keep it alive.
+# cleared when full instead, so that dynamically created classes are released like their plans
+_VALIDATORS: dict[Any, tuple[Any, _Compiled]] = {}
+_VALIDATORS_SIZE = 1024
+
+
+def _compile(typeinfo: Any) -> _Compiled:
+    try:
+        cached = _VALIDATORS.get(typeinfo)
+    except TypeError:
+        # unhashable type hint
+        return _build(typeinfo)
+    # `Union` compares equal regardless of the order of its arguments,
+    # but the first matching argument decides the converted value
+    if cached is not None and (
+        cached[0] is typeinfo or repr(cached[0]) == repr(typeinfo)
+    ):
+        return cached[1]
+    compiled = _build(typeinfo)
+    if len(_VALIDATORS) >= _VALIDATORS_SIZE:
+        _VALIDATORS.clear()
+    _VALIDATORS[typeinfo] = (typeinfo, compiled)
+    return compiled
+
+
+def _build(typeinfo: Any) -> _Compiled:
+    if typeinfo is Any:
+        return _isinstance((object,))
+
+    outside = get_origin(typeinfo)
+    if outside is None:
+        if any(typeinfo is ty for ty in DATE_TYPES):
+            return _date_time(typeinfo)
+        if isinstance(typeinfo, type) and is_dataclass(typeinfo):
+            return _dataclass(typeinfo)
+        if typeinfo is array.array:
+            return _array("d")
+        if _is_ndarray(typeinfo):
+            return _array("float64")
+        return _isinstance(typeinfo)
+
+    types = get_args(typeinfo)
+    if outside == Union:
+        return _union(tuple(_compile(ty) for ty in types))
+    elif outside == dict:
+        k, v = types
+        return _dict(_compile(k), _compile(v))
+    elif outside == list:
+        return _list(_compile(types[0]))
+    elif _is_ndarray(outside):
+        # `numpy.typing.NDArray[numpy.int64]` is `ndarray[Any, dtype[int64]]`
+        scalar = get_args(types[1]) if len(types) > 1 else ()
+        return _array(scalar[0] if scalar and scalar[0] is not Any else "float64")
+
+    def unsupported(value: Any) -> Any:
+        raise UnexpectedValueError(f"{typeinfo} is not supported")
+
+    return _Compiled(unsupported)
+
+
+def _isinstance(classes: Any) -> _Compiled:
+    def validate(value: Any) -> Any:
+        return value if isinstance(value, classes) else _INVALID
+
+    return _Compiled(
+        validate,
+        classes=classes if isinstance(classes, tuple) else (classes,),
+    )
+
+
+def _dataclass(config: type) -> _Compiled:
+    # a section built from its table, with the cached build plan of its class
+    def validate(value: Any) -> Any:
+        if isinstance(value, config):
+            return value
+        if not isinstance(value, dict):
+            return _INVALID
+        # the validator depends on this module
+        from fastconfig.internals.validator import _build_section
+
+        return _build_section(config, value)
+
+    return _Compiled(validate, converts=True)
+
+
+def _is_ndarray(typeinfo: Any) -> bool:
+    # without importing numpy
+    return (
+        getattr(typeinfo, "__module__", None) == "numpy"
+        and getattr(typeinfo, "__name__", None) == "ndarray"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _array(dtype: Any) -> _Compiled:
+    # a list of numbers as a contiguous array, checked and converted by a single C call
+    if isinstance(dtype, str) and dtype in _TYPECODES:
+        return _typed_array(dtype)
+    return _ndarray(dtype)
+
+
+def _typed_array(typecode: str) -> _Compiled:
+    def validate(value: Any) -> Any:
+        if isinstance(value, array.array):
+            return value if value.typecode == typecode else _INVALID
+        if not isinstance(value, list):
+            return _INVALID
+        try:
+            # rejects strings, and floats or out of range numbers for integer typecodes
+            return array.array(typecode, value)
+        except (TypeError, OverflowError):
+            return _INVALID
+
+    return _Compiled(validate, converts=True)
+
+
+def _ndarray(dtype: Any) -> _Compiled:
+    try:
+        import numpy
+    except ImportError:
+        raise InvalidConfigError(
+            f"as_array={dtype!r} requires numpy, which is not installed"
+        ) from None
+    try:
+        target = numpy.dtype(dtype)
+    except TypeError as e:
+        raise InvalidConfigError(f"as_array={dtype!r} is not a dtype: {e}") from None
+
+    def validate(value: Any) -> Any:
+        if not isinstance(value, (list, numpy.ndarray)):
+            return _INVALID
+        try:
+            source = numpy.asarray(value)
+        except ValueError:
+            # nested lists of different lengths
+            return _INVALID
+        # booleans, integers and floats, not strings nor objects (e.g. too large integers)
+        if source.dtype.kind not in "biuf":
+            return _INVALID
+        if source.dtype == target:
+            return source
+        # no floats for integers
+        if not numpy.can_cast(source.dtype, target, "same_kind"):
+            return _INVALID
+        result = source.astype(target)
+        if target.kind in "iu" and not numpy.array_equal(result, source):
+            # out of range
+            return _INVALID
+        return result
+
+    return _Compiled(validate, converts=True)
+
+
+def _union(members: tuple[_Compiled, ...]) -> _Compiled:
+    if all(m.classes is not None and not m.converts for m in members):
+        return _isinstance(tuple(ty for m in members for ty in m.classes))  # type: ignore
+
+    def validate(value: Any) -> Any:
+        for member in members:
+            result = member.validate(value)
+            if result is not _INVALID:
+                return result
+        return _INVALID
+
+    return _Compiled(validate, converts=any(m.converts for m in members))
+
+
+def _elements(inner: _Compiled) -> Callable[[Any], Any]:
+    # validate every element of a collection at once.
+    # returns a list of converted elements, True if nothing needs to be converted,
+    # or `_INVALID`
+    classes = inner.classes
+    if classes is not None:
+        if object in classes:
+            return lambda values: True
+
+        def by_type(values: Any) -> Any:
+            # a single pass collecting the distinct element types,
+            # then one subclass check per type instead of one per element
+            for ty in set(map(type, values)):
+                if not issubclass(ty, classes):  # type: ignore
+                    return _INVALID
+            return True
+
+        return by_type
+
+    check = inner.validate
+    if not inner.converts:
+
+        def each(values: Any) -> Any:
+            for val in values:
+                if check(val) is _INVALID:
+                    return _INVALID
+            return True
+
+        return each
+
+    def convert(values: Any) -> Any:
+        results = list(map(check, values))
+        for result in results:
+            if result is _INVALID:
+                return _INVALID
+        return results
+
+    return convert
+
+
+def _list(content: _Compiled) -> _Compiled:
+    elements = _elements(content)
+
+    def validate(value: Any) -> Any:
+        if not isinstance(value, list):
+            return _INVALID
+        result = elements(value)
+        if result is True or result is _INVALID:
+            return value if result is True else _INVALID
+        return result
+
+    return _Compiled(validate, converts=content.converts)
+
+
+def _dict(key: _Compiled, val: _Compiled) -> _Compiled:
+    keys, values = _elements(key), _elements(val)
+
+    def validate(value: Any) -> Any:
+        if not isinstance(value, dict):
+            return _INVALID
+        converted_keys = keys(value.keys())
+        if converted_keys is _INVALID:
+            return _INVALID
+        converted_values = values(value.values())
+        if converted_values is _INVALID:
+            return _INVALID
+        if converted_keys is True and converted_values is True:
+            return value
+        return dict(
+            zip(
+                value.keys() if converted_keys is True else converted_keys,
+                value.values() if converted_values is True else converted_values,
+            )
+        )
+
+    return _Compiled(validate, converts=key.converts or val.converts)
+
+
+def _date_time(typeinfo: Any) -> _Compiled:
+    if typeinfo is not datetime.datetime:
+        return _Compiled(
+            lambda value: _convert_datetime(value, typeinfo), converts=True
+        )
+
+    def validate(value: Any) -> Any:
+        # strings first, as in a list of timestamps
+        if isinstance(value, str):
+            parsed = _parse_datetime(value)
+            return _INVALID if parsed is None else parsed
+        return _convert_datetime(value, typeinfo)
+
+    return _Compiled(validate, converts=True)
+
+
+def _convert_datetime(value: Any, typeinfo: Any) -> Any:
+    if type(value) is typeinfo:
+        return value
+
+    if isinstance(value, str):
+        if typeinfo is datetime.time:
+            return _INVALID
+        value = _parse_datetime(value)
+        if value is None:
+            return _INVALID
+
+    if not isinstance(value, datetime.datetime):
+        return _INVALID
+
+    if typeinfo is datetime.date:
+        return value.date()
+    elif typeinfo is datetime.time:
+        return value.time()
+    return value
+
 
 class _TypeChecker:
     def __call__(
-        self, key: str, value: Any, typeinfo: Union[type, GenericAlias, _SpecialForm]
+        self,
+        key: str,
+        value: Any,
+        typeinfo: Union[type, GenericAlias, _SpecialForm],
+        compiled: Optional[_Compiled] = None,
     ) -> Any:
-        self.value = value
-        if not self.check(key, value, typeinfo):
+        if compiled is None:
+            compiled = _compile(typeinfo)
+        self.value = compiled.validate(value)
+        if self.value is _INVALID:
             raise UnexpectedValueError(
                 f"{key}: {value} is not valid type. must be of type {typeinfo}"
             )
@@ -22,39 +340,11 @@ class _TypeChecker:
     def check(
         self, key: str, value: Any, typeinfo: Union[type, GenericAlias, _SpecialForm]
     ) -> bool:
-        if typeinfo == Any:
-            return True
-        outside = get_origin(typeinfo)
-        if outside is None:
-            if any(typeinfo is ty for ty in DATE_TYPES):
-                return self.check_datetime(value, typeinfo)  # type: ignore
-            return isinstance(value, typeinfo)  # type: ignore
-        return self.check_origin(key, value, typeinfo)
-
-    def check_origin(
-        self,
-        key: str,
-        value: Any,
-        typeinfo: Union[type, GenericAlias, _SpecialForm],
-    ) -> bool:
-        outside = get_origin(typeinfo)
-        types = get_args(typeinfo)
-        if outside == Union:
-            return any(self.check(key, value, ty) for ty in types)
-        elif outside == dict:
-            k, v = types
-            if not isinstance(value, dict):
-                return False
-            return all(self.check(key, key, k) for key in value.keys()) and all(
-                self.check(key, val, v) for val in value.values()
-            )
-        elif outside == list:
-            content = types[0]
-            if not isinstance(value, list):
-                return False
-            return all(self.check(key, val, content) for val in value)
-        else:
-            raise UnexpectedValueError(f"{typeinfo} is not supported")
+        result = _compile(typeinfo).validate(value)
+        if result is _INVALID:
+            return False
+        self.value = result
+        return True
 
     def check_datetime(
         self,
@@ -63,30 +353,8 @@ class _TypeChecker:
             Type[datetime.datetime], Type[datetime.date], Type[datetime.time]
         ],
     ) -> Any:
-        if type(value) is typeinfo:
-            return True
-
-        if isinstance(value, str):
-            if typeinfo is datetime.time:
-                return False
-            try:
-                """
-                TODO:
-                ISO 8601 and RFC 3339 is not compatible
-                However, there are few use cases for writing the specified date and time to the setting value,
-                so I left it as it is for now.
-                """
-                value = datetime.datetime.fromisoformat(value)
-            except ValueError:
-                return False
-
-        if not isinstance(value, datetime.datetime):
+        result = _convert_datetime(value, typeinfo)
+        if result is _INVALID:
             return False
-
-        if typeinfo is datetime.date:
-            value = value.date()
-        elif typeinfo is datetime.time:
-            value = value.time()
-
-        self.value = value
+        self.value = result
         return True
@@ -1,21 +1,51 @@
 """this module provides Validator."""
-from dataclasses import MISSING, Field
-from typing import Any, List, Optional, Union
+import time
+from dataclasses import Field
+from typing import Any, Optional
 
 from fastconfig.exception import MissingRequiredElementError
+from fastconfig.internals.plan import _BuildPlan, _FieldPlan, _FieldTree
+from fastconfig.internals.stats import BuildStats
 from fastconfig.internals.type_checker import _TypeChecker
 
+# marks a key path which is not in `_SettingIndex.values` yet
+_UNINDEXED: Any = object()
 
-def _extract(setting: dict[str, Any], section: Union[str, List[str]]) -> Optional[Any]:
-    if isinstance(section, str) and section in setting:
-        return setting[section]
-    elif isinstance(section, List):
-        for element in section:
-            if not (isinstance(setting, dict) and element in setting):
-                return None
-            setting = setting[element]
-        return setting
-    return None
+
+class _SettingIndex:
+    # the values of a setting by key path, so that extracting a field is a single lookup.
+    # `add` flattens the keys of a class in one walk, visiting the tables shared by
+    # many fields like `db.primary.*` once. the index can be passed to the builds of
+    # other classes from the same setting, which find most keys indexed already
+    def __init__(self, setting: dict[str, Any]) -> None:
+        self.setting: dict[str, Any] = setting
+        self.values: dict[tuple[str, ...], Any] = {}
+
+    def add(self, tree: _FieldTree) -> "_SettingIndex":
+        # only the first class walks its keys, walking again costs more than
+        # looking up the few keys of another class which are not indexed yet
+        if not self.values:
+            self._flatten(tree, self.setting, ())
+        return self
+
+    def _flatten(self, tree: _FieldTree, table: Any, prefix: tuple[str, ...]) -> None:
+        values: dict[tuple[str, ...], Any] = self.values
+        for key, (_, below) in tree.items():
+            path: tuple[str, ...] = prefix + (key,)
+            value: Any = table.get(key)
+            values[path] = value
+            if below and isinstance(value, dict):
+                self._flatten(below, value, path)
+
+    def get(self, path: tuple[str, ...]) -> Any:
+        value: Any = self.values.get(path, _UNINDEXED)
+        if value is not _UNINDEXED:
+            return value
+        # a key of a tree which was not added, e.g. below a value which is not a table
+        table: Any = self.get(path[:-1]) if len(path) > 1 else self.setting
+        value = table.get(path[-1]) if isinstance(table, dict) else None
+        self.values[path] = value
+        return value
 
 
 class DEFAULT_VALUE:
@@ -25,27 +55,89 @@ class DEFAULT_VALUE:
 
 
 class _Validator:
-    def __init__(self, setting: dict[str, Any]) -> None:
+    def __init__(
+        self, setting: dict[str, Any], index: Optional[_SettingIndex] = None
+    ) -> None:
         self.setting: dict[str, Any] = setting
+        self.index: _SettingIndex = (
+            index if index is not None else _SettingIndex(setting)
+        )
         self.checker: _TypeChecker = _TypeChecker()
 
     def __call__(self, key: str, f: Field, build: bool = True) -> Any:
-        metadata: dict[str, Any] = dict(f.metadata) if hasattr(f, "metadata") else {}
-        separator = metadata["separator"] if "separator" in metadata else "."
-        setting_key: Union[str, List[str]] = (
-            metadata["key"].split(separator) if "key" in metadata else key
-        )
-        value: Any = _extract(self.setting, setting_key)
+        return self.validate(_FieldPlan.from_field(key, f), build)
+
+    def validate(self, plan: _FieldPlan, build: bool = True) -> Any:
+        value: Any = self.index.get(plan.path)
 
         if value is None:
-            if (
-                isinstance(f.default, type(MISSING))
-                and isinstance(f.default_factory, type(MISSING))
-                and build
-            ):
-                # TODO: check default_factry
-                raise MissingRequiredElementError(f"key: {key} is not found")
-            return DEFAULT_VALUE()
-
-        value = self.checker(key, value, f.type)
+            return self.missing(plan, build)
+
+        value = self.checker(plan.name, value, plan.typeinfo, plan.compiled)
         return value
+
+    def missing(self, plan: _FieldPlan, build: bool) -> Any:
+        if plan.required and build:
+            # TODO: check default_factry
+            raise MissingRequiredElementError(f"key: {plan.name} is not found")
+        return DEFAULT_VALUE()
+
+
+def _build_section(config: type, setting: dict[str, Any]) -> Any:
+    # a nested FastConfig or dataclass, built from the table of its field
+    args: dict[str, Any] = {}
+    plan: _BuildPlan = _BuildPlan.of(config)
+    checker: _Validator = _Validator(setting, _SettingIndex(setting).add(plan.tree))
+    for f in plan.fields:
+        value: Any = checker.validate(f)
+        if not isinstance(value, DEFAULT_VALUE):
+            args[f.name] = value
+    return config(**args)
+
+
+def _equal(value: Any, other: Any) -> bool:
+    if value is other:
+        return True
+    shape: Any = getattr(value, "shape", None)
+    if shape is not None or getattr(other, "shape", None) is not None:
+        # elementwise, e.g. numpy arrays, which cannot be compared across shapes
+        if shape != getattr(other, "shape", None):
+            return False
+        try:
+            return bool((value == other).all())
+        except (AttributeError, ValueError):
+            return False
+    try:
+        result: Any = value == other
+    except ValueError:
+        return False
+    return result if isinstance(result, bool) else False
+
+
+class _TimedValidator(_Validator):
+    # a validator recording the time of each phase and field, used only while builds are observed
+    def __init__(
+        self,
+        setting: dict[str, Any],
+        stats: BuildStats,
+        index: Optional[_SettingIndex] = None,
+    ) -> None:
+        super().__init__(setting, index)
+        self.stats: BuildStats = stats
+
+    def validate(self, plan: _FieldPlan, build: bool = True) -> Any:
+        started: float = time.perf_counter()
+        value: Any = self.index.get(plan.path)
+        extracted: float = time.perf_counter()
+        self.stats.add("extract", extracted - started)
+        if value is None:
+            self.stats.field_times[plan.name] = extracted - started
+            return self.missing(plan, build)
+
+        try:
+            return self.checker(plan.name, value, plan.typeinfo, plan.compiled)
+        finally:
+            checked: float = time.perf_counter()
+            self.stats.add("check", checked - extracted)
+            self.stats.fields_checked += 1
+            self.stats.field_times[plan.name] = checked - started
@@ -1,12 +1,145 @@
 """This package provides the methods to search files."""
+import functools
 import os
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 PROJECT_ROOTS: List[str] = [".hg", ".git"]
 DEPTH: int = 10
 
 
+class _DirectoryCache:
+    def __init__(self, ttl: float, maxsize: int) -> None:
+        self.ttl: float = ttl
+        self.maxsize: int = maxsize
+        # absolute path -> (st_mtime_ns, expiry, entry names, is project root)
+        self._entries: dict[str, tuple[int, float, frozenset[str], bool]] = {}
+        # `asearch` and `afind_project_root` search on executor threads,
+        # the file system is read outside of the lock
+        self._lock = threading.Lock()
+
+    def scan(self, directory: Path) -> tuple[frozenset[str], bool]:
+        key: str = os.path.abspath(directory)
+        now: float = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and now < entry[1]:
+            return entry[2], entry[3]
+        try:
+            mtime: int = os.stat(key).st_mtime_ns
+        except OSError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return frozenset(), False
+        # adding, removing or renaming an entry updates the mtime of the directory
+        if entry is not None and entry[0] == mtime:
+            names, project_root = entry[2], entry[3]
+        else:
+            names, project_root = _list_directory(key)
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= max(self.maxsize, 1):
+                # the entry added first, which is cheaper than tracking the least recently used
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (mtime, now + self.ttl, names, project_root)
+        return names, project_root
+
+    def clear(self, path: Optional[str] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            prefix: str = os.path.join(os.path.abspath(path), "")
+            for key in list(self._entries):
+                if key == prefix[:-1] or key.startswith(prefix):
+                    del self._entries[key]
+
+
+# shared by every search function, disabled by default
+_SEARCH_CACHE: Optional[_DirectoryCache] = None
+
+
+def enable_search_cache(ttl: float = 1.0, maxsize: int = 4096) -> None:
+    """
+    Enable the cache of directory contents used by the search functions.
+
+    An entry younger than `ttl` is used as is. An older entry is checked against the modification time
+    of its directory, and the directory is listed again only if it changed.
+    Every search walking through a directory shares its entry, so sibling directories share work.
+    Up to `maxsize` directories are kept, and the oldest entry is dropped to add another one.
+    Calling this again replaces the current cache with an empty one.
+
+    Args:
+        ttl (float):
+            The number of seconds an entry is used without checking the directory,
+            `0` checks the directory on every lookup
+        maxsize (int):
+            The number of directories kept, at least one
+    """
+    global _SEARCH_CACHE
+    _SEARCH_CACHE = _DirectoryCache(ttl, maxsize)
+
+
+def disable_search_cache() -> None:
+    """Disable the cache of directory contents and drop every entry."""
+    global _SEARCH_CACHE
+    _SEARCH_CACHE = None
+
+
+def clear_search_cache(path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Drop cached directory contents.
+
+    Args:
+        path (Optional[Union[str, Path]]):
+            The directory whose entries (including its subdirectories) are dropped,
+            If nothing is passed, every entry is dropped
+    """
+    cache: Optional[_DirectoryCache] = _SEARCH_CACHE
+    if cache is not None:
+        cache.clear(None if path is None else str(path))
+
+
+def _list_directory(directory: Union[str, Path]) -> tuple[frozenset[str], bool]:
+    # one directory listing answers both "which targets exist" and "is it the project root"
+    names: set[str] = set()
+    project_root: bool = False
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                names.add(entry.name)
+                if not project_root and entry.name in PROJECT_ROOTS:
+                    project_root = entry.is_dir()
+    except OSError:
+        return frozenset(), False
+    return frozenset(names), project_root
+
+
+def _scan(directory: Path) -> tuple[frozenset[str], bool]:
+    cache: Optional[_DirectoryCache] = _SEARCH_CACHE
+    if cache is None:
+        return _list_directory(directory)
+    return cache.scan(directory)
+
+
+def _contains(directory: Path, name: str) -> bool:
+    cache: Optional[_DirectoryCache] = _SEARCH_CACHE
+    if cache is None:
+        return directory.joinpath(name).exists()
+    return name in cache.scan(directory)[0]
+
+
+def _is_root(directory: Path) -> bool:
+    cache: Optional[_DirectoryCache] = _SEARCH_CACHE
+    if cache is None:
+        return any(directory.joinpath(c).is_dir() for c in PROJECT_ROOTS)
+    return cache.scan(directory)[1]
+
+
 def is_project_root(path: Union[str, Path]) -> bool:
     """
     Check the given path is the project root directory or not.
@@ -26,10 +159,7 @@ def is_project_root(path: Union[str, Path]) -> bool:
     if path.is_file():
         path = path.parent
 
-    for candidate in PROJECT_ROOTS:
-        if path.joinpath(candidate).is_dir():
-            return True
-    return False
+    return _is_root(path)
 
 
 def find_project_root(path: Optional[Union[str, Path]] = None) -> Optional[Path]:
@@ -53,7 +183,7 @@ def find_project_root(path: Optional[Union[str, Path]] = None) -> Optional[Path]
 
     while cnt < DEPTH:
         candidate = candidate.parent
-        if is_project_root(candidate):
+        if _is_root(candidate):
             return candidate
 
         if candidate.parent == candidate:
@@ -92,21 +222,149 @@ def search(
         path = os.getcwd()
 
     cnt: int = 0
-    candidate: Path = Path(os.path.join(path, target_name))
-    if candidate.exists():
-        return candidate
-    if is_project_root(candidate):
-        return None
-
-    while cnt < DEPTH:
-        candidate = candidate.parent.parent.joinpath(target_name)
-        if candidate.exists():
-            return candidate
+    directory: Path = Path(path) if isinstance(path, str) else path
+    while True:
+        if _contains(directory, target_name):
+            return directory.joinpath(target_name)
 
-        if candidate.parent.parent.joinpath(target_name) == candidate or (
-            end_up_the_project_root and is_project_root(candidate)
-        ):
+        if cnt >= DEPTH or directory.parent == directory:
             return None
 
+        directory = directory.parent
         cnt += 1
-    return None
+
+
+def search_any(
+    targets: Iterable[Union[str, Path]],
+    path: Optional[Union[str, Path]] = None,
+    end_up_the_project_root: bool = True,
+) -> Optional[Path]:
+    """
+    Search for several file names at once and return the match of the highest priority.
+
+    The result is the same as calling `search` for each target in order and keeping the first match,
+    but every directory is listed only once.
+
+    Args:
+        targets (Iterable[Union[str, Path]]):
+            Search target filenames in priority order, and directory names are ignored.
+
+        path (Optional[Union[str, Path]]):
+            A path string or Path object to start searching, If nothing is passed, start in the current directory.
+
+        end_up_the_project_root (bool):
+            Whether or not to stop searching at the directory where the version control tool exists
+
+    Returns:
+        Optional[Path]: a path of the target file, or None if no target file is found
+    """
+    found: list[Path] = _search(targets, path, end_up_the_project_root, True)
+    return found[0] if found else None
+
+
+def search_all(
+    targets: Iterable[Union[str, Path]],
+    path: Optional[Union[str, Path]] = None,
+    end_up_the_project_root: bool = True,
+) -> List[Path]:
+    """
+    Search for several file names at once and return the nearest match of each of them.
+
+    Args:
+        targets (Iterable[Union[str, Path]]):
+            Search target filenames in priority order, and directory names are ignored.
+
+        path (Optional[Union[str, Path]]):
+            A path string or Path object to start searching, If nothing is passed, start in the current directory.
+
+        end_up_the_project_root (bool):
+            Whether or not to stop searching at the directory where the version control tool exists
+
+    Returns:
+        List[Path]: paths of the found target files in priority order
+    """
+    return _search(targets, path, end_up_the_project_root, False)
+
+
+def _search(
+    targets: Iterable[Union[str, Path]],
+    path: Optional[Union[str, Path]],
+    end_up_the_project_root: bool,
+    first_only: bool,
+) -> List[Path]:
+    names: list[str] = list(dict.fromkeys(Path(target).name for target in targets))
+    if not names:
+        return []
+    found: dict[str, Path] = {}
+
+    directory: Path = Path(os.getcwd() if path is None else path)
+    for _ in range(DEPTH + 1):
+        entries, project_root = _scan(directory)
+        for name in names:
+            if name not in found and name in entries:
+                found[name] = directory.joinpath(name)
+        if len(found) == len(names) or (first_only and names[0] in found):
+            break
+        if end_up_the_project_root and project_root:
+            break
+        if directory.parent == directory:
+            break
+        directory = directory.parent
+    return [found[name] for name in names if name in found]
+
+
+async def afind_project_root(
+    path: Optional[Union[str, Path]] = None, executor: "Optional[Executor]" = None
+) -> Optional[Path]:
+    """
+    Return if the project root is found, or None if not, without blocking the event loop.
+
+    Args:
+        path (Optional[Union[str, Path]]):
+            A path string or Path object to start searching, If nothing is passed, start in the current directory
+
+        executor (Optional[Executor]):
+            The executor to run on, If nothing is passed, use the default executor of the event loop
+
+    Returns:
+        Optional[Path]: the project root path, or None if the project root is not found
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(find_project_root, path)
+    )
+
+
+async def asearch(
+    target: Union[str, Path],
+    path: Optional[Union[str, Path]] = None,
+    end_up_the_project_root: bool = True,
+    executor: "Optional[Executor]" = None,
+) -> Optional[Path]:
+    """
+    Recursively searches for files with the name of the target without blocking the event loop.
+
+    Args:
+        target (Union[str, Path]):
+            Search target filename, and directory names are ignored.
+
+        path (Optional[Union[str, Path]]):
+            A path string or Path object to start searching, If nothing is passed, start in the current directory.
+
+        end_up_the_project_root (bool):
+            Whether or not to search the directory where the version control tool exists
+
+        executor (Optional[Executor]):
+            The executor to run on, If nothing is passed, use the default executor of the event loop
+
+    Returns:
+        Optional[Path]: a path of the target file, or None if the target file is not found
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(search, target, path, end_up_the_project_root)
+    )
@@ -0,0 +1,344 @@
+"""This module provides `Watcher` to reload a FastConfig instance when its file changes."""
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Generic, Optional, Type, TypeVar, Union
+
+from fastconfig.config import FastConfig, _FastConfigBuilder, _is_frozen
+from fastconfig.internals.loader import _FileLoader
+
+_Self = TypeVar("_Self", bound=FastConfig)
+
+# (st_mtime_ns, st_size, st_ino), or None if the file does not exist
+_Signature = Optional[tuple[int, int, int]]
+
+_IN_MODIFY = 0x2
+_IN_ATTRIB = 0x4
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_EVENT = struct.Struct("iIII")
+
+
+def _signature(path: str) -> _Signature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _Inotify:
+    # watches the parent directory, because editors often replace the file by renaming
+    def __init__(self, path: str) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        directory, self.name = os.path.split(os.path.abspath(path))
+        mask = (
+            _IN_MODIFY
+            | _IN_ATTRIB
+            | _IN_CLOSE_WRITE
+            | _IN_MOVED_FROM
+            | _IN_MOVED_TO
+            | _IN_CREATE
+            | _IN_DELETE
+        )
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, os.strerror(errno))
+        self.name_bytes: bytes = os.fsencode(self.name)
+
+    def fileno(self) -> int:
+        return self.fd
+
+    def read(self) -> bool:
+        # drain every pending event, return whether one of them concerns the file
+        relevant: bool = False
+        while True:
+            try:
+                buffer = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return relevant
+            offset: int = 0
+            while offset < len(buffer):
+                _, mask, _, length = _EVENT.unpack_from(buffer, offset)
+                offset += _EVENT.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & (_IN_Q_OVERFLOW | _IN_IGNORED) or name == self.name_bytes:
+                    relevant = True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _inotify_available() -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        return hasattr(libc, "inotify_init1")
+    except OSError:
+        return False
+
+
+class Watcher(Generic[_Self]):
+    """
+    Reload a FastConfig instance in place when its source file changes.
+
+    The file is watched with inotify on Linux, and by comparing `stat` results elsewhere.
+    The file is parsed again only when its modification time, size or inode changed,
+    and only after no further change happened for `debounce` seconds.
+    The result is applied like `FastConfig.build(path, config)`,
+    then every callback is called with the instance and the names of the changed fields.
+    With `copy_on_write`, the instance is not modified, and `config` is replaced by a new
+    instance sharing the unchanged values instead, so readers never see a partial reload.
+    Instances of frozen classes cannot be updated, so they are always reloaded with `copy_on_write`.
+    An error while reloading or in a callback is kept in `last_error`, and watching goes on.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        config: Union[_Self, Type[_Self]],
+        callback: Optional[Callable[[_Self, set[str]], Any]] = None,
+        debounce: float = 0.1,
+        poll_interval: float = 1.0,
+        use_inotify: Optional[bool] = None,
+        copy_on_write: bool = False,
+    ) -> None:
+        """
+        Create a watcher, building the instance first if a class is passed.
+
+        Args:
+            path (Union[str, Path]):
+                a file path to read a config
+            config (Union[_Self, Type[_Self]]):
+                an instance inheriting from FastConfig, or a class to build it from `path`
+            callback (Optional[Callable[[_Self, set[str]], Any]]):
+                called with the instance and the names of the changed fields after a reload
+            debounce (float):
+                seconds without further changes to wait before reloading
+            poll_interval (float):
+                seconds between `stat` checks, which also backs up inotify
+            use_inotify (Optional[bool]):
+                whether to use inotify, If nothing is passed, use it when available
+            copy_on_write (bool):
+                whether to replace `config` by a new instance on reload instead of updating it,
+                always done for frozen classes
+        """
+        self.path: str = str(path)
+        self.debounce: float = debounce
+        self.poll_interval: float = poll_interval
+        self.use_inotify: bool = (
+            _inotify_available() if use_inotify is None else use_inotify
+        )
+        self.last_error: Optional[Exception] = None
+        self.task: Optional["asyncio.Task[None]"] = None
+        self._callbacks: list[Callable[[_Self, set[str]], Any]] = []
+        if callback is not None:
+            self._callbacks.append(callback)
+
+        self._signature: _Signature = _signature(self.path)
+        self.config: _Self = _FastConfigBuilder.build(self.path, config)
+        self.copy_on_write: bool = copy_on_write or _is_frozen(type(self.config))
+        # the setting of `config` with `copy_on_write`, after the first reload
+        self._setting: Optional[dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self._fd_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._inotify: Optional[_Inotify] = None
+        self._wakeup: Optional[tuple[int, int]] = None
+
+    def add_callback(self, callback: Callable[[_Self, set[str]], Any]) -> None:
+        """Register a function called with the instance and the changed fields."""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: Callable[[_Self, set[str]], Any]) -> None:
+        """Unregister a function registered by `add_callback`."""
+        self._callbacks.remove(callback)
+
+    def check(self) -> set[str]:
+        """
+        Reload the file if it changed since the last reload, and call the callbacks.
+
+        Returns:
+            set[str]: the names of the changed fields
+        """
+        changed: set[str] = self._reload()
+        if changed:
+            self._notify(changed)
+        return changed
+
+    def start(self) -> "Watcher[_Self]":
+        """Start watching on a daemon thread."""
+        if self._thread is not None or self.task is not None:
+            raise RuntimeError("the watcher is already running")
+        self._stopped.clear()
+        self._inotify = self._open_inotify()
+        if self._inotify is not None:
+            self._wakeup = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run_thread, name=f"fastconfig-watch:{self.path}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def start_task(self) -> "asyncio.Task[None]":
+        """Start watching on an asyncio task of the running event loop."""
+        if self._thread is not None or self.task is not None:
+            raise RuntimeError("the watcher is already running")
+        self._stopped.clear()
+        self.task = asyncio.get_running_loop().create_task(self._run_async())
+        return self.task
+
+    def stop(self) -> None:
+        """Stop watching, and wait for the thread unless called from a callback."""
+        self._stopped.set()
+        thread: Optional[threading.Thread] = self._thread
+        if thread is not None:
+            with self._fd_lock:
+                if self._wakeup is not None:
+                    os.write(self._wakeup[1], b"\0")
+            if thread is not threading.current_thread():
+                thread.join()
+            self._thread = None
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def _reload(self) -> set[str]:
+        with self._lock:
+            signature: _Signature = _signature(self.path)
+            if signature is None or signature == self._signature:
+                return set()
+            try:
+                data: dict[str, Any] = _FileLoader()(self.path)
+                if self.copy_on_write:
+                    config, changed = _FastConfigBuilder._replace(
+                        self.config, data, self._setting
+                    )
+                    self._setting = data
+                    # a single assignment, seen by readers as a whole
+                    self.config = config
+                    self._signature = signature
+                    self.last_error = None
+                    return changed
+                # every field is checked before any is assigned,
+                # so that an invalid file leaves the instance as it is
+                replaced, changed = _FastConfigBuilder._replace(self.config, data)
+            except Exception as e:
+                # keep the current values, e.g. while an editor is still writing,
+                # or if `__post_init__` of a nested section rejects the new ones
+                self.last_error = e
+                return set()
+            for name in changed:
+                setattr(self.config, name, getattr(replaced, name))
+            self._signature = signature
+            self.last_error = None
+            return changed
+
+    def _notify(self, changed: set[str]) -> None:
+        for callback in list(self._callbacks):
+            callback(self.config, changed)
+
+    def _run_thread(self) -> None:
+        inotify: Optional[_Inotify] = self._inotify
+        try:
+            while not self._stopped.is_set():
+                event: bool = self._wait(inotify, self.poll_interval)
+                if self._stopped.is_set():
+                    return
+                if not event and _signature(self.path) == self._signature:
+                    continue
+                # debounce: wait until the file stays the same for `debounce` seconds
+                while True:
+                    signature = _signature(self.path)
+                    event = self._wait(inotify, self.debounce)
+                    if self._stopped.is_set():
+                        return
+                    if not event and _signature(self.path) == signature:
+                        break
+                try:
+                    self.check()
+                except Exception as e:
+                    # raised by a callback, the thread keeps watching
+                    self.last_error = e
+        finally:
+            with self._fd_lock:
+                if inotify is not None:
+                    inotify.close()
+                    self._inotify = None
+                if self._wakeup is not None:
+                    for fd in self._wakeup:
+                        os.close(fd)
+                    self._wakeup = None
+
+    def _wait(self, inotify: Optional[_Inotify], timeout: float) -> bool:
+        if inotify is None or self._wakeup is None:
+            self._stopped.wait(timeout)
+            return False
+        readable, _, _ = select.select([inotify, self._wakeup[0]], [], [], timeout)
+        return inotify in readable and inotify.read()
+
+    async def _run_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        inotify: Optional[_Inotify] = self._open_inotify()
+        event = asyncio.Event()
+        if inotify is not None:
+            loop.add_reader(inotify.fd, lambda: inotify.read() and event.set())  # type: ignore
+
+        async def wait(timeout: float) -> bool:
+            try:
+                await asyncio.wait_for(event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return False
+            event.clear()
+            return True
+
+        try:
+            while not self._stopped.is_set():
+                triggered: bool = await wait(self.poll_interval)
+                if not triggered and _signature(self.path) == self._signature:
+                    continue
+                while True:
+                    signature = _signature(self.path)
+                    triggered = await wait(self.debounce)
+                    if not triggered and _signature(self.path) == signature:
+                        break
+                # parse off the event loop, then call the callbacks on it
+                changed: set[str] = await loop.run_in_executor(None, self._reload)
+                try:
+                    if changed:
+                        self._notify(changed)
+                except Exception as e:
+                    # raised by a callback, the task keeps watching
+                    self.last_error = e
+        finally:
+            if inotify is not None:
+                loop.remove_reader(inotify.fd)
+                inotify.close()
+
+    def _open_inotify(self) -> Optional[_Inotify]:
+        if not self.use_inotify:
+            return None
+        try:
+            return _Inotify(self.path)
+        except OSError:
+            # e.g. the inotify watch limit is reached, fall back to polling
+            return None
@@ -0,0 +1,43 @@
+import unittest
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from fastconfig import FastConfig, UnexpectedValueError, fc_field
+from fastconfig.internals.env import _EnvIndex
+
+
+@dataclass
+class Env(FastConfig):
+    host: str = fc_field(key="db.primary-host", default="")
+    port: Optional[int] = fc_field(key="db.port", default=None)
+    ratio: Union[int, str] = 0
+    extra: Any = None
+
+
+class TestEnvIndex(unittest.TestCase):
+    def test_names(self) -> None:
+        index = _EnvIndex.of(Env, "app_")
+        self.assertIs(index, _EnvIndex.of(Env, "app_"))
+        self.assertEqual(
+            {name: f.name for name, f in index.names.items()},
+            {
+                "APP_DB__PRIMARY_HOST": "host",
+                "APP_DB__PORT": "port",
+                "APP_RATIO": "ratio",
+                "APP_EXTRA": "extra",
+            },
+        )
+
+    def test_read(self) -> None:
+        index = _EnvIndex.of(Env, "APP_")
+        environ = {
+            "APP_DB__PORT": "null",
+            "APP_RATIO": "12",
+            "APP_EXTRA": "[1]",
+            "APP_UNKNOWN": "1",
+        }
+        expected = {"port": None, "ratio": "12", "extra": "[1]"}
+        self.assertEqual(index.read(environ), expected)
+        self.assertEqual(index.read({"APP_DB__PORT": "1"}), {"port": 1})
+        with self.assertRaisesRegex(UnexpectedValueError, "APP_DB__PORT"):
+            index.read({"APP_DB__PORT": "1.5"})
@@ -1,7 +1,9 @@
+import tempfile
 import unittest
+from pathlib import Path
 
-from fastconfig import InvalidConfigError
-from fastconfig.internals.loader import _FileLoader
+from fastconfig import InvalidConfigError, register_backend
+from fastconfig.internals.loader import _BACKENDS, _CANDIDATES, _backend, _FileLoader
 
 
 class TestLoader(unittest.TestCase):
@@ -24,3 +26,56 @@ class TestLoader(unittest.TestCase):
         self.assertEqual(
             loader("tests/fixtures/internals/non_dict.json"), {"content": [1, 2, 3]}
         )
+
+    def test_backends(self) -> None:
+        loader = _FileLoader()
+        data = Path("tests/fixtures/basic_type.toml").read_bytes()
+        expected = loader("tests/fixtures/basic_type.toml")
+        for candidate in _CANDIDATES[".toml"]:
+            try:
+                backend = candidate()
+            except ImportError:
+                continue
+            self.assertEqual(loader.parse(data, backend), expected)
+            with self.assertRaises(InvalidConfigError):
+                loader.parse(b"[table", backend)
+
+        for candidate in _CANDIDATES[".json"]:
+            try:
+                backend = candidate()
+            except ImportError:
+                continue
+            self.assertEqual(loader.parse(b"[1, 2]", backend), {"content": [1, 2]})
+            self.assertEqual(
+                loader.parse(b'{"big": 18446744073709551616}', backend),
+                {"big": 18446744073709551616},
+            )
+            with self.assertRaises(InvalidConfigError) as e:
+                loader.parse(b"", backend)
+            self.assertEqual(
+                str(e.exception), "Expecting value: line 1 column 1 (char 0)"
+            )
+            with self.assertRaises(InvalidConfigError):
+                loader.parse(b"\xff", backend)
+
+    def test_register_backend(self) -> None:
+        def parse_properties(data: bytes) -> dict[str, str]:
+            lines = data.decode().splitlines()
+            if any("=" not in line for line in lines):
+                raise ValueError("invalid line")
+            return dict(line.split("=", 1) for line in lines)
+
+        register_backend("properties", parse_properties)
+        try:
+            self.assertEqual(_backend(".properties").name, "parse_properties")  # type: ignore
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "app.properties"
+                path.write_text("name=app\nport=80")
+                self.assertEqual(
+                    _FileLoader()(str(path)), {"name": "app", "port": "80"}
+                )
+                path.write_text("name")
+                with self.assertRaises(InvalidConfigError):
+                    _FileLoader()(str(path))
+        finally:
+            del _BACKENDS[".properties"]
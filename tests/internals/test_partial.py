@@ -0,0 +1,95 @@
+import json
+import unittest
+
+from fastconfig import InvalidConfigError
+from fastconfig.internals.partial import _key_tree, _select_json
+
+
+class TestPartial(unittest.TestCase):
+    def test_key_tree(self) -> None:
+        self.assertEqual(
+            _key_tree([("a", "b"), ("a", "c", "d"), ("e",), ("e", "f")]),
+            {"a": {"b": None, "c": {"d": None}}, "e": None},
+        )
+
+    def test_select_json(self) -> None:
+        document = {
+            "a": {"b": [1, {"x": '}]"{'}], "c": {"d": 2, "skipped": [[]]}},
+            "e": 'escaped \\"} é',
+            "f": 1.5,
+            "g": {"h": True},
+            "skipped": {"nested": [{"deep": ["]", "["]}]},
+        }
+        tree = _key_tree([("a", "b"), ("a", "c", "d"), ("e",), ("g", "h", "i")])
+        for data in (json.dumps(document), json.dumps(document, indent=4)):
+            self.assertEqual(
+                _select_json(data.encode(), tree, json.loads),
+                {
+                    "a": {"b": [1, {"x": '}]"{'}], "c": {"d": 2}},
+                    "e": 'escaped \\"} é',
+                    "g": {},
+                },
+            )
+        self.assertEqual(
+            _select_json(b'{"\\u0061": 1}', {"a": None}, json.loads), {"a": 1}
+        )
+        self.assertIsNone(_select_json(b" [1, 2]", tree, json.loads))
+
+    def test_deep(self) -> None:
+        # nested deeper than a skipped value is matched at once
+        deep = [1]
+        for i in range(10):
+            deep = [{"k": deep, "s": "]}[{" * i}]
+        data = json.dumps({"skipped": deep, "a": {"skipped": deep, "b": 1}, "c": 2})
+        self.assertEqual(
+            _select_json(data.encode(), _key_tree([("a", "b"), ("c",)]), json.loads),
+            {"a": {"b": 1}, "c": 2},
+        )
+        with self.assertRaises(InvalidConfigError):
+            _select_json(data[:-30].encode(), {"d": None}, json.loads)
+        with self.assertRaises(InvalidConfigError):
+            _select_json(data.replace('"s"', '"s', 1).encode(), {"d": None}, json.loads)
+
+    def test_stop(self) -> None:
+        tree = _key_tree([("a", "b"), ("c",)])
+        # the scan stops once every key is read, so a repeated key keeps its first value
+        self.assertEqual(
+            _select_json(
+                b'{"a": {"b": 1, "b": 2}, "c": 3, "a": {"b": 4}, "c": 5} garbage',
+                tree,
+                json.loads,
+            ),
+            {"a": {"b": 1}, "c": 3},
+        )
+        self.assertEqual(
+            _select_json(b'{"c": 1, "c": 2, "a": {"b": 3}}', tree, json.loads),
+            {"a": {"b": 3}, "c": 1},
+        )
+        # the rest of a table is skipped once its keys are read
+        self.assertEqual(
+            _select_json(
+                b'{"a": {"b": 1, "x": [{"b": 2}]}, "b": 3, "c": 4}', tree, json.loads
+            ),
+            {"a": {"b": 1}, "c": 4},
+        )
+        # a key not found is looked for up to the end
+        with self.assertRaises(InvalidConfigError):
+            _select_json(b'{"a": {"b": 1}} garbage', tree, json.loads)
+
+    def test_errors(self) -> None:
+        # the same messages as the json module
+        for data in (
+            b'{"a" 1}',
+            b'{"a": 1 "b": 2}',
+            b'{"a": "x}',
+            b'{"a": 1}x',
+            b"{a: 1}",
+        ):
+            with self.assertRaises(json.JSONDecodeError) as expected:
+                json.loads(data)
+            with self.assertRaises(InvalidConfigError) as e:
+                _select_json(data, {}, json.loads)
+            self.assertEqual(str(e.exception), str(expected.exception))
+
+        with self.assertRaises(InvalidConfigError):
+            _select_json(b'{"a": [1, {"b": 2}', {}, json.loads)
@@ -0,0 +1,64 @@
+import sys
+import unittest
+from dataclasses import MISSING, dataclass, make_dataclass
+from typing import List
+
+from fastconfig import FastConfig, fc_field
+from fastconfig.internals.plan import _BuildPlan, _changed
+
+
+@dataclass
+class Planned(FastConfig):
+    a: int = fc_field(key="section.a")
+    b: "List[str]" = fc_field(key="section/b", separator="/", default_factory=list)
+    c: str = "c"
+
+
+class TestBuildPlan(unittest.TestCase):
+    def test_of(self) -> None:
+        plan = _BuildPlan.of(Planned)
+        self.assertIs(plan, _BuildPlan.of(Planned))
+
+        a, b, c = plan.fields
+        self.assertEqual(a.name, "a")
+        self.assertEqual(a.section, ["section", "a"])
+        self.assertEqual(a.path, ("section", "a"))
+        self.assertIs(a.typeinfo, int)
+        self.assertTrue(a.required)
+
+        self.assertEqual(b.section, ["section", "b"])
+        self.assertEqual(b.typeinfo, List[str])
+        self.assertFalse(b.required)
+        self.assertIs(b.default, MISSING)
+        self.assertIs(b.default_factory, list)
+
+        self.assertEqual(c.section, "c")
+        self.assertEqual(c.path, ("c",))
+        self.assertFalse(c.required)
+        self.assertEqual(c.default, "c")
+
+    def test_interned_names(self) -> None:
+        # `config(**args)` matches the keywords by identity, without comparing names
+        Generated = make_dataclass(
+            "Generated", [("".join(["gen", "erated"]), int)], bases=(FastConfig,)
+        )
+        (f,) = _BuildPlan.of(Generated).fields
+        self.assertIs(f.name, sys.intern("generated"))
+
+    def test_changed(self) -> None:
+        plan = _BuildPlan.of(Planned)
+        self.assertEqual(
+            plan.tree,
+            {"section": ([], {"a": (["a"], {}), "b": (["b"], {})}), "c": (["c"], {})},
+        )
+        previous = {"section": {"a": 1, "b": ["x"]}, "c": "c"}
+        self.assertEqual(_changed(plan.tree, previous, previous, []), [])
+        self.assertEqual(
+            _changed(
+                plan.tree, {"section": {"a": 1, "b": ["y"]}, "c": "c"}, previous, []
+            ),
+            ["b"],
+        )
+        # missing values are not changes
+        self.assertEqual(_changed(plan.tree, {"section": 1}, previous, []), [])
+        self.assertEqual(_changed(plan.tree, {"c": "d"}, None, []), ["c"])
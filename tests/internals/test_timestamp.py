@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from fastconfig.internals.timestamp import _MEMO, _MEMO_SIZE, _parse_datetime
+
+UTC = timezone.utc
+JST = timezone(timedelta(hours=9))
+
+
+class TestParseDatetime(unittest.TestCase):
+    def test_layouts(self) -> None:
+        for text, expected in [
+            ("2024-02-03", datetime(2024, 2, 3)),
+            ("2024-02-03T04:05:06", datetime(2024, 2, 3, 4, 5, 6)),
+            ("2024-02-03T04:05:06.007", datetime(2024, 2, 3, 4, 5, 6, 7000)),
+            ("2024-02-03T04:05:06.000007", datetime(2024, 2, 3, 4, 5, 6, 7)),
+            ("2024-02-03T04:05:06Z", datetime(2024, 2, 3, 4, 5, 6, tzinfo=UTC)),
+            ("2024-02-03t04:05:06z", datetime(2024, 2, 3, 4, 5, 6, tzinfo=UTC)),
+            (
+                "2024-02-03T04:05:06.007Z",
+                datetime(2024, 2, 3, 4, 5, 6, 7000, tzinfo=UTC),
+            ),
+            (
+                "2024-02-03T04:05:06+09:00",
+                datetime(2024, 2, 3, 4, 5, 6, tzinfo=JST),
+            ),
+            (
+                "2024-02-03T04:05:06.000007-09:00",
+                datetime(2024, 2, 3, 4, 5, 6, 7, tzinfo=timezone(-timedelta(hours=9))),
+            ),
+        ]:
+            with self.subTest(text):
+                self.assertEqual(_parse_datetime(text), expected)
+                self.assertEqual(_parse_datetime(text).tzinfo, expected.tzinfo)
+
+    def test_rfc3339(self) -> None:
+        # forms `datetime.fromisoformat` rejects on some Python versions
+        for text, expected in [
+            ("2024-02-03 04:05:06Z", datetime(2024, 2, 3, 4, 5, 6, tzinfo=UTC)),
+            ("2024-02-03T04:05:06.5Z", datetime(2024, 2, 3, 4, 5, 6, 500000, UTC)),
+            (
+                "2024-02-03T04:05:06.123456789Z",
+                datetime(2024, 2, 3, 4, 5, 6, 123456, UTC),
+            ),
+            ("2024-02-03T04:05:06,5", datetime(2024, 2, 3, 4, 5, 6, 500000)),
+            ("2024-02-03T04:05Z", datetime(2024, 2, 3, 4, 5, tzinfo=UTC)),
+            ("2024-02-03T04:05:06+0900", datetime(2024, 2, 3, 4, 5, 6, tzinfo=JST)),
+            ("2024-02-03T04:05:06+09", datetime(2024, 2, 3, 4, 5, 6, tzinfo=JST)),
+        ]:
+            with self.subTest(text):
+                self.assertEqual(_parse_datetime(text), expected)
+
+    def test_invalid(self) -> None:
+        for text in [
+            "",
+            "apple",
+            "2024-02-30",
+            "2024-02-03T24:00:00Z",
+            # leap seconds cannot be represented
+            "2023-12-31T23:59:60Z",
+            "2024-02-03T04:05:06+24:00",
+            "2024-02-03T04:05:06+09:00Z",
+            "２０２４-02-03",
+        ]:
+            with self.subTest(text):
+                self.assertIsNone(_parse_datetime(text))
+
+    def test_memo(self) -> None:
+        _MEMO.clear()
+        first = _parse_datetime("2024-02-03T04:05:06Z")
+        self.assertIs(_parse_datetime("2024-02-03T04:05:06Z"), first)
+        self.assertIsNone(_parse_datetime("apple"))
+        self.assertNotIn("apple", _MEMO)
+
+        # bounded
+        start = datetime(2024, 1, 1)
+        for i in range(_MEMO_SIZE * 2):
+            _parse_datetime((start + timedelta(seconds=i)).isoformat())
+        self.assertLessEqual(len(_MEMO), _MEMO_SIZE)
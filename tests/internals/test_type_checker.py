@@ -1,10 +1,26 @@
+import array
+import gc
 import unittest
-from dataclasses import dataclass, field
-from datetime import date, datetime, time
+import weakref
+from dataclasses import dataclass, field, make_dataclass
+from datetime import date, datetime, time, timezone
 from typing import Any, Callable, Optional, Union
 
 from fastconfig import UnexpectedValueError
-from fastconfig.internals.type_checker import _TypeChecker
+from fastconfig.internals.type_checker import (
+    _INVALID,
+    _VALIDATORS,
+    _VALIDATORS_SIZE,
+    _array,
+    _compile,
+    _TypeChecker,
+)
+
+try:
+    import numpy
+    import numpy.typing
+except ImportError:
+    numpy = None
 
 Numeric = Union[int, float]
 
@@ -114,3 +130,105 @@ class TestTypeChecker(unittest.TestCase):
         self.assertTrue(checker.check_datetime("2020-10-01", date))
         self.assertFalse(checker.check_datetime("2020-10-01", time))
         self.assertTrue(checker.check_datetime("2020-10-01", datetime))
+        self.assertTrue(checker.check_datetime("2020-10-01T10:00:00Z", datetime))
+        self.assertEqual(checker.value, datetime(2020, 10, 1, 10, tzinfo=timezone.utc))
+        self.assertTrue(checker.check_datetime("2020-10-01T10:00:00Z", date))
+        self.assertEqual(checker.value, date(2020, 10, 1))
+
+    def test_compile(self) -> None:
+        checker = _TypeChecker()
+
+        # compiled once per type hint
+        self.assertIs(_compile(list[int]), _compile(list[int]))
+        self.assertIs(_compile(Optional[int]), _compile(Optional[int]))
+
+        # homogeneous and mixed containers
+        self.assertTrue(checker.check("List[int]", list(range(1000)), list[int]))
+        self.assertTrue(checker.check("List[int]", [True, 1], list[int]))
+        self.assertFalse(checker.check("List[int]", [*range(1000), "1"], list[int]))
+        self.assertFalse(checker.check("List[float]", [1.0, 1], list[float]))
+        self.assertTrue(
+            checker.check(
+                "dict[str, list[str]]", {"a": ["1", "2"], "b": []}, dict[str, list[str]]
+            )
+        )
+        self.assertFalse(
+            checker.check("dict[str, list[str]]", {"a": ["1", 2]}, dict[str, list[str]])
+        )
+
+        # nested values are converted, too
+        self.assertEqual(
+            checker("list[date]", ["2020-10-01", date(2020, 1, 1)], list[date]),
+            [date(2020, 10, 1), date(2020, 1, 1)],
+        )
+        self.assertEqual(
+            checker(
+                "dict[str, list[datetime]]",
+                {"a": ["2020-10-01T10:00:00"]},
+                dict[str, list[datetime]],
+            ),
+            {"a": [datetime(2020, 10, 1, 10)]},
+        )
+        self.assertFalse(checker.check("list[date]", ["apple"], list[date]))
+
+        # the first matching type of Union decides the converted value
+        self.assertEqual(
+            checker("Union[date, datetime]", "2020-10-01", Union[date, datetime]),  # type: ignore
+            date(2020, 10, 1),
+        )
+        self.assertEqual(
+            checker("Union[datetime, date]", "2020-10-01", Union[datetime, date]),  # type: ignore
+            datetime(2020, 10, 1),
+        )
+
+    def test_compile_bounded(self) -> None:
+        # dynamically created classes are not kept alive by their validators
+        section = make_dataclass("Section", [("value", int)])
+        _compile(list[section])  # type: ignore
+        released = weakref.ref(section)
+        del section
+        for _ in range(_VALIDATORS_SIZE):
+            _compile(Optional[make_dataclass("Other", [])])
+            self.assertLessEqual(len(_VALIDATORS), _VALIDATORS_SIZE)
+        gc.collect()
+        self.assertIsNone(released())
+
+    def test_dataclass(self) -> None:
+        checker = _TypeChecker()
+        section = checker("section", {"c": 1, "d": {"x": {"y": 2}}}, ComplexTypes)
+        self.assertEqual(section, ComplexTypes(c=1, d={"x": {"y": 2}}))
+        self.assertIs(checker("section", section, ComplexTypes), section)
+        self.assertEqual(
+            checker("sections", [{}, {"a": 1.5}], list[ComplexTypes]),
+            [ComplexTypes(), ComplexTypes(a=1.5)],
+        )
+        self.assertFalse(checker.check("section", [1], ComplexTypes))
+        with self.assertRaises(UnexpectedValueError):
+            checker("section", {"c": "1"}, ComplexTypes)
+
+    def test_array(self) -> None:
+        checker = _TypeChecker()
+        doubles = checker("array", [1.5, 2, True], array.array)
+        self.assertEqual(doubles, array.array("d", [1.5, 2.0, 1.0]))
+        self.assertIs(checker("array", doubles, array.array), doubles)
+        self.assertFalse(checker.check("array", [1.0, "2"], array.array))
+        self.assertFalse(checker.check("array", (1.0,), array.array))
+
+        ints = _array("q")
+        self.assertEqual(ints.validate([1, 2]), array.array("q", [1, 2]))
+        for invalid in ([1.5], [2**64], doubles):
+            self.assertIs(ints.validate(invalid), _INVALID)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_ndarray(self) -> None:
+        checker = _TypeChecker()
+        floats = checker("array", [1.5, 2, True], numpy.ndarray)
+        self.assertEqual((floats.dtype, floats.tolist()), (numpy.float64, [1.5, 2, 1]))
+        table = checker("array", [[1, 2], [3, 4]], numpy.typing.NDArray[numpy.int32])
+        self.assertEqual((table.dtype, table.shape), (numpy.int32, (2, 2)))
+
+        int8 = _array("int8")
+        self.assertEqual(int8.validate([1, -1]).tolist(), [1, -1])
+        for invalid in ([1.5], [128], ["1"], [[1], [1, 2]], [2**64], {"a": 1}):
+            with self.assertRaises(UnexpectedValueError):
+                checker("array", invalid, numpy.typing.NDArray[numpy.int8])
@@ -4,27 +4,63 @@ from dataclasses import MISSING, Field
 from typing import Any, Optional
 
 from fastconfig import MissingRequiredElementError, UnexpectedValueError
-from fastconfig.internals.validator import DEFAULT_VALUE, _extract, _Validator
+from fastconfig.config import fc_field
+from fastconfig.internals.plan import _field_tree, _FieldPlan
+from fastconfig.internals.validator import (
+    DEFAULT_VALUE,
+    _SettingIndex,
+    _Validator,
+)
 
 
-class Test_extract(unittest.TestCase):
-    def test___extract(self) -> None:
+class Test_SettingIndex(unittest.TestCase):
+    def test_index(self) -> None:
         dic: dict[str, Any] = {
             "value": 1,
             "internal": {"value": 2, "internal": {"value": 3}},
+            "list": [{"value": 4}],
         }
+        expected: dict[tuple[str, ...], Any] = {
+            ("value",): 1,
+            ("val",): None,
+            ("internal",): {"value": 2, "internal": {"value": 3}},
+            ("internal", "value"): 2,
+            ("internal", "val"): None,
+            ("internal", "internal", "value"): 3,
+            ("internal", "internal", "val"): None,
+            ("value", "value"): None,
+            ("list", "value"): None,
+        }
+        paths: list[tuple[str, ...]] = list(expected)
+        plans = tuple(
+            _FieldPlan.from_field(f"f{i}", fc_field(key=".".join(path), default=0))
+            for i, path in enumerate(paths)
+        )
 
-        self.assertEqual(_extract(dic, "value"), 1)
-        self.assertIsNone(_extract(dic, "val"))
-        self.assertEqual(_extract(dic, ["value"]), 1)
-        self.assertIsNone(_extract(dic, ["val"]))
-        self.assertEqual(
-            _extract(dic, ["internal"]), {"value": 2, "internal": {"value": 3}}
+        # the same values, whether flattened first or looked up one by one
+        for index in (_SettingIndex(dic).add(_field_tree(plans)), _SettingIndex(dic)):
+            for path in paths:
+                with self.subTest(path):
+                    self.assertEqual(index.get(path), expected[path])
+            self.assertIs(index.get(("internal",)), dic["internal"])
+
+    def test_shared(self) -> None:
+        dic: dict[str, Any] = {"db": {"primary": {"host": "a", "port": 1}}}
+        first = _field_tree(
+            (_FieldPlan.from_field("host", fc_field(key="db.primary.host")),)
+        )
+        second = _field_tree(
+            (_FieldPlan.from_field("port", fc_field(key="db.primary.port")),)
         )
-        self.assertEqual(_extract(dic, ["internal", "value"]), 2)
-        self.assertIsNone(_extract(dic, ["internal", "val"]))
-        self.assertEqual(_extract(dic, ["internal", "internal", "value"]), 3)
-        self.assertIsNone(_extract(dic, ["internal", "internal", "val"]))
+        index = _SettingIndex(dic).add(first)
+        self.assertEqual(index.get(("db", "primary", "host")), "a")
+        self.assertNotIn(("db", "primary", "port"), index.values)
+
+        # another class reading the same setting looks up its other keys
+        index.add(second)
+        self.assertNotIn(("db", "primary", "port"), index.values)
+        self.assertEqual(index.get(("db", "primary", "port")), 1)
+        self.assertIn(("db", "primary", "port"), index.values)
 
 
 class FieldBuilder:
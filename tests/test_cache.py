@@ -0,0 +1,83 @@
+import os
+import tempfile
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastconfig import (
+    FastConfig,
+    disable_parse_cache,
+    enable_parse_cache,
+    fc_field,
+    invalidate_parse_cache,
+    parse_cache_info,
+)
+
+
+@dataclass
+class Cached(FastConfig):
+    values: list[int] = fc_field(key="section.values", default_factory=list)
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "config.json"
+        self.path.write_text('{"section": {"values": [1, 2, 3]}}')
+        enable_parse_cache()
+
+    def tearDown(self) -> None:
+        disable_parse_cache()
+        self.tmp.cleanup()
+
+    def test_hit_and_miss(self) -> None:
+        self.assertEqual(Cached.build(self.path), Cached([1, 2, 3]))
+        self.assertEqual(Cached.build(self.path), Cached([1, 2, 3]))
+        info = parse_cache_info()
+        assert info is not None
+        self.assertEqual((info.hits, info.misses, info.entries), (1, 1, 1))
+        self.assertEqual(info.bytes, self.path.stat().st_size)
+
+        # a modified file is parsed again
+        self.path.write_text('{"section": {"values": [4, 5, 6, 7]}}')
+        self.assertEqual(Cached.build(self.path), Cached([4, 5, 6, 7]))
+        info = parse_cache_info()
+        assert info is not None
+        self.assertEqual((info.hits, info.misses, info.entries), (1, 2, 2))
+
+        invalidate_parse_cache(self.path)
+        info = parse_cache_info()
+        assert info is not None
+        self.assertEqual((info.entries, info.bytes), (0, 0))
+
+    def test_copy_on_read(self) -> None:
+        first = Cached.build(self.path)
+        first.values.append(4)
+        self.assertEqual(Cached.build(self.path), Cached([1, 2, 3]))
+
+    def test_eviction(self) -> None:
+        enable_parse_cache(max_entries=1)
+        other = Path(self.tmp.name) / "other.json"
+        other.write_text('{"section": {"values": []}}')
+
+        Cached.build(self.path)
+        Cached.build(other)
+        Cached.build(self.path)
+        info = parse_cache_info()
+        assert info is not None
+        self.assertEqual((info.hits, info.misses, info.entries), (0, 3, 1))
+
+        enable_parse_cache(max_bytes=os.path.getsize(self.path) - 1)
+        Cached.build(self.path)
+        info = parse_cache_info()
+        assert info is not None
+        self.assertEqual((info.entries, info.bytes), (0, 0))
+
+    def test_disable(self) -> None:
+        disable_parse_cache()
+        self.assertIsNone(parse_cache_info())
+        invalidate_parse_cache()
+        self.assertEqual(Cached.build(self.path), Cached([1, 2, 3]))
+
+        with self.assertRaises(ValueError):
+            enable_parse_cache(max_entries=0)
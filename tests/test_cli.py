@@ -0,0 +1,162 @@
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastconfig import FastConfig, fc_field
+from fastconfig.cli import check, main
+
+
+@dataclass
+class CliConfig(FastConfig):
+    name: str = fc_field(key="app.name")
+    port: int = fc_field(key="app.port", default=0)
+
+    def __post_init__(self) -> None:
+        if self.port < 0:
+            raise ValueError("port must not be negative")
+
+
+@dataclass
+class Server:
+    port: int
+
+    def __post_init__(self) -> None:
+        if self.port < 0:
+            raise ValueError("negative port")
+
+
+@dataclass
+class NestedCliConfig(FastConfig):
+    server: Server = fc_field(key="server")
+
+
+class Plain:
+    pass
+
+
+class TestCheck(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.cache = str(self.dir / "cache.json")
+        (self.dir / "ok.toml").write_text('[app]\nname = "ok"\nport = 80\n')
+        (self.dir / "type.toml").write_text('[app]\nname = 1\nport = "80"\n')
+        (self.dir / "negative.toml").write_text('[app]\nname = "a"\nport = -1\n')
+        (self.dir / "broken.toml").write_text("[app\n")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def errors(self, report: dict) -> dict:
+        return {
+            Path(f["path"]).name: [(e["field"], e["error"]) for e in f["errors"]]
+            for f in report["files"]
+        }
+
+    def test_check(self) -> None:
+        report = check(
+            "test_cli:CliConfig", [f"{self.tmp.name}/*.toml"], workers=1, cache=None
+        )
+        self.assertEqual(
+            self.errors(report),
+            {
+                "broken.toml": [(None, "InvalidConfigError")],
+                "negative.toml": [(None, "ValueError")],
+                "ok.toml": [],
+                "type.toml": [
+                    ("name", "UnexpectedValueError"),
+                    ("port", "UnexpectedValueError"),
+                ],
+            },
+        )
+        self.assertEqual(report["summary"], {"files": 4, "failed": 3, "cached": 0})
+
+    def test_nested_error(self) -> None:
+        (self.dir / "server.toml").write_text("[server]\nport = -1\n")
+        (self.dir / "valid.toml").write_text("[server]\nport = 1\n")
+        out = io.StringIO()
+        with redirect_stdout(out):
+            status = main(
+                ["check", "test_cli:NestedCliConfig", f"{self.tmp.name}/*.toml"]
+                + ["--no-cache", "--workers", "1"]
+            )
+        self.assertEqual(status, 1)
+        errors = self.errors(json.loads(out.getvalue()))
+        self.assertEqual(errors["server.toml"], [("server", "ValueError")])
+        self.assertEqual(errors["valid.toml"], [])
+        self.assertEqual(errors["broken.toml"], [(None, "InvalidConfigError")])
+
+    def test_missing_file(self) -> None:
+        report = check(
+            "test_cli:CliConfig", [f"{self.tmp.name}/none.toml"], workers=1, cache=None
+        )
+        self.assertEqual(
+            self.errors(report), {"none.toml": [(None, "FileNotFoundError")]}
+        )
+
+    def test_workers(self) -> None:
+        pattern = f"{self.tmp.name}/*.toml"
+        serial = check("test_cli:CliConfig", [pattern], workers=1, cache=None)
+        parallel = check("test_cli:CliConfig", [pattern], workers=2, cache=None)
+        self.assertEqual(parallel, serial)
+
+    def test_cache(self) -> None:
+        pattern = f"{self.tmp.name}/*.toml"
+        first = check("test_cli:CliConfig", [pattern], workers=1, cache=self.cache)
+        second = check("test_cli:CliConfig", [pattern], workers=1, cache=self.cache)
+        self.assertEqual(first["summary"]["cached"], 0)
+        self.assertEqual(second["summary"]["cached"], 4)
+        self.assertEqual(self.errors(second), self.errors(first))
+
+        # a changed file is checked again
+        (self.dir / "type.toml").write_text('[app]\nname = "fixed"\n')
+        third = check("test_cli:CliConfig", [pattern], workers=1, cache=self.cache)
+        self.assertEqual(third["summary"], {"files": 4, "failed": 2, "cached": 3})
+        self.assertEqual(self.errors(third)["type.toml"], [])
+
+        # shared by several classes
+        (self.dir / "server.toml").write_text("[server]\nport = 1\n")
+        files = [str(self.dir / "server.toml")]
+        check("test_cli:NestedCliConfig", files, workers=1, cache=self.cache)
+        fourth = check("test_cli:CliConfig", [pattern], workers=1, cache=self.cache)
+        self.assertEqual(fourth["summary"]["cached"], 4)
+        fifth = check("test_cli:NestedCliConfig", files, workers=1, cache=self.cache)
+        self.assertEqual(fifth["summary"]["cached"], 1)
+
+    def test_main(self) -> None:
+        out = io.StringIO()
+        with redirect_stdout(out):
+            status = main(
+                [
+                    "check",
+                    "test_cli:CliConfig",
+                    str(self.dir / "ok.toml"),
+                    "--no-cache",
+                    "--workers",
+                    "1",
+                ]
+            )
+        self.assertEqual(status, 0)
+        self.assertTrue(json.loads(out.getvalue())["files"][0]["ok"])
+
+        with redirect_stdout(io.StringIO()):
+            status = main(
+                ["check", "test_cli:CliConfig", f"{self.tmp.name}/*.toml"]
+                + ["--cache", self.cache]
+            )
+        self.assertEqual(status, 1)
+
+    def test_invalid_target(self) -> None:
+        with self.assertRaises(ValueError):
+            check("test_cli", ["config.toml"])
+        with self.assertRaises(AttributeError):
+            check("test_cli:Missing", ["config.toml"])
+        with self.assertRaisesRegex(ValueError, "not a dataclass"):
+            check("test_cli:Plain", ["config.toml"])
+        with redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit):
+            main(["check", "test_cli:Plain", "config.toml"])
+        self.assertIn("not a dataclass", err.getvalue())
@@ -1,10 +1,37 @@
+import array
+import asyncio
+import io
+import json
+import os
+import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
+from pathlib import Path
 from typing import Any, List, Optional, Union
+from unittest import mock
 
-from fastconfig import FastConfig, InvalidConfigError, fc_field
+import toml
+
+from fastconfig import (
+    ConfigHandle,
+    FastConfig,
+    InvalidConfigError,
+    MissingRequiredElementError,
+    UnexpectedValueError,
+    fastconfig_dataclass,
+    fc_field,
+)
 from fastconfig.config import _FastConfigBuilder
+from fastconfig.internals.loader import _BACKENDS, _Backend, _FileLoader
+from fastconfig.internals.validator import _SettingIndex
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 @dataclass
@@ -83,6 +110,61 @@ class TestFastConfig(unittest.TestCase):
             _FastConfigBuilder._make(BasicTypes, config.to_dict(use_key=False)), config
         )
 
+    def test_to_dict_nested(self) -> None:
+        @dataclass
+        class Nested(FastConfig):
+            host: str = fc_field(key="db.primary.host", default="localhost")
+            port: int = fc_field(key="db.primary.port", default=5432)
+            replica: str = fc_field(key="db.replica.host", default="replica")
+            name: str = fc_field(key="app/name", separator="/", default="app")
+
+        config = Nested()
+        expected = {
+            "db": {
+                "primary": {"host": "localhost", "port": 5432},
+                "replica": {"host": "replica"},
+            },
+            "app": {"name": "app"},
+        }
+        self.assertEqual(config.to_dict(), expected)
+        self.assertEqual(json.loads(config.to_json()), expected)
+        self.assertEqual(json.loads(config.to_json(indent=2)), expected)
+        self.assertEqual(toml.loads(config.to_toml()), expected)
+
+    def test_to_json_and_toml(self) -> None:
+        config = BasicTypes.build("tests/fixtures/basic_type.toml")
+        # the default of the class is an int
+        config.f = 1.5
+        expected = config.to_dict()
+        expected["section"]["date"]["date"] = "1979-05-27"
+        self.assertEqual(json.loads(config.to_json()), expected)
+        self.assertEqual(
+            json.loads(config.to_json(indent=4)), json.loads(config.to_json())
+        )
+        self.assertEqual(toml.loads(config.to_toml()), config.to_dict())
+
+        # None is left out of TOML documents
+        complex_config = ComplexTypes.build("tests/fixtures/complex_type.toml")
+        self.assertNotIn("optional_int", complex_config.to_toml())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for path in (Path(tmp) / "config.json", Path(tmp) / "config.toml"):
+                if path.suffix == ".json":
+                    config.to_json(path)
+                    complex_config.to_json(path.with_name("complex.json"))
+                else:
+                    config.to_toml(str(path))
+                    complex_config.to_toml(path.with_name("complex.toml"))
+                self.assertEqual(BasicTypes.build(path), config)
+                self.assertEqual(
+                    ComplexTypes.build(path.with_name(f"complex{path.suffix}")),
+                    complex_config,
+                )
+
+        stream = io.StringIO()
+        config.to_json(stream, indent=2)
+        self.assertEqual(stream.getvalue(), config.to_json(indent=2))
+
     def test_toml_build(self) -> None:
         # basic types
         basic_config: BasicTypes = BasicTypes.build("tests/fixtures/basic_type.toml")
@@ -227,5 +309,679 @@ class TestFastConfig(unittest.TestCase):
         )
 
 
+@dataclass
+class Required(FastConfig):
+    flag: bool
+    d: str = fc_field(key="str")
+
+
+class TestSettingIndex(unittest.TestCase):
+    def test_shared(self) -> None:
+        setting = {
+            "flag": True,
+            "str": "value",
+            "section": {"int": 1, "list": {"value": [1, 2]}, "optional_int": 3},
+        }
+        index = _SettingIndex(setting)
+        basic = _FastConfigBuilder._make(BasicTypes, setting, index=index)
+        complex = _FastConfigBuilder._make(ComplexTypes, setting, index=index)
+        self.assertEqual(basic, _FastConfigBuilder._make(BasicTypes, setting))
+        self.assertEqual(complex, _FastConfigBuilder._make(ComplexTypes, setting))
+        self.assertEqual((basic.c, basic.e, complex.c), (1, [1, 2], 3))
+        self.assertIs(index.values[("section", "int")], 1)
+
+        updated = _FastConfigBuilder._update(BasicTypes(), setting, index=index)
+        self.assertEqual(updated, basic)
+
+
+class TestBuildMany(unittest.TestCase):
+    paths = [
+        "tests/fixtures/basic_type.toml",
+        "tests/fixtures/complex_type.json",
+        "not_exist.toml",
+        "tests/fixtures/internals/invalid.toml",
+        "tests/fixtures/basic_type.json",
+    ]
+
+    def check(self, results: list[Any]) -> None:
+        self.assertEqual([r.path for r in results], self.paths)
+        self.assertEqual([r.ok for r in results], [True, False, False, False, True])
+        self.assertEqual(results[0].config, Required(flag=True, d="str"))
+        self.assertEqual(results[4].config, Required(flag=True, d="str"))
+        self.assertIsInstance(results[1].error, MissingRequiredElementError)
+        self.assertIsInstance(results[2].error, FileNotFoundError)
+        self.assertIsInstance(results[3].error, InvalidConfigError)
+        self.assertIsNone(results[1].config)
+
+    def test_build_many(self) -> None:
+        for executor in ("process", "thread"):
+            self.check(
+                list(
+                    Required.build_many(
+                        self.paths, workers=2, executor=executor, chunksize=2
+                    )
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = Required.build_many(
+                self.paths, executor=executor, ordered=False, chunksize=1
+            )
+            self.check(sorted(results, key=lambda r: self.paths.index(r.path)))
+
+        self.assertEqual(list(Required.build_many([])), [])
+        with self.assertRaises(ValueError):
+            Required.build_many(self.paths, executor="fiber")
+        with self.assertRaises(ValueError):
+            Required.build_many(self.paths, workers=0)
+
+    def test_pool_not_iterated(self) -> None:
+        # the pool is created by the iterator, so an unused result holds no workers
+        with mock.patch("concurrent.futures.ProcessPoolExecutor") as pool:
+            results = Required.build_many(self.paths, workers=2)
+            pool.assert_not_called()
+            del results
+            pool.assert_not_called()
+
+
+class TestBuildLayered(unittest.TestCase):
+    def test_build_layered(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            user = Path(tmp) / "user.json"
+            user.write_text(
+                '{"str": "user", "table": {"second": "user"}, "section": {"list": {"value": [4]}}}'
+            )
+            local = Path(tmp) / "local.toml"
+            paths = ["tests/fixtures/basic_type.toml", user, local]
+
+            with self.assertRaises(FileNotFoundError):
+                BasicTypes.build_layered(paths)
+
+            for parallel in (True, False):
+                config = BasicTypes.build_layered(
+                    paths, missing_ok=True, parallel=parallel
+                )
+                self.assertEqual(
+                    config,
+                    BasicTypes(
+                        a={"first": "1", "second": "user"},
+                        b=True,
+                        c=42,
+                        d="user",
+                        e=[4],
+                        f=0,
+                        g=date(1979, 5, 27),
+                    ),
+                )
+                self.assertEqual(
+                    config.field_sources(),
+                    {
+                        "a": user,
+                        "b": Path("tests/fixtures/basic_type.toml"),
+                        "c": Path("tests/fixtures/basic_type.toml"),
+                        "d": user,
+                        "e": user,
+                        "f": None,
+                        "g": Path("tests/fixtures/basic_type.toml"),
+                    },
+                )
+
+            # update
+            local.write_text("f = 1.5")
+            updated = BasicTypes.build_layered([local], config)
+            self.assertIs(updated, config)
+            self.assertEqual(config.f, 1.5)
+            self.assertEqual(config.field_sources()["f"], local)
+            self.assertEqual(config.field_sources()["d"], user)
+
+        self.assertEqual(BasicTypes().field_sources(), {})
+
+
+class TestLazyBuild(unittest.TestCase):
+    def test_lazy_build(self) -> None:
+        config = BasicTypes.build("tests/fixtures/basic_type.toml", lazy=True)
+        self.assertNotIn("c", vars(config))
+        self.assertEqual(config.c, 42)
+        self.assertIn("c", vars(config))
+        self.assertEqual(config.f, 0)
+        self.assertEqual(config, BasicTypes.build("tests/fixtures/basic_type.toml"))
+        self.assertEqual(
+            config.to_dict(),
+            BasicTypes.build("tests/fixtures/basic_type.toml").to_dict(),
+        )
+
+        # the defaults of the class are not changed
+        self.assertEqual(BasicTypes.d, "default")
+        self.assertEqual(BasicTypes().d, "default")
+
+        with self.assertRaises(AttributeError):
+            config.not_a_field  # type: ignore
+
+    def test_lazy_errors(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text('{"str": 1, "section": {"int": 42}}')
+
+            config = BasicTypes.build(path, lazy=True)
+            self.assertEqual(config.c, 42)
+            with self.assertRaises(UnexpectedValueError):
+                config.d
+            with self.assertRaises(UnexpectedValueError):
+                config.validate()
+
+            required = Required.build(path, lazy=True)
+            with self.assertRaises(MissingRequiredElementError):
+                required.flag
+            with self.assertRaises(MissingRequiredElementError):
+                required.validate()
+
+            # updating replaces the fields found in the file
+            path.write_text('{"str": "updated"}')
+            BasicTypes.build(path, config)
+            self.assertEqual(config.d, "updated")
+            config.validate()
+            self.assertEqual(config.b, False)
+
+        # non-lazy instances are already validated
+        BasicTypes().validate()
+
+
+class TestPartialBuild(unittest.TestCase):
+    def test_partial_build(self) -> None:
+        for path in (
+            "tests/fixtures/basic_type.json",
+            "tests/fixtures/complex_type.json",
+        ):
+            for klass in (BasicTypes, ComplexTypes):
+                self.assertEqual(
+                    klass.build(path, partial=True), klass.build(path)  # type: ignore
+                )
+        # other formats are read as a whole
+        self.assertEqual(
+            BasicTypes.build("tests/fixtures/basic_type.toml", partial=True),
+            BasicTypes.build("tests/fixtures/basic_type.toml"),
+        )
+
+    def test_partial_skips_unused_keys(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text(
+                '{"unused": {"big": [1, 2, 3]}, "section": {"int": 42, "list": []}}'
+            )
+            parsed: list[bytes] = []
+
+            def parse(data: bytes) -> Any:
+                parsed.append(data)
+                return json.loads(data)
+
+            with mock.patch.dict(_BACKENDS, {".json": _Backend("recording", parse)}):
+                config = BasicTypes.build(path, partial=True)
+            self.assertEqual(config.c, 42)
+            self.assertEqual(parsed, [b"42"])
+
+            path.write_text('{"section": {"int": "42"}}')
+            with self.assertRaises(UnexpectedValueError):
+                BasicTypes.build(path, partial=True)
+            path.write_text('{"section": {"int": 42,}}')
+            with self.assertRaises(InvalidConfigError):
+                BasicTypes.build(path, partial=True)
+            path.write_text("")
+            with self.assertRaises(InvalidConfigError):
+                BasicTypes.build(path, partial=True)
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "config.json"
+        self.path.write_text('{"str": "first", "section": {"int": 42}}')
+        self.snapshots = Path(self.tmp.name) / "snapshots"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def build(self) -> BasicTypes:
+        return BasicTypes.build(self.path, snapshot_dir=self.snapshots)
+
+    def test_snapshot(self) -> None:
+        config = self.build()
+        self.assertEqual(config, BasicTypes.build(self.path))
+        self.assertEqual(len(list(self.snapshots.glob("*.snapshot"))), 1)
+        if os.name == "posix":
+            # not readable or writable by other users
+            self.assertEqual(self.snapshots.stat().st_mode & 0o777, 0o700)
+
+        # loaded without parsing or type checking
+        with mock.patch.object(_FileLoader, "loads") as loads:
+            self.assertEqual(self.build(), config)
+        loads.assert_not_called()
+
+        # defaults are created on every build
+        self.assertIsNot(self.build().a, self.build().a)
+
+        # a modified file gets another snapshot
+        self.path.write_text('{"str": "second"}')
+        self.assertEqual(self.build().d, "second")
+        self.assertEqual(len(list(self.snapshots.glob("*.snapshot"))), 2)
+
+    def test_invalid_snapshot(self) -> None:
+        config = self.build()
+        (snapshot,) = self.snapshots.glob("*.snapshot")
+        snapshot.write_bytes(b"truncated")
+        self.assertEqual(self.build(), config)
+        self.assertEqual(self.build(), config)
+        self.assertNotEqual(snapshot.read_bytes(), b"truncated")
+
+        # nothing is written for an invalid file
+        self.path.write_text('{"str": 1}')
+        with self.assertRaises(UnexpectedValueError):
+            self.build()
+        self.assertEqual(len(list(self.snapshots.glob("*"))), 1)
+
+    def test_schema(self) -> None:
+        @dataclass
+        class Changed(FastConfig):
+            d: int = fc_field(key="str", default=0)
+
+        # same qualified name and content, but the field accepts other values
+        Changed.__qualname__ = BasicTypes.__qualname__
+        self.assertEqual(self.build().d, "first")
+        with self.assertRaises(UnexpectedValueError):
+            Changed.build(self.path, snapshot_dir=self.snapshots)
+
+
+class TestEnvOverlay(unittest.TestCase):
+    path = "tests/fixtures/basic_type.toml"
+
+    def test_env_prefix(self) -> None:
+        environ = {
+            "APP_SECTION__INT": "7",
+            "APP_FLAG": "false",
+            "APP_STR": "from env",
+            "APP_SECTION__LIST__VALUE": "[4, 5]",
+            "APP_F": "2",
+            "APP_SECTION__DATE__DATE": "2023-01-02T03:04:05",
+            "OTHER_STR": "ignored",
+        }
+        with mock.patch.dict("os.environ", environ):
+            config = BasicTypes.build(self.path, env_prefix="APP_")
+            self.assertEqual(
+                (config.b, config.c, config.d, config.e, config.f, config.g),
+                (False, 7, "from env", [4, 5], 2.0, date(2023, 1, 2)),
+            )
+            # the rest of the file is kept
+            self.assertEqual(config.a, {"first": "1", "second": "2"})
+
+            updated = BasicTypes()
+            BasicTypes.build(self.path, updated, env_prefix="app_")
+            self.assertEqual(updated, config)
+
+            lazy = BasicTypes.build(self.path, lazy=True, env_prefix="APP_")
+            self.assertEqual((lazy.c, lazy.a), (7, config.a))
+
+        self.assertEqual(BasicTypes.build(self.path, env_prefix="APP_").c, 42)
+
+    def test_required_from_env(self) -> None:
+        @dataclass
+        class Required(FastConfig):
+            host: str = fc_field(key="db.primary.host")
+            port: int = fc_field(key="db.primary.port", default=5432)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text('{"db": {"primary": {"port": 5433}}}')
+            snapshots = Path(tmp) / "snapshots"
+            with mock.patch.dict("os.environ", {"APP_DB__PRIMARY__HOST": "db"}):
+                for _ in range(2):
+                    self.assertEqual(
+                        Required.build(path, snapshot_dir=snapshots, env_prefix="APP_"),
+                        Required("db", 5433),
+                    )
+            with self.assertRaises(MissingRequiredElementError):
+                Required.build(path, snapshot_dir=snapshots, env_prefix="APP_")
+
+    def test_invalid_value(self) -> None:
+        with mock.patch.dict("os.environ", {"APP_SECTION__INT": "seven"}):
+            with self.assertRaisesRegex(UnexpectedValueError, "APP_SECTION__INT"):
+                BasicTypes.build(self.path, env_prefix="APP_")
+
+
+@dataclass
+class Database:
+    host: str
+    port: int = 5432
+
+
+@dataclass
+class Cache(FastConfig):
+    size: int = fc_field(key="limits.size", default=0)
+    expires: Optional[date] = None
+
+
+@dataclass
+class Nested(FastConfig):
+    primary: Database = fc_field(key="db.primary")
+    replicas: list[Database] = fc_field(key="db.replicas", default_factory=list)
+    cache: Optional[Cache] = None
+    name: str = ""
+
+
+class TestNestedSections(unittest.TestCase):
+    document = {
+        "db": {
+            "primary": {"host": "primary", "port": 5433},
+            "replicas": [{"host": "replica"}],
+        },
+        "cache": {"limits": {"size": 10}, "expires": "2023-01-02"},
+        "name": "app",
+    }
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "config.json"
+        self.path.write_text(json.dumps(self.document))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_build(self) -> None:
+        config = Nested.build(self.path)
+        self.assertEqual(
+            config,
+            Nested(
+                Database("primary", 5433),
+                [Database("replica")],
+                Cache(10, date(2023, 1, 2)),
+                "app",
+            ),
+        )
+        self.assertEqual(Nested.build(self.path, lazy=True).primary, config.primary)
+        self.assertEqual(Nested.build(self.path, partial=True), config)
+
+        self.path.write_text('{"db": {"primary": {"port": 1}}}')
+        with self.assertRaises(MissingRequiredElementError):
+            Nested.build(self.path)
+        self.path.write_text('{"db": {"primary": "localhost"}}')
+        with self.assertRaises(UnexpectedValueError):
+            Nested.build(self.path)
+
+    def test_update(self) -> None:
+        config = Nested.build(self.path)
+        # nothing is attached to the sections
+        self.assertEqual(vars(config.primary), {"host": "primary", "port": 5433})
+
+        # an update builds every section from the file again, like other fields
+        config.primary.port = 99
+        Nested.build(self.path, config)
+        self.assertEqual(config.primary, Database("primary", 5433))
+
+        # with the previous setting, the sections of unchanged tables are kept
+        handle = ConfigHandle(self.path, Nested)
+        primary, replicas = handle.current.primary, handle.current.replicas
+        document = json.loads(json.dumps(self.document))
+        document["cache"]["limits"]["size"] = 20
+        document["name"] = "updated"
+        self.path.write_text(json.dumps(document))
+        self.assertEqual(handle.reload(), {"cache", "name"})
+        self.assertIs(handle.current.primary, primary)
+        self.assertIs(handle.current.replicas, replicas)
+        self.assertEqual(handle.current.cache.size, 20)  # type: ignore
+
+    def test_serialize(self) -> None:
+        config = Nested.build(self.path)
+        expected = json.loads(json.dumps(self.document))
+        expected["db"]["replicas"][0]["port"] = 5432
+        self.assertEqual(json.loads(config.to_json()), expected)
+        expected["cache"]["expires"] = date(2023, 1, 2)
+        self.assertEqual(config.to_dict(), expected)
+
+        toml_path = self.path.with_suffix(".toml")
+        config.to_toml(toml_path)
+        self.assertEqual(Nested.build(toml_path), config)
+
+    def test_snapshot_schema(self) -> None:
+        snapshots = Path(self.tmp.name) / "snapshots"
+        config = Nested.build(self.path, snapshot_dir=snapshots)
+        self.assertEqual(Nested.build(self.path, snapshot_dir=snapshots), config)
+
+        @dataclass
+        class Database:  # type: ignore
+            host: int
+            port: int = 5432
+
+        @dataclass
+        class Changed(FastConfig):
+            primary: Database = fc_field(key="db.primary")
+
+        # same qualified names and content, but the section accepts other values
+        Changed.__qualname__ = Nested.__qualname__
+        Changed.__module__ = Nested.__module__
+        with self.assertRaises(UnexpectedValueError):
+            Changed.build(self.path, snapshot_dir=snapshots)
+
+
+@fastconfig_dataclass
+class SlottedDatabase:
+    host: str
+    port: int = 5432
+
+
+@fastconfig_dataclass
+class Slotted(FastConfig):
+    c: int = fc_field(key="section.int", default=0)
+    d: str = fc_field(key="str", default="default")
+    e: List[int] = fc_field(key="section.list.value", default_factory=list)
+    db: Optional[SlottedDatabase] = None
+
+
+@fastconfig_dataclass(frozen=True)
+class FrozenSlotted(FastConfig):
+    c: int = fc_field(key="section.int", default=0)
+    d: str = fc_field(key="str", default="default")
+
+
+@fastconfig_dataclass
+class SuperBase(FastConfig):
+    port: int = fc_field(key="section.int", default=0)
+
+    def __post_init__(self) -> None:
+        if self.port < 0:
+            raise ValueError("port must not be negative")
+
+    @classmethod
+    def kind(cls) -> str:
+        return "base"
+
+
+@fastconfig_dataclass
+class SuperChild(SuperBase):
+    name: str = fc_field(key="str", default="")
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+
+    @classmethod
+    def kind(cls) -> str:
+        return "child of " + super().kind()
+
+    @property
+    def label(self) -> str:
+        return f"{self.name}:{super().kind()}"
+
+    @staticmethod
+    def owner() -> type:
+        return __class__  # type: ignore
+
+
+class TestSlotted(unittest.TestCase):
+    path = "tests/fixtures/basic_type.toml"
+
+    def test_build(self) -> None:
+        config = Slotted.build(self.path)
+        self.assertFalse(hasattr(config, "__dict__"))
+        self.assertEqual(config, Slotted(42, "str", [1, 2, 3]))
+        self.assertEqual(
+            config.to_dict(),
+            {
+                "section": {"int": 42, "list": {"value": [1, 2, 3]}},
+                "str": "str",
+                "db": None,
+            },
+        )
+        self.assertEqual(config.to_dict(use_key=True)["c"], 42)
+
+        updated = Slotted()
+        self.assertIs(Slotted.build(self.path, updated), updated)
+        self.assertEqual(updated, config)
+
+        lazy = Slotted.build(self.path, lazy=True)
+        self.assertEqual((lazy.c, lazy.db), (42, None))
+        lazy.validate()
+        self.assertEqual(lazy, config)
+
+        layered = Slotted.build_layered([self.path])
+        self.assertEqual(layered.field_sources()["c"], Path(self.path))
+
+    def test_nested(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text('{"db": {"host": "db"}, "str": "first"}')
+            config = Slotted.build(path)
+            db = config.db
+            self.assertEqual(db, SlottedDatabase("db"))
+            path.write_text('{"db": {"host": "db"}, "str": "second"}')
+            Slotted.build(path, config)
+            self.assertEqual(config.db, db)
+            self.assertEqual(config.d, "second")
+
+    def test_super(self) -> None:
+        # methods refer to the class created with __slots__, not the original one
+        config = SuperChild.build(self.path)
+        self.assertFalse(hasattr(config, "__dict__"))
+        self.assertEqual(SuperChild.kind(), "child of base")
+        self.assertEqual(config.label, "str:base")
+        self.assertIs(SuperChild.owner(), SuperChild)
+        with self.assertRaises(ValueError):
+            SuperChild(port=-1)
+
+    def test_frozen(self) -> None:
+        import pickle
+
+        config = FrozenSlotted.build(self.path)
+        self.assertEqual(config, FrozenSlotted(42, "str"))
+        self.assertEqual(pickle.loads(pickle.dumps(config)), config)
+        with self.assertRaises(AttributeError):
+            config.c = 0  # type: ignore
+        with self.assertRaises(AttributeError):
+            FrozenSlotted.build(self.path, config)
+        self.assertEqual(len({config, FrozenSlotted(42, "str")}), 1)
+        with self.assertRaises(TypeError):
+            fastconfig_dataclass(Slotted)
+
+
+@dataclass
+class Arrays(FastConfig):
+    buckets: array.array = fc_field(key="latency.buckets", as_array="d")
+    counts: array.array = fc_field(
+        key="latency.counts", as_array="q", default_factory=lambda: array.array("q")
+    )
+
+
+class TestArrays(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "config.json"
+        self.path.write_text(
+            '{"latency": {"buckets": [0.5, 1, 2.5], "counts": [1, 2]}}'
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_array(self) -> None:
+        config = Arrays.build(self.path)
+        self.assertEqual(config.buckets, array.array("d", [0.5, 1.0, 2.5]))
+        self.assertEqual(config.counts, array.array("q", [1, 2]))
+        self.assertEqual(
+            json.loads(config.to_json()),
+            {"latency": {"buckets": [0.5, 1.0, 2.5], "counts": [1, 2]}},
+        )
+        self.assertEqual(toml.loads(config.to_toml())["latency"]["counts"], [1, 2])
+
+        self.path.write_text('{"latency": {"buckets": [0.5], "counts": [1.5]}}')
+        with self.assertRaises(UnexpectedValueError):
+            Arrays.build(self.path)
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_ndarray(self) -> None:
+        @dataclass
+        class NumpyArrays(FastConfig):
+            buckets: Any = fc_field(key="latency.buckets", as_array="float32")
+            counts: Any = fc_field(key="latency.counts", as_array="int64")
+
+        handle = ConfigHandle(self.path, NumpyArrays)
+        config = handle.current
+        self.assertEqual(config.buckets.dtype, numpy.float32)
+        self.assertEqual(config.counts.tolist(), [1, 2])
+
+        # arrays compare elementwise
+        self.path.write_text(
+            '{"latency": {"buckets": [0.5, 1, 2.5], "counts": [1, 3]}}'
+        )
+        self.assertEqual(handle.reload(), {"counts"})
+        self.assertIs(handle.current.buckets, config.buckets)
+        self.assertEqual(
+            json.loads(handle.current.to_json())["latency"]["counts"], [1, 3]
+        )
+
+
+class TestAsyncBuild(unittest.IsolatedAsyncioTestCase):
+    async def test_abuild(self) -> None:
+        read = _FileLoader.read
+
+        def slow_read(self: _FileLoader, path: str) -> bytes:
+            time.sleep(0.3)
+            return read(self, path)
+
+        ticks: int = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        with mock.patch.object(_FileLoader, "read", slow_read):
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                started = time.perf_counter()
+                configs = await asyncio.gather(
+                    BasicTypes.abuild("tests/fixtures/basic_type.json"),
+                    ComplexTypes.abuild(
+                        "tests/fixtures/complex_type.json", executor=executor
+                    ),
+                    BasicTypes.abuild(
+                        "tests/fixtures/basic_type.json",
+                        BasicTypes(),
+                        executor=executor,
+                    ),
+                )
+                elapsed = time.perf_counter() - started
+        task.cancel()
+
+        # the event loop kept running while the files were read
+        self.assertGreater(ticks, 10)
+        # the files were read concurrently
+        self.assertLess(elapsed, 0.8)
+        self.assertEqual(configs[0], BasicTypes.build("tests/fixtures/basic_type.json"))
+        self.assertEqual(configs[0], configs[2])
+        self.assertEqual(
+            configs[1], ComplexTypes.build("tests/fixtures/complex_type.json")
+        )
+
+        with self.assertRaises(FileNotFoundError):
+            await BasicTypes.abuild("not_exist.json")
+
+
 if __name__ == "__main__":
     unittest.main()
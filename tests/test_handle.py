@@ -0,0 +1,120 @@
+import tempfile
+import threading
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from fastconfig import (
+    ConfigHandle,
+    FastConfig,
+    UnexpectedValueError,
+    fastconfig_dataclass,
+    fc_field,
+)
+
+
+@dataclass
+class Handled(FastConfig):
+    name: str = fc_field(key="app.name", default="default")
+    hosts: list[str] = fc_field(key="app.hosts", default_factory=list)
+    port: int = fc_field(key="app.port", default=0)
+
+
+@fastconfig_dataclass(frozen=True)
+class FrozenHandled(FastConfig):
+    name: str = fc_field(key="app.name", default="default")
+    port: int = fc_field(key="app.port", default=0)
+
+
+@dataclass
+class ArrayHandled(FastConfig):
+    values: list[float] = fc_field(
+        key="values", default_factory=list, as_array="float64"
+    )
+
+
+class TestConfigHandle(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "config.json"
+        self.path.write_text('{"app": {"name": "first", "hosts": ["a"], "port": 80}}')
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_reload(self) -> None:
+        handle = ConfigHandle(self.path, Handled)
+        first = handle.current
+        self.assertEqual(first, Handled("first", ["a"], 80))
+
+        # not modified
+        self.assertEqual(handle.reload(), set())
+        self.assertIs(handle.current, first)
+
+        self.path.write_text('{"app": {"name": "first", "hosts": ["a"], "port": 8080}}')
+        self.assertEqual(handle.reload(), {"port"})
+        self.assertEqual(handle.current, Handled("first", ["a"], 8080))
+        # the previous instance is kept as it was, and shares the unchanged values
+        self.assertEqual(first, Handled("first", ["a"], 80))
+        self.assertIs(handle.current.hosts, first.hosts)
+
+        # missing values are kept, invalid files keep the current instance
+        self.path.write_text('{"app": {"name": "second"}}')
+        self.assertEqual(handle.reload(), {"name"})
+        self.assertEqual(handle.current, Handled("second", ["a"], 8080))
+        current = handle.current
+        self.path.write_text('{"app": {"port": "80"}}')
+        with self.assertRaises(UnexpectedValueError):
+            handle.reload()
+        self.assertIs(handle.current, current)
+
+    def test_instance(self) -> None:
+        config = Handled(port=1)
+        handle = ConfigHandle(self.path, config)
+        self.assertEqual(handle.current, Handled("first", ["a"], 80))
+        self.assertEqual(config, Handled(port=1))
+
+    def test_frozen(self) -> None:
+        handle = ConfigHandle(self.path, FrozenHandled)
+        self.path.write_text('{"app": {"name": "second"}}')
+        self.assertEqual(handle.reload(), {"name"})
+        self.assertEqual(handle.current, FrozenHandled("second", 80))
+
+    def test_readers(self) -> None:
+        # readers see the name and the port of the same file
+        handle = ConfigHandle(self.path, Handled)
+        stop = threading.Event()
+        torn: list[Handled] = []
+
+        def read() -> None:
+            while not stop.is_set():
+                config = handle.current
+                if (config.name == "first") != (config.port == 80):
+                    torn.append(config)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for i in range(50):
+                name, port = ("first", 80) if i % 2 else ("second", 81)
+                self.path.write_text(
+                    f'{{"app": {{"name": "{name}", "port": {port}, "pad": {i}}}}}'
+                )
+                handle.reload()
+        finally:
+            stop.set()
+            reader.join()
+        self.assertEqual(torn, [])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_array_length(self) -> None:
+        self.path.write_text('{"values": [1, 2]}')
+        handle = ConfigHandle(self.path, ArrayHandled)
+        self.path.write_text('{"values": [1, 2, 3]}')
+        self.assertEqual(handle.reload(), {"values"})
+        self.assertEqual(handle.current.values.tolist(), [1, 2, 3])
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import fastconfig
+
+ROOT: str = os.path.dirname(os.path.dirname(os.path.abspath(fastconfig.__file__)))
+
+
+def imported(statement: str) -> set[str]:
+    """Return the modules imported to run `statement` in a new interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": ROOT},
+    )
+    return {
+        line.split("|")[2].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "cumulative" not in line
+    }
+
+
+class TestImport(unittest.TestCase):
+    def setUp(self) -> None:
+        # the interpreter startup imports modules too
+        self.startup = imported("pass")
+
+    def check(self, statement: str, unexpected: set[str]) -> None:
+        # the import times are measured by benchmarks/bench_import.py
+        modules = imported(statement) - self.startup
+        self.assertFalse(modules & unexpected, statement)
+
+    def test_import(self) -> None:
+        parsers = {"json", "orjson", "rtoml", "toml", "tomli", "tomllib"}
+        heavy = {"asyncio", "concurrent.futures", "pickle"}
+        self.check(
+            "import fastconfig",
+            parsers | heavy | {"typing", "fastconfig.config"},
+        )
+        self.check(
+            "from fastconfig import find_project_root, search",
+            parsers | heavy | {"fastconfig.internals.type_checker"},
+        )
+        self.check("from fastconfig import FastConfig", parsers | heavy)
+
+        with self.assertRaises(AttributeError):
+            fastconfig.not_a_name  # type: ignore
+        self.assertIn("FastConfig", dir(fastconfig))
+        self.assertFalse(hasattr(fastconfig, "TYPE_CHECKING"))
+        self.assertEqual(sorted(fastconfig.__all__), sorted(fastconfig._MODULES))
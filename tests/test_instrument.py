@@ -0,0 +1,159 @@
+import tempfile
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from fastconfig import (
+    BuildStats,
+    FastConfig,
+    OpenTelemetryObserver,
+    UnexpectedValueError,
+    add_build_observer,
+    disable_parse_cache,
+    enable_parse_cache,
+    fc_field,
+    record_builds,
+    remove_build_observer,
+)
+from fastconfig.internals.stats import _OBSERVERS
+
+
+@dataclass
+class Observed(FastConfig):
+    name: str = fc_field(key="service.name", default="")
+    ports: list[int] = fc_field(key="service.ports", default_factory=list)
+    debug: bool = False
+
+
+class Span:
+    def __init__(self, name: str, start_time: int, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.start_time = start_time
+        self.attributes = attributes
+        self.events: list[tuple[str, dict[str, Any]]] = []
+        self.exception: Optional[BaseException] = None
+        self.end_time: Optional[int] = None
+
+    def add_event(self, name: str, attributes: dict[str, Any], timestamp: int) -> None:
+        self.events.append((name, attributes))
+
+    def record_exception(self, exception: BaseException, timestamp: int) -> None:
+        self.exception = exception
+
+    def end(self, end_time: int) -> None:
+        self.end_time = end_time
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def start_span(
+        self, name: str, start_time: int, attributes: dict[str, Any]
+    ) -> Span:
+        span = Span(name, start_time, attributes)
+        self.spans.append(span)
+        return span
+
+
+class TestInstrument(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "config.json"
+        self.content = '{"service": {"name": "app", "ports": [80, 443]}}'
+        self.path.write_text(self.content)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+        self.assertEqual(_OBSERVERS, [])
+
+    def test_record_builds(self) -> None:
+        with record_builds() as builds:
+            config = Observed.build(self.path)
+            Observed.build(self.path, config)
+        Observed.build(self.path)
+
+        self.assertEqual(len(builds), 2)
+        stats: BuildStats = builds[0]
+        self.assertEqual((stats.path, stats.config), (str(self.path), Observed))
+        self.assertEqual(
+            set(stats.phases), {"read", "parse", "extract", "check", "construct"}
+        )
+        self.assertEqual(stats.bytes_read, len(self.content))
+        self.assertEqual(stats.fields_checked, 2)
+        self.assertEqual(set(stats.field_times), {"name", "ports", "debug"})
+        self.assertEqual(len(stats.slowest(2)), 2)
+        self.assertGreaterEqual(stats.duration, sum(stats.phases.values()))
+        self.assertIsNone(stats.error)
+
+    def test_phases(self) -> None:
+        enable_parse_cache()
+        try:
+            with record_builds() as builds:
+                Observed.build(self.path)
+                Observed.build(self.path)
+                Observed.build(self.path, partial=True)
+                Observed.build(self.path, snapshot_dir=Path(self.tmp.name) / "s")
+                Observed.build(self.path, snapshot_dir=Path(self.tmp.name) / "s")
+        finally:
+            disable_parse_cache()
+
+        # served by the parse cache
+        self.assertNotIn("read", builds[1].phases)
+        self.assertEqual(builds[1].bytes_read, 0)
+        self.assertEqual(builds[2].bytes_read, len(self.content))
+        self.assertIn("parse", builds[2].phases)
+        self.assertIn("check", builds[3].phases)
+        self.assertEqual(set(builds[4].phases), {"read", "snapshot", "construct"})
+
+    def test_error(self) -> None:
+        observed: list[BuildStats] = []
+        add_build_observer(observed.append)
+        try:
+            self.path.write_text('{"service": {"ports": "80"}}')
+            with self.assertRaises(UnexpectedValueError):
+                Observed.build(self.path)
+        finally:
+            remove_build_observer(observed.append)
+        self.assertIsInstance(observed[0].error, UnexpectedValueError)
+
+    def test_observer_error(self) -> None:
+        def failing(stats: BuildStats) -> None:
+            raise RuntimeError("observer")
+
+        observed: list[BuildStats] = []
+        add_build_observer(failing)
+        add_build_observer(observed.append)
+        try:
+            with self.assertLogs("fastconfig", "ERROR"):
+                self.assertEqual(Observed.build(self.path).name, "app")
+            # the error of the build is kept
+            self.path.write_text('{"service": {"ports": "80"}}')
+            with self.assertLogs("fastconfig", "ERROR"):
+                with self.assertRaises(UnexpectedValueError):
+                    Observed.build(self.path)
+        finally:
+            remove_build_observer(failing)
+            remove_build_observer(observed.append)
+        # the other observers are still called
+        self.assertEqual(len(observed), 2)
+
+    def test_open_telemetry(self) -> None:
+        tracer = Tracer()
+        observer = OpenTelemetryObserver(tracer, slowest=1)
+        add_build_observer(observer)
+        try:
+            Observed.build(self.path)
+        finally:
+            remove_build_observer(observer)
+
+        (span,) = tracer.spans
+        self.assertEqual(span.name, "fastconfig.build")
+        self.assertEqual(span.attributes["fastconfig.config"], "Observed")
+        self.assertEqual(span.attributes["fastconfig.fields_checked"], 2)
+        names = [name for name, _ in span.events]
+        self.assertIn("fastconfig.parse", names)
+        self.assertEqual(names.count("fastconfig.field"), 1)
+        self.assertGreaterEqual(span.end_time, span.start_time)  # type: ignore
+        self.assertIsNone(span.exception)
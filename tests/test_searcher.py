@@ -1,7 +1,20 @@
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from fastconfig import find_project_root, is_project_root, search
+from fastconfig import (
+    afind_project_root,
+    asearch,
+    clear_search_cache,
+    disable_search_cache,
+    enable_search_cache,
+    find_project_root,
+    is_project_root,
+    search,
+    search_all,
+    search_any,
+)
 
 
 class TestSearch(unittest.TestCase):
@@ -74,3 +87,143 @@ class TestSearch(unittest.TestCase):
 
         # None
         self.assertIsNotNone(find_project_root())
+
+    def test_above_the_project_root(self) -> None:
+        # `search` has always looked above the project root, unlike `search_any`
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "root"
+            start = root / "a"
+            start.mkdir(parents=True)
+            (root / ".git").mkdir()
+            (Path(tmp) / "app.toml").touch()
+            self.assertEqual(search("app.toml", start), Path(tmp) / "app.toml")
+
+
+class TestSearchMany(unittest.TestCase):
+    def test_search_many(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "root"
+            start = root / "a" / "b" / "c"
+            start.mkdir(parents=True)
+            (root / ".git").mkdir()
+            (root / "app.json").touch()
+            (root / "a" / "app.toml").touch()
+            (Path(tmp) / ".app.toml").touch()
+            names = ["app.toml", "app.json", ".app.toml"]
+
+            self.assertEqual(search_any(names, start), root / "a" / "app.toml")
+            self.assertEqual(
+                search_any(["app.json", "app.toml"], start), root / "app.json"
+            )
+            self.assertEqual(
+                search_all(names, start), [root / "a" / "app.toml", root / "app.json"]
+            )
+            self.assertEqual(
+                search_all(names, start, end_up_the_project_root=False),
+                [root / "a" / "app.toml", root / "app.json", Path(tmp) / ".app.toml"],
+            )
+            self.assertIsNone(search_any([".app.toml"], start))
+            self.assertEqual(
+                search_any([".app.toml", "app.json"], str(start)), root / "app.json"
+            )
+            self.assertEqual(search_all([], start), [])
+
+        self.assertEqual(
+            search_any(["README.txt", "README.md"], "tests/"), Path("README.md")
+        )
+        self.assertIsNotNone(search_any([".git/"]))
+        self.assertIsNone(
+            search_any(["README.md"], "./a/b/c/d/e/f/g/h/i/j/k/l/m/n", False)
+        )
+
+
+class TestSearchCache(unittest.TestCase):
+    def setUp(self) -> None:
+        enable_search_cache(ttl=0)
+
+    def tearDown(self) -> None:
+        disable_search_cache()
+
+    def test_search_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "root"
+            first = root / "a" / "first"
+            second = root / "a" / "second"
+            first.mkdir(parents=True)
+            second.mkdir()
+
+            self.assertIsNone(find_project_root(first))
+            self.assertIsNone(search("app.toml", first))
+
+            # cached directories are listed again when they change
+            (root / ".git").mkdir()
+            (root / "a" / "app.toml").touch()
+            self.assertEqual(find_project_root(first), root)
+            self.assertEqual(search("app.toml", first), root / "a" / "app.toml")
+            self.assertEqual(search("app.toml", second), root / "a" / "app.toml")
+            self.assertEqual(
+                search_any(["app.json", "app.toml"], second), root / "a" / "app.toml"
+            )
+            self.assertTrue(is_project_root(root))
+
+            (root / "a" / "app.toml").unlink()
+            self.assertIsNone(search("app.toml", second))
+
+            clear_search_cache(root)
+            clear_search_cache()
+            self.assertEqual(find_project_root(second), root)
+
+    def test_ttl(self) -> None:
+        enable_search_cache(ttl=60)
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(search("app.toml", tmp))
+            # used as is until the entry expires or is cleared
+            (Path(tmp) / "app.toml").touch()
+            self.assertIsNone(search("app.toml", tmp))
+            clear_search_cache(tmp)
+            self.assertEqual(search("app.toml", tmp), Path(tmp) / "app.toml")
+
+        self.assertIsNotNone(search(target="README.md", path="tests/"))
+        self.assertIsNotNone(find_project_root("./tests"))
+        self.assertIsNone(search(target="README.txt", path="tests/"))
+
+    def test_threads(self) -> None:
+        enable_search_cache(ttl=0, maxsize=4)
+        with tempfile.TemporaryDirectory() as tmp:
+            directories = [Path(tmp) / str(i) for i in range(16)]
+            for directory in directories:
+                directory.mkdir()
+
+            def run(i: int) -> None:
+                for _ in range(200):
+                    search_any(["app.toml"], directories[i % 16], False)
+                    if i % 4 == 0:
+                        clear_search_cache(tmp)
+
+            with ThreadPoolExecutor(8) as pool:
+                # raises if the entries are changed while another thread iterates them
+                list(pool.map(run, range(32)))
+
+    def test_maxsize(self) -> None:
+        enable_search_cache(ttl=60, maxsize=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            start = Path(tmp) / "a" / "b"
+            start.mkdir(parents=True)
+            self.assertIsNone(search_any(["app.toml"], start, False))
+            # the oldest entries are dropped
+            (start / "app.toml").touch()
+            self.assertEqual(search("app.toml", start), start / "app.toml")
+
+
+class TestAsyncSearch(unittest.IsolatedAsyncioTestCase):
+    async def test_asearch(self) -> None:
+        self.assertEqual(
+            await asearch("README.md", "tests/"), search("README.md", "tests/")
+        )
+        self.assertIsNone(await asearch("README.txt", "tests/"))
+
+    async def test_afind_project_root(self) -> None:
+        self.assertEqual(
+            await afind_project_root("./tests"), find_project_root("./tests")
+        )
+        self.assertIsNone(await afind_project_root("./a/b/c/d/e/f/g/h/i/j/k/j/l/m/n"))
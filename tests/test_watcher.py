@@ -0,0 +1,205 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from fastconfig import FastConfig, Watcher, fastconfig_dataclass, fc_field
+from fastconfig.watcher import _inotify_available
+
+
+@dataclass
+class Watched(FastConfig):
+    name: str = fc_field(key="app.name", default="default")
+    port: int = fc_field(key="app.port", default=0)
+
+
+@fastconfig_dataclass(frozen=True)
+class FrozenWatched(FastConfig):
+    name: str = fc_field(key="app.name", default="default")
+    port: int = fc_field(key="app.port", default=0)
+
+
+@dataclass
+class ArrayWatched(FastConfig):
+    values: list[float] = fc_field(
+        key="app.values", default_factory=list, as_array="float64"
+    )
+
+
+class TestWatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "config.toml"
+        self.path.write_text('[app]\nname = "first"\nport = 80\n')
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write(self, content: str) -> None:
+        # replace the file like editors do
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(content)
+        os.replace(tmp, self.path)
+
+    def test_check(self) -> None:
+        calls: list[set[str]] = []
+        watcher = Watcher(self.path, Watched, lambda c, changed: calls.append(changed))
+        self.assertEqual(watcher.config, Watched("first", 80))
+
+        # not modified
+        self.assertEqual(watcher.check(), set())
+
+        self.write('[app]\nname = "first"\nport = 8080\n')
+        self.assertEqual(watcher.check(), {"port"})
+        self.assertEqual(watcher.config, Watched("first", 8080))
+        self.assertEqual(calls, [{"port"}])
+
+        # broken files keep the current values
+        self.write("[app\n")
+        self.assertEqual(watcher.check(), set())
+        self.assertIsNotNone(watcher.last_error)
+        self.assertEqual(watcher.config, Watched("first", 8080))
+
+    def test_invalid_type(self) -> None:
+        calls: list[set[str]] = []
+        watcher = Watcher(self.path, Watched, lambda c, changed: calls.append(changed))
+
+        # a valid field before an invalid one is not assigned either
+        self.write('[app]\nname = "second"\nport = "x"\n')
+        self.assertEqual(watcher.check(), set())
+        self.assertIsNotNone(watcher.last_error)
+        self.assertEqual(watcher.config, Watched("first", 80))
+        self.assertEqual(calls, [])
+
+        self.write('[app]\nname = "second"\nport = 80\n')
+        self.assertEqual(watcher.check(), {"name"})
+        self.assertIsNone(watcher.last_error)
+        self.assertEqual(watcher.config, Watched("second", 80))
+        self.assertEqual(calls, [{"name"}])
+
+    def test_copy_on_write(self) -> None:
+        config = Watched()
+        watcher = Watcher(self.path, config, copy_on_write=True)
+        self.assertIs(watcher.config, config)
+        self.write('[app]\nname = "first"\nport = 8080\n')
+        self.assertEqual(watcher.check(), {"port"})
+        self.assertEqual(watcher.config, Watched("first", 8080))
+        self.assertEqual(config, Watched("first", 80))
+        self.assertIs(watcher.config.name, config.name)
+
+    def test_frozen(self) -> None:
+        # always reloaded with copy_on_write
+        watcher = Watcher(self.path, FrozenWatched)
+        self.write('[app]\nname = "first"\nport = 8080\n')
+        self.assertEqual(watcher.check(), {"port"})
+        self.assertIsNone(watcher.last_error)
+        self.assertEqual(watcher.config, FrozenWatched("first", 8080))
+
+    def test_callback_error(self) -> None:
+        changed: list[set[str]] = []
+
+        def callback(config: Watched, fields: set[str]) -> None:
+            changed.append(fields)
+            if len(changed) == 1:
+                raise ValueError("callback")
+
+        watcher = Watcher(
+            self.path, Watched, callback, debounce=0.05, poll_interval=0.05
+        ).start()
+        try:
+            self.write('[app]\nname = "second"\nport = 80\n')
+            for _ in range(100):
+                if watcher.last_error is not None:
+                    break
+                threading.Event().wait(0.05)
+            self.assertIsInstance(watcher.last_error, ValueError)
+
+            # the thread keeps watching
+            self.write('[app]\nname = "third"\nport = 80\n')
+            for _ in range(100):
+                if len(changed) == 2:
+                    break
+                threading.Event().wait(0.05)
+            self.assertEqual(watcher.config, Watched("third", 80))
+        finally:
+            watcher.stop()
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_array_length(self) -> None:
+        self.write("[app]\nvalues = [1.0, 2.0]\n")
+        for copy_on_write in (False, True):
+            with self.subTest(copy_on_write=copy_on_write):
+                watcher = Watcher(self.path, ArrayWatched, copy_on_write=copy_on_write)
+                self.write("[app]\nvalues = [1.0, 2.0, 3.0]\n")
+                self.assertEqual(watcher.check(), {"values"})
+                self.assertIsNone(watcher.last_error)
+                self.assertEqual(watcher.config.values.tolist(), [1, 2, 3])
+                self.write("[app]\nvalues = [1.0, 2.0]\n")
+
+    def _test_thread(self, use_inotify: bool) -> None:
+        changed = threading.Event()
+        config = Watched()
+        watcher = Watcher(
+            self.path,
+            config,
+            lambda c, fields: changed.set(),
+            debounce=0.05,
+            poll_interval=0.05,
+            use_inotify=use_inotify,
+        ).start()
+        try:
+            self.assertIs(watcher.config, config)
+            self.assertEqual(config, Watched("first", 80))
+            self.write('[app]\nname = "second"\nport = 80\n')
+            self.assertTrue(changed.wait(5))
+            self.assertEqual(config, Watched("second", 80))
+        finally:
+            watcher.stop()
+
+    def test_polling_thread(self) -> None:
+        self._test_thread(use_inotify=False)
+
+    @unittest.skipUnless(_inotify_available(), "inotify is not available")
+    def test_inotify_thread(self) -> None:
+        self._test_thread(use_inotify=True)
+
+    def test_watch(self) -> None:
+        changes: list[set[str]] = []
+        watcher = Watched.watch(
+            self.path, callback=lambda c, fields: changes.append(fields), debounce=0.05
+        )
+        watcher.stop()
+        self.assertEqual(watcher.config, Watched("first", 80))
+        with self.assertRaises(ValueError):
+            Watched.watch(self.path, mode="process")
+
+
+class TestAsyncWatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_watch(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text('{"app": {"name": "first"}}')
+            changed: asyncio.Queue[set[str]] = asyncio.Queue()
+            watcher = Watched.watch(
+                path,
+                callback=lambda c, fields: changed.put_nowait(fields),
+                debounce=0.05,
+                poll_interval=0.05,
+                mode="asyncio",
+            )
+            try:
+                self.assertIsNotNone(watcher.task)
+                path.write_text('{"app": {"name": "second", "port": 443}}')
+                fields = await asyncio.wait_for(changed.get(), 5)
+                self.assertEqual(fields, {"name", "port"})
+                self.assertEqual(watcher.config, Watched("second", 443))
+            finally:
+                watcher.stop()